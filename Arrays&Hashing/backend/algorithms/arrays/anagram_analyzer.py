@@ -2,10 +2,12 @@
 Anagram Analysis - Valid Anagram and Group Anagrams
 Time Complexity: O(n*m log m), Space Complexity: O(n*m)
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from collections import defaultdict, Counter
+from ..trace import Trace, TracedAnalyzer
+from .anagram_keys import get_key_strategy, group_by_key
 
-class AnagramAnalyzer:
+class AnagramAnalyzer(TracedAnalyzer):
     def is_valid_anagram(self, s: str, t: str) -> bool:
         """
         Check if two strings are valid anagrams
@@ -15,78 +17,102 @@ class AnagramAnalyzer:
         
         return Counter(s) == Counter(t)
     
-    def group_anagrams(self, strs: List[str]) -> List[List[str]]:
+    def group_anagrams(self, strs: List[str], key: str = "sorted") -> List[List[str]]:
         """
-        Group anagrams together using sorted string as key
+        Group anagrams together by canonical key
+        key selects the strategy: "sorted" string, "count" tuple or multiset "hash".
         """
-        groups = defaultdict(list)
-        
-        for s in strs:
-            # Use sorted string as key
-            key = ''.join(sorted(s))
-            groups[key].append(s)
-        
-        return list(groups.values())
+        groups, _ = group_by_key(strs, get_key_strategy(key))
+        return groups
     
-    def get_steps(self, strings: List[str]) -> List[str]:
-        """Generate step-by-step explanation"""
-        steps = []
-        
+    def trace(self, strings: List[str], key: str = "sorted") -> Trace:
+        """
+        Single instrumented run: valid anagram check for two strings,
+        group anagrams otherwise
+        """
         if len(strings) == 2:
-            # Valid anagram analysis
+            trace = Trace("valid_anagram", strings, self)
             s, t = strings[0], strings[1]
-            steps.append(f"Comparing '{s}' and '{t}' for anagram validity")
-            
             if len(s) != len(t):
-                steps.append(f"Length mismatch: {len(s)} != {len(t)} - NOT ANAGRAMS")
-                return steps
-            
+                trace.emit("length_mismatch", lengths=(len(s), len(t)))
+                trace.result = False
+                return trace
+
             count_s = Counter(s)
             count_t = Counter(t)
-            
-            steps.append(f"Character frequency in '{s}': {dict(count_s)}")
-            steps.append(f"Character frequency in '{t}': {dict(count_t)}")
-            
-            if count_s == count_t:
-                steps.append("Frequencies match - VALID ANAGRAMS!")
+            trace.state["counts"] = (count_s, count_t)
+            trace.emit("count", text=s, frequency=count_s)
+            trace.emit("count", text=t, frequency=count_t)
+            trace.result = count_s == count_t
+            return trace
+
+        trace = Trace("group_anagrams", strings, self)
+        strategy = get_key_strategy(key)
+        trace.state["key_strategy"] = strategy.description
+
+        # Keys are computed once; events carry their printable labels
+        groups, keys = group_by_key(strings, strategy)
+        for s, k in zip(strings, keys):
+            trace.emit("group", text=s, key=strategy.label(k))
+
+        trace.result = groups
+        return trace
+
+    def get_steps(self, strings: List[str], key: str = "sorted") -> List[str]:
+        """Generate step-by-step explanation"""
+        return self.trace(strings, key).steps()
+
+    def get_visualization_data(self, strings: List[str], key: str = "sorted") -> Dict[str, Any]:
+        """Generate data for visualization"""
+        return self.trace(strings, key).visualization()
+
+    def iter_steps(self, trace: Trace) -> Iterator[str]:
+        """Render steps from the trace events"""
+        if trace.algorithm == "valid_anagram":
+            # Valid anagram analysis
+            s, t = trace.input[0], trace.input[1]
+            yield f"Comparing '{s}' and '{t}' for anagram validity"
+
+            for event in trace.events:
+                if event["event"] == "length_mismatch":
+                    yield f"Length mismatch: {len(s)} != {len(t)} - NOT ANAGRAMS"
+                    return
+                yield f"Character frequency in '{event['text']}': {dict(event['frequency'])}"
+
+            if trace.result:
+                yield "Frequencies match - VALID ANAGRAMS!"
             else:
-                steps.append("Frequencies don't match - NOT ANAGRAMS")
+                yield "Frequencies don't match - NOT ANAGRAMS"
         else:
             # Group anagrams analysis
-            steps.append("Grouping anagrams by sorted character key")
+            yield f"Grouping anagrams by {trace.state['key_strategy']}"
             groups = defaultdict(list)
-            
-            for i, s in enumerate(strings):
-                key = ''.join(sorted(s))
-                groups[key].append(s)
-                steps.append(f"'{s}' -> key: '{key}' -> group: {groups[key]}")
-            
-            steps.append(f"Final groups: {list(groups.values())}")
-        
-        return steps
-    
-    def get_visualization_data(self, strings: List[str]) -> Dict[str, Any]:
-        """Generate data for visualization"""
-        if len(strings) == 2:
+
+            for event in trace.events:
+                groups[event["key"]].append(event["text"])
+                yield f"'{event['text']}' -> key: '{event['key']}' -> group: {groups[event['key']]}"
+
+            yield f"Final groups: {trace.result}"
+
+    def render_visualization(self, trace: Trace) -> Dict[str, Any]:
+        """Render visualization data from the trace"""
+        if trace.algorithm == "valid_anagram":
             # Character frequency comparison
-            s, t = strings[0], strings[1]
+            s, t = trace.input[0], trace.input[1]
+            count_s, count_t = trace.state.get("counts") or (Counter(s), Counter(t))
             return {
                 "type": "anagram_check",
-                "string1": {"text": s, "frequency": dict(Counter(s))},
-                "string2": {"text": t, "frequency": dict(Counter(t))},
-                "is_anagram": self.is_valid_anagram(s, t)
+                "string1": {"text": s, "frequency": dict(count_s)},
+                "string2": {"text": t, "frequency": dict(count_t)},
+                "is_anagram": trace.result
             }
         else:
             # Anagram groups
-            groups = self.group_anagrams(strings)
-            keys = {}
-            
-            for s in strings:
-                keys[s] = ''.join(sorted(s))
-            
+            keys = {event["text"]: event["key"] for event in trace.events}
+
             return {
                 "type": "anagram_groups",
-                "groups": groups,
+                "groups": trace.result,
                 "keys": keys,
-                "group_count": len(groups)
+                "group_count": len(trace.result)
             }
\ No newline at end of file
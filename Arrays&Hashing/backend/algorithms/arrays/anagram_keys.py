@@ -0,0 +1,112 @@
+"""
+Anagram Keys - Pluggable canonical keys for grouping anagrams
+"sorted" joins the sorted characters (O(m log m) per word); "count" is a
+character-count tuple over a small alphabet; "hash" is a multiset hash (sum of
+random 64-bit values per character) whose rare collisions are resolved by a
+verification pass over each group.
+"""
+import random
+import string
+from collections import Counter, defaultdict
+from typing import List, Dict, Hashable, Iterable, Tuple
+
+HASH_MASK = (1 << 64) - 1
+
+class SortedKey:
+    name = "sorted"
+    description = "sorted character key"
+    verify = False
+
+    def key(self, s: str) -> Hashable:
+        return ''.join(sorted(s))
+
+    def label(self, key: Hashable) -> str:
+        return key
+
+class CountKey:
+    """Character counts over a fixed alphabet; words outside it fall back to the sorted key"""
+    name = "count"
+    description = "character-count key"
+    verify = False
+
+    def __init__(self, alphabet: str = string.ascii_lowercase):
+        self.alphabet = alphabet
+        self._letters = frozenset(alphabet)
+
+    def key(self, s: str) -> Hashable:
+        if self._letters.issuperset(s):
+            return tuple(map(s.count, self.alphabet))
+        return ''.join(sorted(s))
+
+    def label(self, key: Hashable) -> str:
+        if isinstance(key, str):
+            return key
+        return ''.join(f"{c}{n}" for c, n in zip(self.alphabet, key) if n)
+
+class _CharHashes(dict):
+    """Random 64-bit value per character, drawn on first use"""
+
+    def __init__(self, seed: int):
+        super().__init__()
+        self._random = random.Random(seed)
+
+    def __missing__(self, char: str) -> int:
+        value = self[char] = self._random.getrandbits(64)
+        return value
+
+class MultisetHashKey:
+    """Order-independent hash of the character multiset, paired with the length"""
+    name = "hash"
+    description = "multiset hash key"
+    verify = True
+
+    def __init__(self, seed: int = 0x5EED):
+        self._hashes = _CharHashes(seed)
+
+    def key(self, s: str) -> Hashable:
+        return len(s), sum(map(self._hashes.__getitem__, s)) & HASH_MASK
+
+    def label(self, key: Hashable) -> str:
+        return f"{key[1]:016x}"
+
+KEY_STRATEGIES = {
+    "sorted": SortedKey,
+    "count": CountKey,
+    "hash": MultisetHashKey
+}
+
+def get_key_strategy(name: str = "sorted"):
+    """Key strategy instance by name"""
+    if name not in KEY_STRATEGIES:
+        raise ValueError(f"Unknown anagram key strategy '{name}', expected one of {list(KEY_STRATEGIES)}")
+    return KEY_STRATEGIES[name]()
+
+def group_by_key(strs: Iterable[str], strategy) -> Tuple[List[List[str]], List[Hashable]]:
+    """
+    Group strings by the strategy's key, computing each key once
+    Returns the groups in first-seen order and the key of every input string.
+    """
+    groups = defaultdict(list)
+    keys = []
+    key = strategy.key
+    for s in strs:
+        k = key(s)
+        keys.append(k)
+        groups[k].append(s)
+
+    if not strategy.verify:
+        return list(groups.values()), keys
+    return [part for members in groups.values() for part in split_collisions(members)], keys
+
+def split_collisions(members: List[str]) -> List[List[str]]:
+    """Verification pass: split a hash group whose members are not all true anagrams"""
+    if len(members) == 1:
+        return [members]
+    reference = Counter(members[0])
+    if all(Counter(s) == reference for s in members[1:]):
+        return [members]
+
+    parts: Dict[str, List[str]] = defaultdict(list)
+    for s in members:
+        parts[''.join(sorted(s))].append(s)
+    return list(parts.values())
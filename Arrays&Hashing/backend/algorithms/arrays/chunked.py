@@ -0,0 +1,402 @@
+"""
+Out-of-Core Analysis - Chunked streaming versions of the numeric analyzers
+Inputs are read in chunks from memory-mapped binary int64 files or
+newline-delimited text, so files far larger than RAM can be analyzed with
+bounded memory. When the distinct values outgrow the memory budget, they are
+hash-partitioned to temporary files and each partition is solved on its own;
+a partition whose distinct values still exceed the budget is re-partitioned
+on further hash bits, so peak memory stays near the budget at any input size.
+"""
+import heapq
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from collections import Counter
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # values per chunk
+DEFAULT_MEMORY_BUDGET = 4_000_000  # distinct values held in memory before spilling
+MIN_PARTITIONS = 16
+MAX_PARTITIONS = 256  # open partition files per level
+TEXT_READ_HINT = 8 << 20  # bytes of text lines read per chunk
+
+def iter_binary_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Sequence[int]]:
+    """
+    Memory-map a file of raw little-endian int64 values and yield zero-copy
+    memoryview chunks (copied and byte-swapped only on big-endian hosts)
+    """
+    size = os.path.getsize(path)
+    if size % 8:
+        raise ValueError(f"Binary input must hold whole int64 values, got {size} bytes")
+    if size == 0:
+        return
+
+    step = chunk_size * 8
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            for start in range(0, size, step):
+                part = view[start:start + step]
+                chunk = part.cast("q")
+                try:
+                    if sys.byteorder == "little":
+                        yield chunk
+                    else:
+                        swapped = array("q", chunk)
+                        swapped.byteswap()
+                        yield swapped
+                finally:
+                    chunk.release()
+                    part.release()
+        finally:
+            view.release()
+
+def iter_text_chunks(path: str, read_hint: int = TEXT_READ_HINT) -> Iterator[List[int]]:
+    """Yield lists of integers parsed from a newline-delimited text file"""
+    with open(path, "r") as f:
+        while True:
+            lines = f.readlines(read_hint)
+            if not lines:
+                return
+            yield [int(line) for line in lines if line.strip()]
+
+def iter_file_chunks(path: str, fmt: str = "binary", chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Sequence[int]]:
+    """Chunk iterator for a file in "binary" (int64) or "text" format"""
+    if fmt == "binary":
+        return iter_binary_chunks(path, chunk_size)
+    if fmt == "text":
+        return iter_text_chunks(path)
+    raise ValueError(f"Unknown file format '{fmt}', expected 'binary' or 'text'")
+
+def max_values(path: str, fmt: str = "binary") -> int:
+    """Upper bound on the number of values in a file (a text value takes at least two bytes)"""
+    size = os.path.getsize(path)
+    return size // 8 if fmt == "binary" else (size + 1) // 2
+
+class ChunkedAnalyzer:
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                 partitions: Optional[int] = None, tmp_dir: Optional[str] = None):
+        if memory_budget < 1:
+            raise ValueError("memory_budget must be positive")
+        if partitions is not None and (partitions < 2 or partitions & (partitions - 1)):
+            raise ValueError("partitions must be a power of two of at least 2")
+        self.memory_budget = memory_budget
+        self.partitions = partitions
+        self.tmp_dir = tmp_dir
+
+    def fanout(self, size_hint: Optional[int] = None, minimum: int = MIN_PARTITIONS) -> int:
+        """
+        Partitions to split size_hint values into: fixed if configured,
+        otherwise enough for each to fit the budget (a power of two between
+        minimum and MAX_PARTITIONS)
+        """
+        if self.partitions:
+            return self.partitions
+        needed = -(-size_hint // self.memory_budget) if size_hint else minimum
+        return min(MAX_PARTITIONS, max(minimum, 1 << (needed - 1).bit_length()))
+
+    def contains_duplicate(self, chunks: Iterable[Sequence[int]],
+                           size_hint: Optional[int] = None) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Streaming duplicate check with early exit
+        Values go into an in-memory set until it reaches the memory budget;
+        the rest of the stream is then partitioned to disk and every
+        partition is checked independently (equal values share a partition),
+        re-partitioning any whose distinct values exceed the budget.
+        """
+        stats = {"values_read": 0, "chunks": 0, "spilled_partitions": 0, "partition_levels": 0, "early_exit": False}
+        seen = set()
+        chunks = iter(chunks)
+
+        for chunk in chunks:
+            stats["chunks"] += 1
+            for num in chunk:
+                stats["values_read"] += 1
+                if num in seen:
+                    stats["early_exit"] = True
+                    return True, stats
+                seen.add(num)
+            if len(seen) >= self.memory_budget:
+                break
+        else:
+            return False, stats
+
+        # Spill: the in-memory set and the remaining stream are partitioned
+        with _SpillDirectory(self, stats) as spill:
+            partitioner = spill.partitioner(self.fanout(size_hint))
+            partitioner.add(seen)
+            seen = None
+            for chunk in chunks:
+                stats["chunks"] += 1
+                stats["values_read"] += len(chunk)
+                partitioner.add(chunk)
+
+            pending = partitioner.close()
+            while pending:
+                partition = pending.pop()
+                part_seen = set()
+                for block in partition.blocks():
+                    for num in block:
+                        if num in part_seen:
+                            stats["early_exit"] = True
+                            return True, stats
+                        part_seen.add(num)
+                    if len(part_seen) > self.memory_budget:
+                        break
+                else:
+                    partition.remove()
+                    continue
+                part_seen = None
+                pending.extend(spill.split(partition))
+
+        return False, stats
+
+    def top_k_frequent(self, chunks: Iterable[Sequence[int]], k: int,
+                       size_hint: Optional[int] = None) -> Tuple[List[int], Dict[str, Any]]:
+        """
+        Exact top-k by merging per-chunk counts
+        If the merged Counter outgrows the memory budget the stream is
+        partitioned to disk as (value, count) pairs, counted partition by
+        partition (re-partitioning any with too many distinct values), and
+        the per-partition winners are kept in a k-sized heap.
+        """
+        stats = {"values_read": 0, "chunks": 0, "spilled_partitions": 0, "partition_levels": 0, "distinct": 0}
+        counts = Counter()
+        chunks = iter(chunks)
+
+        for chunk in chunks:
+            stats["chunks"] += 1
+            stats["values_read"] += len(chunk)
+            counts.update(chunk)
+            if len(counts) > self.memory_budget:
+                break
+        else:
+            stats["distinct"] = len(counts)
+            return _top_k(counts.items(), k), stats
+
+        # Spill: (value, count) pairs are partitioned, chunks pre-aggregated first
+        best: List[Tuple[int, int]] = []
+        with _SpillDirectory(self, stats, pairs=True) as spill:
+            partitioner = spill.partitioner(self.fanout(size_hint))
+            partitioner.add_counts(counts.items())
+            counts = None
+            for chunk in chunks:
+                stats["chunks"] += 1
+                stats["values_read"] += len(chunk)
+                partitioner.add_counts(Counter(chunk).items())
+
+            pending = partitioner.close()
+            while pending:
+                partition = pending.pop()
+                part_counts = Counter()
+                for block in partition.blocks():
+                    for i in range(0, len(block), 2):
+                        part_counts[block[i]] += block[i + 1]
+                    if len(part_counts) > self.memory_budget:
+                        break
+                else:
+                    partition.remove()
+                    stats["distinct"] += len(part_counts)
+                    _push_top_k(best, k, part_counts.items())
+                    continue
+                part_counts = None
+                pending.extend(spill.split(partition))
+
+        return [num for freq, num in sorted(best, reverse=True)], stats
+
+    def longest_consecutive(self, chunks: Iterable[Sequence[int]]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Longest consecutive run by interval merging
+        Each chunk is reduced to its sorted runs. Run lists are buffered
+        until they outnumber the merged intervals, then merged into them in
+        one sort that walks the already sorted lists (so each merge costs
+        O(buffered runs) amortized); memory is proportional to the number of
+        runs rather than the number of values.
+        """
+        stats = {"values_read": 0, "chunks": 0, "intervals": 0, "merges": 0}
+        intervals: List[Tuple[int, int]] = []
+        buffered: List[Tuple[int, int]] = []
+
+        for chunk in chunks:
+            stats["chunks"] += 1
+            stats["values_read"] += len(chunk)
+            buffered.extend(_runs(chunk))
+            if len(buffered) > len(intervals):
+                intervals = _coalesce(intervals + buffered)
+                buffered = []
+                stats["merges"] += 1
+        if buffered:
+            intervals = _coalesce(intervals + buffered)
+            stats["merges"] += 1
+
+        stats["intervals"] = len(intervals)
+        longest = max((end - start + 1 for start, end in intervals), default=0)
+        return longest, stats
+
+def _top_k(items: Iterable[Tuple[int, int]], k: int) -> List[int]:
+    """Top k values by (frequency, value), descending"""
+    return [num for freq, num in heapq.nlargest(k, ((freq, num) for num, freq in items))]
+
+def _push_top_k(best: List[Tuple[int, int]], k: int, items: Iterable[Tuple[int, int]]) -> None:
+    """Fold (value, count) items into best, a min-heap of the k largest (count, value) pairs"""
+    for num, freq in items:
+        if len(best) < k:
+            heapq.heappush(best, (freq, num))
+        elif (freq, num) > best[0]:
+            heapq.heapreplace(best, (freq, num))
+
+def _runs(chunk: Sequence[int]) -> List[Tuple[int, int]]:
+    """Sorted maximal runs of consecutive values in one chunk"""
+    runs = []
+    for num in sorted(set(chunk)):
+        if runs and num == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], num)
+        else:
+            runs.append((num, num))
+    return runs
+
+def _coalesce(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Sort intervals and coalesce overlapping or adjacent ones
+    The input is a concatenation of sorted lists, which Timsort merges as
+    natural runs rather than sorting from scratch.
+    """
+    intervals.sort()
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+# Values are mixed by a 64-bit bijection before their top hash bits pick a
+# partition; every re-split consumes the next bits, so distinct values always
+# end up apart once all 64 bits are used
+_MIX = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
+# Values read back from a partition file per block
+READ_BLOCK = 1 << 16
+# Values buffered in memory across all partitions of a level before flushing
+BUFFERED_VALUES = 1 << 20
+
+class _SpillDirectory:
+    """Temporary directory of partition files, split level by level"""
+
+    def __init__(self, analyzer: ChunkedAnalyzer, stats: Dict[str, Any], pairs: bool = False):
+        self.analyzer = analyzer
+        self.pairs = pairs
+        self.stats = stats
+        self._dir = tempfile.TemporaryDirectory(prefix="smartpack-", dir=analyzer.tmp_dir)
+        self._files = 0
+
+    def __enter__(self) -> "_SpillDirectory":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._dir.cleanup()
+
+    def partitioner(self, fanout: int, parent: Optional["_Partition"] = None) -> "_Partitioner":
+        level = parent.level + 1 if parent else 0
+        bits_used = parent.bits_used if parent else 0
+        paths = []
+        for _ in range(fanout):
+            paths.append(os.path.join(self._dir.name, f"part-{self._files}.bin"))
+            self._files += 1
+        self.stats["spilled_partitions"] += fanout
+        self.stats["partition_levels"] = max(self.stats["partition_levels"], level + 1)
+        return _Partitioner(paths, level, bits_used, self.pairs)
+
+    def split(self, partition: "_Partition") -> List["_Partition"]:
+        """Re-partition a partition that does not fit the budget on the next hash bits"""
+        # Sized from the partition itself, so small overflowing partitions split narrowly
+        values = os.path.getsize(partition.path) // (16 if self.pairs else 8)
+        partitioner = self.partitioner(self.analyzer.fanout(values, minimum=2), partition)
+        for block in partition.blocks():
+            if self.pairs:
+                partitioner.add_counts(zip(block[::2], block[1::2]))
+            else:
+                partitioner.add(block)
+        partition.remove()
+        return partitioner.close()
+
+class _Partition:
+    """One spilled partition file, read back in bounded blocks"""
+
+    def __init__(self, path: str, level: int, bits_used: int, pairs: bool):
+        self.path = path
+        self.level = level
+        self.bits_used = bits_used
+        self.pairs = pairs
+
+    def blocks(self) -> Iterator[array]:
+        """Yield the partition's values READ_BLOCK at a time ((value, count) pairs stay whole)"""
+        with open(self.path, "rb") as f:
+            while True:
+                data = f.read(READ_BLOCK * 8)
+                if not data:
+                    return
+                block = array("q")
+                block.frombytes(data)
+                yield block
+
+    def remove(self) -> None:
+        os.unlink(self.path)
+
+class _Partitioner:
+    """Hash-partitions int64 values (or (value, count) pairs) of one level into files"""
+
+    def __init__(self, paths: List[str], level: int, bits_used: int, pairs: bool):
+        bits = len(paths).bit_length() - 1
+        self.level = level
+        self.pairs = pairs
+        # Top hash bits consumed once values are in this level's partitions
+        self.bits_used = min(64, bits_used + bits)
+        self._paths = paths
+        self._files = [open(path, "wb") for path in paths]
+        self._buffers = [array("q") for _ in paths]
+        # The next bits below those used by earlier levels (the low bits once fewer remain)
+        self._shift = max(0, 64 - bits_used - bits)
+        self._mask = len(paths) - 1
+        # Per-partition buffer, sized so the whole level holds about BUFFERED_VALUES
+        self._flush_size = max(1024, BUFFERED_VALUES // len(paths))
+
+    def add(self, values: Iterable[int]) -> None:
+        """Append values to their partitions"""
+        buffers, shift, mask, flush_size = self._buffers, self._shift, self._mask, self._flush_size
+        for num in values:
+            i = (((num * _MIX) & _MASK) >> shift) & mask
+            buffers[i].append(num)
+            if len(buffers[i]) >= flush_size:
+                self._flush(i)
+
+    def add_counts(self, items: Iterable[Tuple[int, int]]) -> None:
+        """Append (value, count) pairs, partitioned by value"""
+        buffers, shift, mask, flush_size = self._buffers, self._shift, self._mask, self._flush_size
+        for num, freq in items:
+            i = (((num * _MIX) & _MASK) >> shift) & mask
+            buffers[i].append(num)
+            buffers[i].append(freq)
+            if len(buffers[i]) >= flush_size:
+                self._flush(i)
+
+    def close(self) -> List[_Partition]:
+        """Flush and close every file, returning the non-empty partitions"""
+        partitions = []
+        for i, f in enumerate(self._files):
+            self._flush(i)
+            empty = f.tell() == 0
+            f.close()
+            if empty:
+                os.unlink(self._paths[i])
+            else:
+                partitions.append(_Partition(self._paths[i], self.level, self.bits_used, self.pairs))
+        return partitions
+
+    def _flush(self, i: int) -> None:
+        if self._buffers[i]:
+            self._buffers[i].tofile(self._files[i])
+            self._buffers[i] = array("q")
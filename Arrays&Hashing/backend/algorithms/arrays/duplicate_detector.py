@@ -2,52 +2,116 @@
 Duplicate Detection - Contains Duplicate Algorithm
 Time Complexity: O(n), Space Complexity: O(n)
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Mapping
+from ..trace import Trace, TracedAnalyzer, checkpoint_interval
+from . import vectorized, duplicate_engines
 
-class DuplicateDetector:
-    def contains_duplicate(self, nums: List[int]) -> bool:
+class DuplicateDetector(TracedAnalyzer):
+    def contains_duplicate(self, nums: List[int], frequency: Optional[Mapping[int, int]] = None,
+                           engine: str = "hash", **engine_options: Any) -> bool:
         """
         Check if array contains any duplicates using hash set
+        With an already built frequency map of nums this is a size comparison.
+        engine selects a memory-lean alternative: "bitset" (low/high range),
+        "sort" (in_place) or "bloom" (error_rate); see duplicate_engines.
         """
+        if engine == "bitset":
+            return duplicate_engines.bitset_contains_duplicate(nums, **engine_options)
+        if engine == "sort":
+            return duplicate_engines.sort_contains_duplicate(nums, **engine_options)
+        if engine == "bloom":
+            return duplicate_engines.bloom_contains_duplicate(nums, **engine_options)
+        if engine != "hash":
+            raise ValueError(f"Unknown duplicate engine '{engine}', expected one of {list(duplicate_engines.DUPLICATE_ENGINES)}")
+
+        if frequency is not None:
+            return len(frequency) < len(nums)
+
+        if vectorized.should_vectorize(nums):
+            try:
+                return vectorized.contains_duplicate(nums)
+            except vectorized.Unsupported:
+                pass  # values outside the int64-safe range
+
         seen = set()
-        for num in nums:
+        for num in vectorized.to_ints(nums):
             if num in seen:
                 return True
             seen.add(num)
         return False
-    
+
+    def trace(self, nums: List[int]) -> Trace:
+        """
+        Single instrumented pass: hash set scan up to the first duplicate,
+        while collecting first indices and, for duplicated values only, every
+        position for the visualization
+        """
+        trace = Trace("contains_duplicate", nums, self)
+        first = {}
+        positions = {}
+        found = False
+
+        for i, num in enumerate(nums):
+            if num in first:
+                if not found:
+                    trace.emit("duplicate", index=i, value=num)
+                    found = True
+                if num in positions:
+                    positions[num].append(i)
+                else:
+                    positions[num] = [first[num], i]
+            else:
+                if not found:
+                    trace.emit("add", index=i, value=num)
+                first[num] = i
+
+        trace.result = found
+        trace.state["first"] = first
+        trace.state["positions"] = positions
+        return trace
+
     def get_steps(self, nums: List[int]) -> List[str]:
         """Generate step-by-step explanation"""
-        steps = []
-        seen = set()
-        
-        steps.append("Initialize empty hash set to track seen elements")
-        
-        for i, num in enumerate(nums):
-            if num in seen:
-                steps.append(f"Step {i+1}: Found {num} already in set - DUPLICATE FOUND!")
-                return steps
-            seen.add(num)
-            steps.append(f"Step {i+1}: Add {num} to set, current set: {list(seen)}")
-        
-        steps.append("No duplicates found after scanning all elements")
-        return steps
-    
+        return self.trace(nums).steps()
+
     def get_visualization_data(self, nums: List[int]) -> Dict[str, Any]:
         """Generate data for visualization"""
-        frequency = {}
-        positions = {}
-        
-        for i, num in enumerate(nums):
-            if num not in frequency:
-                frequency[num] = 0
-                positions[num] = []
-            frequency[num] += 1
-            positions[num].append(i)
-        
+        return self.trace(nums).visualization()
+
+    def iter_steps(self, trace: Trace) -> Iterator[str]:
+        """
+        Render steps from the trace events
+        Each step only states the element added; the full set is printed at
+        a bounded number of checkpoints so the output stays O(n).
+        """
+        seen = []
+        interval = checkpoint_interval(len(trace.events))
+
+        yield "Initialize empty hash set to track seen elements"
+
+        for event in trace.events:
+            if event["event"] == "duplicate":
+                yield f"Step {event['index']+1}: Found {event['value']} already in set - DUPLICATE FOUND!"
+                return
+            seen.append(event["value"])
+            yield f"Step {event['index']+1}: Add {event['value']} to set (set size: {len(seen)})"
+            if len(seen) % interval == 0:
+                yield f"Checkpoint after step {event['index']+1}: current set: {seen}"
+
+        yield "No duplicates found after scanning all elements"
+
+    def render_visualization(self, trace: Trace) -> Dict[str, Any]:
+        """
+        Render visualization data from the trace state
+        positions lists only the duplicated values; every other value occurs
+        once, at its first index.
+        """
+        positions = trace.state["positions"]
+        frequency = {num: len(positions[num]) if num in positions else 1 for num in trace.state["first"]}
+
         return {
             "frequency": frequency,
             "positions": positions,
-            "has_duplicates": any(count > 1 for count in frequency.values()),
-            "duplicate_elements": [num for num, count in frequency.items() if count > 1]
+            "has_duplicates": trace.result,
+            "duplicate_elements": [num for num in frequency if num in positions]
         }
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""
+Duplicate Engines - Memory-lean Contains Duplicate for very large inputs
+"bitset" marks values of a known integer range in one bit each, "sort"
+sorts (in place when allowed) and compares neighbours with O(1) extra space,
+and "bloom" streams values through a Bloom filter, keeping exact state only
+for the few values the filter flags before confirming them in a second pass.
+All engines stop at the first duplicate they can prove.
+"""
+import math
+import os
+from typing import Optional, Sequence, Tuple
+from . import vectorized
+
+DUPLICATE_ENGINES = ("hash", "bitset", "sort", "bloom")
+DEFAULT_ERROR_RATE = 0.01
+
+# Widest range the bitset engine allocates (bits; the default is 128 MiB)
+MAX_BITSET_BITS = int(os.environ.get("SMARTPACK_BITSET_MAX_BITS", str(2 ** 30)))
+
+MASK64 = (1 << 64) - 1
+
+def bitset_range(nums: Sequence[int], low: Optional[int] = None,
+                 high: Optional[int] = None) -> Tuple[int, int]:
+    """(low, width) of the bitset, taking missing bounds from the data"""
+    if low is None:
+        low = min(nums, default=0)
+    if high is None:
+        high = max(nums, default=low)
+    width = high - low + 1
+    if width < 1:
+        raise ValueError("range high must not be below low")
+    if width > MAX_BITSET_BITS:
+        raise ValueError(f"range of {width} values exceeds the {MAX_BITSET_BITS}-bit bitset limit")
+    return low, width
+
+def bitset_contains_duplicate(nums: Sequence[int], low: Optional[int] = None,
+                              high: Optional[int] = None) -> bool:
+    """One bit per value in [low, high]; raises ValueError for values outside it"""
+    low, width = bitset_range(nums, low, high)
+    if vectorized.should_vectorize(nums):
+        try:
+            return vectorized.bitset_contains_duplicate(nums, low, width)
+        except vectorized.Unsupported:
+            pass  # values outside the int64-safe range
+
+    bits = bytearray((width + 7) >> 3)
+    for num in vectorized.to_ints(nums):
+        offset = num - low
+        if not 0 <= offset < width:
+            raise ValueError(f"value {num} is outside the bitset range")
+        byte, mask = offset >> 3, 1 << (offset & 7)
+        if bits[byte] & mask:
+            return True
+        bits[byte] |= mask
+    return False
+
+def sort_contains_duplicate(nums: Sequence[int], in_place: bool = False) -> bool:
+    """
+    Sort and compare neighbours
+    With in_place the caller's list or array is sorted directly, so no copy
+    is made; otherwise a sorted copy is checked.
+    """
+    if vectorized.should_vectorize(nums):
+        try:
+            return vectorized.sort_contains_duplicate(nums, in_place)
+        except vectorized.Unsupported:
+            pass  # values outside the int64-safe range
+
+    # Arrays are never sorted here: a mapped dataset's buffer is read-only
+    nums = vectorized.to_ints(nums)
+    if in_place and isinstance(nums, list):
+        nums.sort()
+        values = nums
+    else:
+        values = sorted(nums)
+    return any(values[i] == values[i - 1] for i in range(1, len(values)))
+
+def bloom_parameters(n: int, error_rate: float = DEFAULT_ERROR_RATE) -> Tuple[int, int]:
+    """(bits, hashes) for a Bloom filter holding n values at the given false-positive rate"""
+    if not 0 < error_rate < 1:
+        raise ValueError("error_rate must be between 0 and 1")
+    n = max(n, 1)
+    bits = max(8, math.ceil(-n * math.log(error_rate) / math.log(2) ** 2))
+    hashes = max(1, round(bits / n * math.log(2)))
+    return bits, hashes
+
+def mix64(value: int) -> int:
+    """splitmix64 finalizer over the low 64 bits of value"""
+    x = (value + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_ERROR_RATE):
+        self.size, self.hashes = bloom_parameters(capacity, error_rate)
+        self.bits = bytearray((self.size + 7) >> 3)
+
+    def _positions(self, value: int):
+        # Double hashing: h1 + i * h2 over the two halves of one 64-bit hash
+        h = mix64(value)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def check_and_add(self, value: int) -> bool:
+        """Add value, returning whether it may have been present already"""
+        present = True
+        bits = self.bits
+        for position in self._positions(value):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        return present
+
+    def __contains__(self, value: int) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(value))
+
+def bloom_contains_duplicate(nums: Sequence[int], error_rate: float = DEFAULT_ERROR_RATE) -> bool:
+    """
+    Bloom pre-filter with exact confirmation
+    Pass 1 collects the values the filter reports as possibly seen (every
+    true duplicate plus about error_rate * n false positives); a value
+    flagged twice is a proven duplicate. Pass 2 counts only the flagged
+    values to confirm one of them occurs twice.
+    """
+    bits, hashes = bloom_parameters(len(nums), error_rate)
+    if vectorized.should_vectorize(nums):
+        try:
+            return vectorized.bloom_contains_duplicate(nums, bits, hashes)
+        except vectorized.Unsupported:
+            pass  # values outside the int64-safe range
+
+    nums = vectorized.to_ints(nums)
+    bloom = BloomFilter(len(nums), error_rate)
+    candidates = set()
+    for num in nums:
+        if bloom.check_and_add(num):
+            if num in candidates:
+                return True
+            candidates.add(num)
+    if not candidates:
+        return False
+
+    seen = set()
+    for num in nums:
+        if num in candidates:
+            if num in seen:
+                return True
+            seen.add(num)
+    return False
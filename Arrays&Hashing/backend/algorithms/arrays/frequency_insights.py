@@ -2,71 +2,199 @@
 Frequency Analysis - Top K Frequent Elements
 Time Complexity: O(n log k), Space Complexity: O(n + k)
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from collections import Counter
 import heapq
+from ..trace import Trace, TracedAnalyzer
+from . import vectorized
+from .heavy_hitters import SpaceSaving, DEFAULT_CAPACITY
 
-class FrequencyInsights:
-    def top_k_frequent(self, nums: List[int], k: int) -> List[int]:
+# Exact strategies all return values in descending (frequency, value) order
+TOP_K_STRATEGIES = ("heap", "bucket", "nlargest")
+
+class FrequencyInsights(TracedAnalyzer):
+    def top_k_frequent(self, nums: List[int], k: int, frequency: Optional[Counter] = None,
+                       strategy: str = "heap") -> List[int]:
         """
         Find top K frequent elements using heap
+        An already built frequency Counter of nums can be passed in to skip counting.
+        strategy selects the selection step: "heap" (O(u log k)), "bucket"
+        (bucket sort by frequency, O(n + k log k)) or "nlargest".
         """
+        if strategy not in TOP_K_STRATEGIES:
+            raise ValueError(f"Unknown top-k strategy '{strategy}', expected one of {list(TOP_K_STRATEGIES)}")
         if k == 0:
             return []
-        
+
+        if frequency is None and vectorized.should_vectorize(nums):
+            try:
+                return vectorized.top_k_frequent(nums, k)
+            except vectorized.Unsupported:
+                pass  # values outside the int64-safe range
+
         # Count frequencies
-        frequency = Counter(nums)
-        
+        if frequency is None:
+            frequency = Counter(vectorized.to_ints(nums))
+
+        if strategy == "bucket":
+            return self._top_k_buckets(frequency, k)
+        if strategy == "nlargest":
+            return [num for freq, num in heapq.nlargest(k, ((freq, num) for num, freq in frequency.items()))]
+
         # Use min heap to maintain top k elements
         heap = []
-        
+
         for num, freq in frequency.items():
             heapq.heappush(heap, (freq, num))
             if len(heap) > k:
                 heapq.heappop(heap)
-        
-        # Extract elements from heap
-        result = [num for freq, num in heap]
-        return result[::-1]  # Reverse for descending order
-    
-    def get_steps(self, nums: List[int], k: int) -> List[str]:
-        """Generate step-by-step explanation"""
-        steps = []
-        frequency = Counter(nums)
-        
-        steps.append(f"Step 1: Count frequencies - {dict(frequency)}")
-        steps.append(f"Step 2: Find top {k} frequent elements using min-heap")
-        
-        heap = []
+
+        # Extract elements from heap in descending (frequency, value) order
+        return [num for freq, num in sorted(heap, reverse=True)]
+
+    def approximate_top_k(self, nums: Iterable[int], k: int, capacity: int = DEFAULT_CAPACITY) -> Dict[str, Any]:
+        """
+        Streaming top K with bounded memory (Space-Saving)
+        Holds at most capacity counters however many distinct values arrive;
+        each estimate overcounts by at most its error (<= total / capacity).
+        """
+        summary = SpaceSaving(max(capacity, k)).update(vectorized.to_ints(nums))
+        estimates = summary.top_k(k)
+        return {
+            "top_k": [entry["value"] for entry in estimates],
+            "estimates": estimates,
+            "capacity": summary.capacity,
+            "total": summary.total,
+            "max_error": summary.max_error
+        }
+
+    def _top_k_buckets(self, frequency: Counter, k: int, trace: Optional[Trace] = None) -> List[int]:
+        """
+        Bucket values by frequency and walk the buckets from the highest frequency down
+        With a trace, each bucket taken from is recorded.
+        """
+        buckets: List[Optional[List[int]]] = [None] * (max(frequency.values(), default=0) + 1)
         for num, freq in frequency.items():
-            if len(heap) < k:
+            if buckets[freq] is None:
+                buckets[freq] = [num]
+            else:
+                buckets[freq].append(num)
+
+        result = []
+        for freq in range(len(buckets) - 1, 0, -1):
+            bucket = buckets[freq]
+            if bucket is None:
+                continue
+            need = k - len(result)
+            # Ties within a frequency are ordered by value, largest first
+            taken = sorted(bucket, reverse=True) if len(bucket) <= need else heapq.nlargest(need, bucket)
+            result.extend(taken)
+            if trace is not None:
+                trace.emit("take", frequency=freq, values=taken, skipped=len(bucket) - len(taken))
+            if len(result) >= k:
+                break
+        return result
+
+    def trace(self, nums: List[int], k: int, frequency: Optional[Counter] = None,
+              strategy: str = "heap") -> Trace:
+        """
+        Single instrumented run of top_k_frequent with an exact strategy
+        """
+        if strategy not in TOP_K_STRATEGIES:
+            raise ValueError(f"Unknown top-k strategy '{strategy}', expected one of {list(TOP_K_STRATEGIES)}")
+        trace = Trace("top_k_frequent", nums, self)
+        if frequency is None:
+            frequency = Counter(nums)
+        trace.state["frequency"] = frequency
+        trace.state["k"] = k
+        trace.state["strategy"] = strategy
+
+        if strategy == "bucket":
+            trace.result = self._top_k_buckets(frequency, k, trace) if k > 0 else []
+            return trace
+        if strategy == "nlargest":
+            entries = heapq.nlargest(k, ((freq, num) for num, freq in frequency.items())) if k > 0 else []
+            trace.emit("select", entries=entries)
+            trace.result = [num for freq, num in entries]
+            return trace
+
+        heap = []
+        if k > 0:
+            for num, freq in frequency.items():
                 heapq.heappush(heap, (freq, num))
-                steps.append(f"Add ({freq}, {num}) to heap: {heap}")
-            elif freq > heap[0][0]:
-                removed = heapq.heapreplace(heap, (freq, num))
-                steps.append(f"Replace {removed} with ({freq}, {num}): {heap}")
-        
-        result = [num for freq, num in sorted(heap, reverse=True)]
-        steps.append(f"Final result: {result}")
-        
-        return steps
-    
+                if len(heap) > k:
+                    removed = heapq.heappop(heap)
+                    if removed != (freq, num):
+                        trace.emit("replace", entry=(freq, num), removed=removed)
+                else:
+                    trace.emit("push", entry=(freq, num))
+
+        trace.result = [num for freq, num in sorted(heap, reverse=True)]
+        return trace
+
+    def get_steps(self, nums: List[int], k: int) -> List[str]:
+        """Generate step-by-step explanation"""
+        return self.trace(nums, k).steps()
+
     def get_visualization_data(self, nums: List[int], k: int) -> Dict[str, Any]:
         """Generate data for visualization"""
-        frequency = Counter(nums)
-        top_k = self.top_k_frequent(nums, k)
-        
+        return self.trace(nums, k).visualization()
+
+    def iter_steps(self, trace: Trace) -> Iterator[str]:
+        """Render steps by replaying the recorded heap, bucket or selection operations"""
+        k = trace.state["k"]
+        strategy = trace.state.get("strategy", "heap")
+
+        yield f"Step 1: Count frequencies - {dict(trace.state['frequency'])}"
+        if strategy == "bucket":
+            yield f"Step 2: Bucket values by frequency and take {k} from the highest frequency down"
+            result = []
+            for event in trace.events:
+                result.extend(event["values"])
+                skipped = f" ({event['skipped']} smaller tied values left out)" if event["skipped"] else ""
+                yield f"Take {event['values']} from frequency {event['frequency']} bucket{skipped}: {result}"
+            yield f"Final result: {trace.result}"
+            return
+        if strategy == "nlargest":
+            yield f"Step 2: Select the {k} largest (frequency, value) pairs with heapq.nlargest"
+            for event in trace.events:
+                yield f"Selected {event['entries']}"
+            yield f"Final result: {trace.result}"
+            return
+
+        yield f"Step 2: Find top {k} frequent elements using min-heap"
+
+        heap = []
+        for event in trace.events:
+            if event["event"] == "push":
+                heapq.heappush(heap, event["entry"])
+                yield f"Add {event['entry']} to heap: {heap}"
+            else:
+                heapq.heappushpop(heap, event["entry"])
+                yield f"Replace {event['removed']} with {event['entry']}: {heap}"
+
+        yield f"Final result: {trace.result}"
+
+    def render_visualization(self, trace: Trace) -> Dict[str, Any]:
+        """Render visualization data from the trace state"""
+        frequency = trace.state["frequency"]
+        top_k = trace.result
+        top_k_set = set(top_k)
+
         # Prepare chart data
         chart_data = {
             "labels": list(map(str, frequency.keys())),
             "frequencies": list(frequency.values()),
-            "top_k_indices": [i for i, num in enumerate(frequency.keys()) if num in top_k]
+            "top_k_indices": [i for i, num in enumerate(frequency.keys()) if num in top_k_set]
         }
-        
-        return {
+
+        visualization = {
             "frequency_map": dict(frequency),
             "top_k_elements": top_k,
             "chart_data": chart_data,
             "total_unique": len(frequency),
-            "total_elements": len(nums)
-        }
\ No newline at end of file
+            "total_elements": len(trace.input)
+        }
+        if trace.state.get("strategy", "heap") != "heap":
+            visualization["strategy"] = trace.state["strategy"]
+        return visualization
\ No newline at end of file
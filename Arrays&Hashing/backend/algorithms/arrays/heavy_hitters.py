@@ -0,0 +1,78 @@
+"""
+Heavy Hitters - Space-Saving approximate top-k over unbounded streams
+Keeps at most `capacity` counters regardless of the number of distinct
+values. Every estimate overcounts by at most its recorded error, which is at
+most total / capacity, and any value occurring more than total / capacity
+times is guaranteed to be tracked.
+"""
+import heapq
+from typing import Any, Dict, Hashable, Iterable, List
+
+DEFAULT_CAPACITY = 1000
+
+class SpaceSaving:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self.counts: Dict[Hashable, int] = {}
+        self.errors: Dict[Hashable, int] = {}
+        # Min-heap of (count, value) with stale entries skipped lazily
+        self._heap = []
+
+    def add(self, value: Hashable, weight: int = 1) -> None:
+        """Count one occurrence (or weight occurrences) of value"""
+        self.total += weight
+        counts = self.counts
+        if value in counts:
+            counts[value] += weight
+        elif len(counts) < self.capacity:
+            counts[value] = weight
+            self.errors[value] = 0
+        else:
+            # Replace the minimum counter; the newcomer inherits its count as error
+            min_count, evicted = self._pop_min()
+            del counts[evicted]
+            del self.errors[evicted]
+            counts[value] = min_count + weight
+            self.errors[value] = min_count
+
+        heapq.heappush(self._heap, (counts[value], value))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, v) for v, count in counts.items()]
+            heapq.heapify(self._heap)
+
+    def update(self, values: Iterable[Hashable]) -> "SpaceSaving":
+        """Count every value of an iterable"""
+        add = self.add
+        for value in values:
+            add(value)
+        return self
+
+    @property
+    def max_error(self) -> int:
+        """Largest possible overcount of any estimate (0 until the counters fill up)"""
+        return max(self.errors.values(), default=0)
+
+    def top_k(self, k: int) -> List[Dict[str, Any]]:
+        """
+        Estimated top k by (count, value), descending
+        An entry is "guaranteed" when even its lower bound (count - error)
+        beats the estimate of the first value left out.
+        """
+        ranked = heapq.nlargest(k + 1, ((count, value) for value, count in self.counts.items()))
+        cutoff = ranked[k][0] if len(ranked) > k else 0
+        return [{
+            "value": value,
+            "count": count,
+            "error": self.errors[value],
+            "guaranteed": count - self.errors[value] >= cutoff
+        } for count, value in ranked[:k]]
+
+    def _pop_min(self):
+        heap = self._heap
+        while True:
+            count, value = heapq.heappop(heap)
+            if self.counts.get(value) == count:
+                return count, value
@@ -2,27 +2,85 @@
 Pair and Product Calculations - Two Sum and Product of Array Except Self
 Time Complexity: O(n), Space Complexity: O(n) for Two Sum, O(1) for Product
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+from ..trace import Trace, TracedAnalyzer, checkpoint_interval
+from . import vectorized, products, pair_search
 
-class PairCalculator:
+class PairCalculator(TracedAnalyzer):
     def two_sum(self, nums: List[int], target: int) -> Optional[List[int]]:
         """
         Find two numbers that add up to target using hash map
         """
+        if vectorized.should_vectorize(nums):
+            try:
+                return vectorized.two_sum(nums, target)
+            except vectorized.Unsupported:
+                pass  # values outside the int64-safe range
+
         complement_map = {}
         
-        for i, num in enumerate(nums):
+        for i, num in enumerate(vectorized.to_ints(nums)):
             complement = target - num
             if complement in complement_map:
                 return [complement_map[complement], i]
             complement_map[num] = i
         
         return None  # No solution found
+
+    def find_pairs(self, nums: List[int], target: int, mode: str = "all",
+                   limit: int = pair_search.DEFAULT_PAIR_LIMIT) -> Any:
+        """
+        Pair search beyond the first match
+        mode: "all" (index pairs, at most limit, with a truncation flag) or
+        "count" (number of index pairs)
+        """
+        index = pair_search.PairIndex(nums)
+        if mode == "count":
+            return index.count_pairs(target)
+        pairs, truncated = index.all_pairs(target, limit)
+        return {"pairs": pairs, "count": index.count_pairs(target), "truncated": truncated}
+
+    def two_sum_many(self, nums: List[int], targets: List[int]) -> List[Optional[List[int]]]:
+        """Two Sum for many targets, building the value -> indices index once"""
+        return pair_search.PairIndex(nums).multi_target(targets)
+
+    def k_sum(self, nums: List[int], target: int, k: int = 3,
+              limit: int = pair_search.DEFAULT_PAIR_LIMIT) -> Dict[str, Any]:
+        """Distinct value combinations of size k summing to target (sorted two pointers)"""
+        combinations, truncated = pair_search.k_sum(nums, target, k, limit)
+        return {"combinations": combinations, "truncated": truncated}
     
-    def product_except_self(self, nums: List[int]) -> List[int]:
+    def product_except_self(self, nums: List[int], mode: str = "exact",
+                            modulus: int = products.DEFAULT_MODULUS) -> Any:
         """
         Calculate product of array except self without division
+        mode: "exact" (bigints), "mod" (modulo modulus), "log" (float64 log10
+        magnitudes and signs) or "int64" (raises OverflowError past int64)
         """
+        if mode not in products.PRODUCT_MODES:
+            raise ValueError(f"Unknown product mode '{mode}', expected one of {list(products.PRODUCT_MODES)}")
+        if mode == "mod":
+            return products.product_mod(vectorized.to_ints(nums), modulus)
+        if mode == "log":
+            return products.product_log(vectorized.to_ints(nums))
+
+        if vectorized.should_vectorize(nums):
+            try:
+                return vectorized.product_except_self(nums)
+            except vectorized.Unsupported:
+                pass  # values outside the int64-safe range
+
+        nums = vectorized.to_ints(nums)
+        if mode == "int64":
+            return products.product_int64(nums)
+
+        # Zeros decide the answer without any prefix products
+        shortcut = products.zero_shortcut(nums)
+        if shortcut is not None:
+            return shortcut
+        if products.should_parallelize(nums):
+            return products.parallel_product_except_self(nums)
+
         n = len(nums)
         result = [1] * n
         
@@ -38,104 +96,171 @@ class PairCalculator:
         
         return result
     
-    def get_steps(self, nums: List[int], target: int) -> List[str]:
-        """Generate step-by-step explanation for Two Sum"""
-        steps = []
+    def trace(self, nums: List[int], target: int) -> Trace:
+        """
+        Single instrumented run of two_sum
+        """
+        trace = Trace("two_sum", nums, self)
+        trace.state["target"] = target
         complement_map = {}
-        
-        steps.append(f"Target: {target}")
-        steps.append("Initialize empty hash map for complements")
-        
+
         for i, num in enumerate(nums):
             complement = target - num
             if complement in complement_map:
-                steps.append(f"Step {i+1}: Found complement {complement} at index {complement_map[complement]}")
-                steps.append(f"Solution: indices [{complement_map[complement]}, {i}] = [{complement}, {num}]")
-                return steps
-            
+                trace.emit("found", index=i, value=num, complement=complement,
+                           complement_index=complement_map[complement])
+                trace.result = [complement_map[complement], i]
+                return trace
             complement_map[num] = i
-            steps.append(f"Step {i+1}: Add {num} -> index {i} to map")
-            steps.append(f"Current map: {complement_map}")
-        
-        steps.append("No solution found")
-        return steps
-    
+            trace.emit("store", index=i, value=num, complement=complement)
+
+        return trace
+
+    def trace_products(self, nums: List[int]) -> Trace:
+        """
+        Single instrumented run of product_except_self keeping both passes
+        """
+        trace = Trace("product_except_self", nums, self)
+        n = len(nums)
+        left_products = [1] * n
+        right_products = [1] * n
+
+        for i in range(1, n):
+            left_products[i] = left_products[i-1] * nums[i-1]
+
+        for i in range(n-2, -1, -1):
+            right_products[i] = right_products[i+1] * nums[i+1]
+
+        trace.state["left_products"] = left_products
+        trace.state["right_products"] = right_products
+        trace.result = [left_products[i] * right_products[i] for i in range(n)]
+        return trace
+
+    def get_steps(self, nums: List[int], target: int) -> List[str]:
+        """Generate step-by-step explanation for Two Sum"""
+        return self.trace(nums, target).steps()
+
     def get_product_steps(self, nums: List[int]) -> List[str]:
         """Generate step-by-step explanation for Product Except Self"""
-        steps = []
+        return self.trace_products(nums).steps()
+
+    def get_visualization_data(self, nums: List[int], target: int) -> Dict[str, Any]:
+        """Generate data for Two Sum visualization"""
+        return self.trace(nums, target).visualization()
+
+    def get_product_visualization_data(self, nums: List[int]) -> Dict[str, Any]:
+        """Generate data for Product Except Self visualization"""
+        return self.trace_products(nums).visualization()
+
+    def iter_steps(self, trace: Trace) -> Iterator[str]:
+        if trace.algorithm == "product_except_self":
+            return self._iter_product_steps(trace)
+        return self._iter_two_sum_steps(trace)
+
+    def render_visualization(self, trace: Trace) -> Dict[str, Any]:
+        if trace.algorithm == "product_except_self":
+            return self._render_product_visualization(trace)
+        return self._render_two_sum_visualization(trace)
+
+    def _iter_two_sum_steps(self, trace: Trace) -> Iterator[str]:
+        """
+        Render Two Sum steps from the trace events
+        Each step only states the map entry written; the full map is printed
+        at a bounded number of checkpoints so the output stays O(n).
+        """
+        complement_map = {}
+        interval = checkpoint_interval(len(trace.events))
+
+        yield f"Target: {trace.state['target']}"
+        yield "Initialize empty hash map for complements"
+
+        for event in trace.events:
+            i, num = event["index"], event["value"]
+            if event["event"] == "found":
+                j, complement = event["complement_index"], event["complement"]
+                yield f"Step {i+1}: Found complement {complement} at index {j}"
+                yield f"Solution: indices [{j}, {i}] = [{complement}, {num}]"
+                return
+
+            complement_map[num] = i
+            yield f"Step {i+1}: Add {num} -> index {i} to map (map size: {len(complement_map)})"
+            if (i + 1) % interval == 0:
+                yield f"Checkpoint after step {i+1}: current map: {complement_map}"
+
+        yield "No solution found"
+
+    def _iter_product_steps(self, trace: Trace) -> Iterator[str]:
+        """Render Product Except Self steps from the recorded passes"""
+        nums = trace.input
         n = len(nums)
-        result = [1] * n
-        
-        steps.append(f"Input array: {nums}")
-        steps.append(f"Initialize result array: {result}")
-        
+        left_products = trace.state["left_products"]
+        right_products = trace.state["right_products"]
+
+        yield f"Input array: {nums}"
+        yield f"Initialize result array: {[1] * n}"
+
         # Left pass
-        steps.append("\nLeft pass - multiply by elements to the left:")
+        yield "\nLeft pass - multiply by elements to the left:"
         for i in range(1, n):
-            result[i] = result[i-1] * nums[i-1]
-            steps.append(f"result[{i}] = result[{i-1}] * nums[{i-1}] = {result[i-1]} * {nums[i-1]} = {result[i]}")
-        
-        steps.append(f"After left pass: {result}")
-        
+            yield f"result[{i}] = result[{i-1}] * nums[{i-1}] = {left_products[i-1]} * {nums[i-1]} = {left_products[i]}"
+
+        yield f"After left pass: {left_products}"
+
         # Right pass
-        steps.append("\nRight pass - multiply by elements to the right:")
-        right_product = 1
+        yield "\nRight pass - multiply by elements to the right:"
         for i in range(n-1, -1, -1):
-            result[i] *= right_product
-            steps.append(f"result[{i}] *= right_product({right_product}) = {result[i]}")
-            right_product *= nums[i]
-            steps.append(f"Update right_product: {right_product}")
-        
-        steps.append(f"Final result: {result}")
-        return steps
-    
-    def get_visualization_data(self, nums: List[int], target: int) -> Dict[str, Any]:
-        """Generate data for Two Sum visualization"""
-        solution = self.two_sum(nums, target)
+            yield f"result[{i}] *= right_product({right_products[i]}) = {trace.result[i]}"
+            yield f"Update right_product: {right_products[i] * nums[i]}"
+
+        yield f"Final result: {trace.result}"
+
+    def _render_two_sum_visualization(self, trace: Trace) -> Dict[str, Any]:
+        """
+        Render Two Sum visualization data from the trace events
+        search_path entries carry only the map entry they write (map_delta);
+        checkpoints hold the full map state before every interval-th step, so
+        restore_state(search_path, checkpoints, step, "map_delta", "map_state")
+        rebuilds the map at any step.
+        """
         complement_map = {}
         search_path = []
-        
-        for i, num in enumerate(nums):
-            complement = target - num
+        checkpoints = []
+        interval = checkpoint_interval(len(trace.events))
+
+        for step, event in enumerate(trace.events):
+            if step % interval == 0:
+                checkpoints.append({"step": step, "map_state": dict(complement_map)})
+
+            found = event["event"] == "found"
+            delta = {} if found else {event["value"]: event["index"]}
             search_path.append({
-                "index": i,
-                "value": num,
-                "complement": complement,
-                "found": complement in complement_map,
-                "map_state": dict(complement_map)
+                "index": event["index"],
+                "value": event["value"],
+                "complement": event["complement"],
+                "found": found,
+                "map_delta": delta
             })
-            if complement in complement_map:
-                break
-            complement_map[num] = i
-        
+            complement_map.update(delta)
+
         return {
-            "solution": solution,
-            "target": target,
+            "solution": trace.result,
+            "target": trace.state["target"],
             "search_path": search_path,
-            "array": nums
+            "checkpoints": checkpoints,
+            "checkpoint_interval": interval,
+            "array": trace.input
         }
-    
-    def get_product_visualization_data(self, nums: List[int]) -> Dict[str, Any]:
-        """Generate data for Product Except Self visualization"""
-        n = len(nums)
-        left_products = [1] * n
-        right_products = [1] * n
-        
-        # Calculate left products
-        for i in range(1, n):
-            left_products[i] = left_products[i-1] * nums[i-1]
-        
-        # Calculate right products
-        for i in range(n-2, -1, -1):
-            right_products[i] = right_products[i+1] * nums[i+1]
-        
-        final_result = [left_products[i] * right_products[i] for i in range(n)]
-        
+
+    def _render_product_visualization(self, trace: Trace) -> Dict[str, Any]:
+        """Render Product Except Self visualization data from the recorded passes"""
+        left_products = trace.state["left_products"]
+        right_products = trace.state["right_products"]
+
         return {
-            "input": nums,
+            "input": trace.input,
             "left_products": left_products,
             "right_products": right_products,
-            "final_result": final_result,
+            "final_result": trace.result,
             "steps": {
                 "left_pass": list(enumerate(left_products)),
                 "right_pass": list(enumerate(right_products))
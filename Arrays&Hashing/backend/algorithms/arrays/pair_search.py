@@ -0,0 +1,169 @@
+"""
+Pair Search - All pairs, pair counts, multi-target Two Sum and k-Sum
+PairIndex builds a value -> indices map once and answers any number of
+targets against it: counts in O(u) per target, and first pairs by scanning
+first and second occurrences in index order until the first match, so a
+target costs O(e) for the e occurrences before its pair (O(u) when it has
+none, O(1) outside [2 * min, 2 * max]). k_sum finds every distinct value
+combination with the sorted two-pointer method, skipping duplicates at
+every level.
+"""
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+from . import vectorized
+
+PAIR_MODES = ("first", "all", "count", "multi", "ksum")
+DEFAULT_PAIR_LIMIT = 10000
+
+# Most targets one multi-target request may ask for
+MAX_TARGETS = 10000
+
+class PairIndex:
+    def __init__(self, nums: Sequence[int]):
+        # Distinct values, first occurrences and the occurrence scan order as arrays for the vectorized engine
+        self._occurrences = None
+        if vectorized.should_vectorize(nums):
+            try:
+                values, first, second = vectorized.first_occurrences(nums)
+                self._occurrences = values, first, vectorized.occurrence_events(values, first, second)
+            except vectorized.Unsupported:
+                pass  # values outside the int64-safe range
+        self._events: Optional[List[Tuple[int, int, bool]]] = None
+
+        self.nums = vectorized.to_ints(nums)
+        self.indices: Dict[int, List[int]] = {}
+        for i, num in enumerate(self.nums):
+            self.indices.setdefault(num, []).append(i)
+
+    def count_pairs(self, target: int) -> int:
+        """Number of index pairs i < j with nums[i] + nums[j] == target, in O(u)"""
+        total = 0
+        for value, positions in self.indices.items():
+            complement = target - value
+            if complement == value:
+                total += len(positions) * (len(positions) - 1) // 2
+            elif value < complement and complement in self.indices:
+                total += len(positions) * len(self.indices[complement])
+        return total
+
+    def all_pairs(self, target: int, limit: int = DEFAULT_PAIR_LIMIT) -> Tuple[List[List[int]], bool]:
+        """
+        Index pairs [j, i] (j < i) summing to target, ordered by i then j
+        Returns at most limit pairs and whether the list was truncated.
+        """
+        pairs = []
+        for i, num in enumerate(self.nums):
+            positions = self.indices.get(target - num)
+            if not positions:
+                continue
+            for j in positions:
+                if j >= i:
+                    break
+                if len(pairs) == limit:
+                    return pairs, True
+                pairs.append([j, i])
+        return pairs, False
+
+    def first_pair(self, target: int) -> Optional[List[int]]:
+        """
+        The pair single-pass Two Sum would return: the smallest i whose
+        complement occurs earlier, with the latest such earlier index
+        Only first and second occurrences are scanned, stopping at the pair.
+        """
+        best = None
+        if self._occurrences is not None and abs(target) < vectorized.SAFE_INT_BOUND:
+            best = vectorized.first_pair_end(*self._occurrences, target)
+        else:
+            best = self._first_pair_end(target)
+        if best is None:
+            return None
+        other = self.indices[target - self.nums[best]]
+        return [other[bisect_left(other, best) - 1], best]
+
+    def _first_pair_end(self, target: int) -> Optional[int]:
+        if self._events is None:
+            # (index, value, is_second) for the first two occurrences of each value, in index order
+            events = [(positions[0], value, False) for value, positions in self.indices.items()]
+            events += [(positions[1], value, True) for value, positions in self.indices.items() if len(positions) > 1]
+            events.sort()
+            self._events = events
+            self._low, self._high = min(self.indices, default=0), max(self.indices, default=0)
+        if not self.indices or not 2 * self._low <= target <= 2 * self._high:
+            return None
+
+        indices = self.indices
+        for i, value, is_second in self._events:
+            complement = target - value
+            if is_second:
+                if complement == value:
+                    return i
+            else:
+                other = indices.get(complement)
+                if other is not None and other[0] < i:
+                    return i
+        return None
+
+    def multi_target(self, targets: Sequence[int]) -> List[Optional[List[int]]]:
+        """
+        first_pair for every target against the one shared index
+        Repeated targets are answered once; callers cap len(targets) at
+        MAX_TARGETS, since each costs up to O(u).
+        """
+        answers: Dict[int, Optional[List[int]]] = {}
+        for target in targets:
+            if target not in answers:
+                answers[target] = self.first_pair(target)
+        return [answers[target] for target in targets]
+
+def k_sum(nums: Sequence[int], target: int, k: int, limit: int = DEFAULT_PAIR_LIMIT) -> Tuple[List[List[int]], bool]:
+    """
+    Distinct value combinations of size k summing to target (3Sum for k=3)
+    Sorts once, fixes values recursively and finishes with a two-pointer
+    sweep; equal values are skipped at every level so each combination is
+    reported once. Returns at most limit combinations and a truncation flag.
+    """
+    if k < 2:
+        raise ValueError("k must be at least 2")
+    values = sorted(vectorized.to_ints(nums))
+    results: List[List[int]] = []
+
+    def search(start: int, k: int, target: int, prefix: List[int]) -> bool:
+        """Append combinations from values[start:]; returns False once the limit is hit"""
+        n = len(values)
+        if n - start < k:
+            return True
+        # Bounds: the k smallest or k largest remaining values cannot reach target
+        if sum(values[start:start + k]) > target or sum(values[n - k:]) < target:
+            return True
+
+        if k == 2:
+            lo, hi = start, n - 1
+            while lo < hi:
+                total = values[lo] + values[hi]
+                if total < target:
+                    lo += 1
+                elif total > target:
+                    hi -= 1
+                else:
+                    if len(results) == limit:
+                        return False
+                    results.append(prefix + [values[lo], values[hi]])
+                    lo += 1
+                    hi -= 1
+                    while lo < hi and values[lo] == values[lo - 1]:
+                        lo += 1
+                    while lo < hi and values[hi] == values[hi + 1]:
+                        hi -= 1
+            return True
+
+        for i in range(start, n - k + 1):
+            if i > start and values[i] == values[i - 1]:
+                continue
+            if values[i] + sum(values[i + 1:i + k]) > target:
+                break
+            if not search(i + 1, k - 1, target - values[i], prefix + [values[i]]):
+                return False
+        return True
+
+    complete = search(0, k, target, [])
+    return results, not complete
@@ -0,0 +1,168 @@
+"""
+Product Modes - Numeric variants of Product of Array Except Self
+"exact" keeps arbitrary-precision ints, "mod" reduces every product modulo
+a modulus, "log" works in float64 log space (log10 magnitude and sign), and
+"int64" returns machine-integer results or raises OverflowError. Arrays with
+zeros are answered from the zero count alone, and long exact/modular arrays
+can be scanned in chunks across the server's parallel scan pool.
+"""
+import math
+import os
+from operator import countOf
+from typing import Any, Dict, List, Optional, Sequence
+from .. import parallel
+
+PRODUCT_MODES = ("exact", "mod", "log", "int64")
+DEFAULT_MODULUS = 1_000_000_007
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+# Arrays at least this long are scanned in parallel chunks (0 disables)
+PARALLEL_THRESHOLD = int(os.environ.get("SMARTPACK_PARALLEL_THRESHOLD", "1000000"))
+
+def tree_product(values: Sequence[int], modulus: Optional[int] = None) -> int:
+    """Product by balanced pairwise multiplication (keeps bigint operands similar in size)"""
+    values = list(values)
+    if not values:
+        return 1 if modulus is None else 1 % modulus
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired if modulus is None else [value % modulus for value in paired]
+    return values[0] if modulus is None else values[0] % modulus
+
+def zero_shortcut(nums: Sequence[int], modulus: Optional[int] = None) -> Optional[List[int]]:
+    """
+    Answer directly when nums contains a zero: two or more zeros make every
+    product 0, a single zero leaves only its own position non-zero
+    Returns None when there are no zeros.
+    """
+    zeros = countOf(nums, 0)
+    if zeros == 0:
+        return None
+    result = [0] * len(nums)
+    if zeros == 1:
+        index = next(i for i, num in enumerate(nums) if num == 0)
+        result[index] = tree_product([num for num in nums if num != 0], modulus)
+    return result
+
+def prefix_suffix(nums: Sequence[int], modulus: Optional[int] = None,
+                  before: int = 1, after: int = 1) -> List[int]:
+    """
+    Left and right pass, optionally reduced modulo modulus
+    before/after are the products of everything left/right of nums when it is
+    one chunk of a longer array.
+    """
+    n = len(nums)
+    result = [before] * n
+    for i in range(1, n):
+        result[i] = result[i-1] * nums[i-1]
+        if modulus is not None:
+            result[i] %= modulus
+
+    right_product = after
+    for i in range(n-1, -1, -1):
+        result[i] *= right_product
+        right_product *= nums[i]
+        if modulus is not None:
+            result[i] %= modulus
+            right_product %= modulus
+    return result
+
+def product_mod(nums: Sequence[int], modulus: int = DEFAULT_MODULUS) -> List[int]:
+    """Products modulo modulus"""
+    if modulus < 1:
+        raise ValueError("modulus must be positive")
+    shortcut = zero_shortcut(nums, modulus)
+    if shortcut is not None:
+        return shortcut
+    if should_parallelize(nums):
+        return parallel_product_except_self(nums, modulus)
+    return prefix_suffix([num % modulus for num in nums], modulus)
+
+def product_int64(nums: Sequence[int]) -> List[int]:
+    """
+    Exact products that must fit in int64, raising OverflowError otherwise
+    Without zeros every prefix product divides the last result, so the left
+    pass stops as soon as a prefix leaves the int64 range.
+    """
+    shortcut = zero_shortcut(nums)
+    if shortcut is not None:
+        result = shortcut
+    else:
+        n = len(nums)
+        result = [1] * n
+        for i in range(1, n):
+            result[i] = result[i-1] * nums[i-1]
+            if not INT64_MIN <= result[i] <= INT64_MAX:
+                raise OverflowError(f"Product of the first {i} values overflows int64")
+        right_product = 1
+        for i in range(n-1, -1, -1):
+            result[i] *= right_product
+            right_product *= nums[i]
+
+    for i, value in enumerate(result):
+        if not INT64_MIN <= value <= INT64_MAX:
+            raise OverflowError(f"Product except index {i} overflows int64")
+    return result
+
+def product_log(nums: Sequence[int]) -> Dict[str, List[Any]]:
+    """
+    Products in float64 log space: log10 of each magnitude (None for a zero
+    product) and its sign (-1, 0 or 1)
+    """
+    n = len(nums)
+    zeros = countOf(nums, 0)
+    logs = [math.log10(abs(num)) if num else 0.0 for num in nums]
+    total = math.fsum(logs)
+    negatives = sum(1 for num in nums if num < 0)
+
+    log10_abs: List[Optional[float]] = [None] * n
+    sign = [0] * n
+    for i, num in enumerate(nums):
+        # Zeros other than nums[i] make the product zero
+        if zeros - (num == 0) > 0:
+            continue
+        log10_abs[i] = total - logs[i]
+        sign[i] = -1 if (negatives - (num < 0)) % 2 else 1
+    return {"log10_abs": log10_abs, "sign": sign}
+
+def should_parallelize(nums: Sequence[int]) -> bool:
+    """Whether a parallel scan pool is registered and nums is long enough to split"""
+    return (PARALLEL_THRESHOLD > 0 and parallel.get_executor() is not None and parallel.workers() > 1
+            and len(nums) >= PARALLEL_THRESHOLD)
+
+def parallel_product_except_self(nums: Sequence[int], modulus: Optional[int] = None,
+                                 workers: Optional[int] = None) -> List[int]:
+    """
+    Chunked prefix/suffix scan on the registered parallel scan pool
+    nums is split into workers chunks (the pool size by default). Pass 1
+    computes each chunk's total product in parallel; the exclusive prefix
+    and suffix of those totals give every chunk its before/after products,
+    and pass 2 scans the chunks in parallel. Without a pool the scan is
+    sequential.
+    """
+    executor = parallel.get_executor()
+    if executor is None:
+        return prefix_suffix(nums if modulus is None else [num % modulus for num in nums], modulus)
+    workers = workers or parallel.workers()
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    chunk_size = max(1, -(-len(nums) // workers))
+    chunks = [list(nums[i:i + chunk_size]) for i in range(0, len(nums), chunk_size)]
+
+    totals = list(executor.map(tree_product, chunks, [modulus] * len(chunks)))
+    befores = [1] * len(chunks)
+    afters = [1] * len(chunks)
+    for i in range(1, len(chunks)):
+        befores[i] = _reduce(befores[i-1] * totals[i-1], modulus)
+    for i in range(len(chunks) - 2, -1, -1):
+        afters[i] = _reduce(afters[i+1] * totals[i+1], modulus)
+
+    result = []
+    for part in executor.map(prefix_suffix, chunks, [modulus] * len(chunks), befores, afters):
+        result.extend(part)
+    return result
+
+def _reduce(value: int, modulus: Optional[int]) -> int:
+    return value if modulus is None else value % modulus
@@ -0,0 +1,194 @@
+"""
+Run Tracking - Incremental Longest Consecutive Sequence
+Maintains the maximal runs of consecutive values under streaming inserts and
+deletes with a sorted interval map: boundary dicts find the runs an insert
+merges in O(1), a blocked sorted list of run starts locates the run
+containing any value in O(log r) (r runs), and runs are bucketed by length
+so the longest is always at hand. Each insert or delete is O(log r).
+"""
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+Run = Tuple[int, int]
+
+# Run starts are held in sorted blocks of at most 2 * START_BLOCK values, so
+# an update shifts one short block rather than a list of every run
+START_BLOCK = 256
+
+COMPLEXITY = {"time": "O(log r) per insert or delete (r runs), O(sqrt u) when the only longest run shrinks",
+              "space": "O(u)"}
+
+class _SortedStarts:
+    """Sorted set of ints as a list of sorted blocks (add, remove and floor in O(log n))"""
+
+    def __init__(self):
+        self._blocks: List[List[int]] = []
+        self._maxes: List[int] = []  # last value of each block
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        for block in self._blocks:
+            yield from block
+
+    def add(self, value: int) -> None:
+        self._size += 1
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+            return
+        i = bisect_left(self._maxes, value)
+        if i == len(self._blocks):
+            i -= 1
+            self._blocks[i].append(value)
+            self._maxes[i] = value
+        else:
+            insort(self._blocks[i], value)
+        block = self._blocks[i]
+        if len(block) > 2 * START_BLOCK:
+            self._blocks[i:i + 1] = [block[:START_BLOCK], block[START_BLOCK:]]
+            self._maxes[i:i + 1] = [block[START_BLOCK - 1], block[-1]]
+
+    def remove(self, value: int) -> None:
+        i = bisect_left(self._maxes, value)
+        block = self._blocks[i]
+        del block[bisect_left(block, value)]
+        self._size -= 1
+        if block:
+            self._maxes[i] = block[-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+
+    def floor(self, value: int) -> Optional[int]:
+        """Largest member <= value, or None"""
+        # Blocks before i end at or below value; block i may start below it
+        i = bisect_right(self._maxes, value)
+        if i < len(self._blocks):
+            block = self._blocks[i]
+            j = bisect_right(block, value)
+            if j:
+                return block[j - 1]
+        return self._maxes[i - 1] if i else None
+
+class RunTracker:
+    def __init__(self, nums: Iterable[int] = ()):
+        self._counts: Dict[int, int] = {}
+        self._start_to_end: Dict[int, int] = {}
+        self._end_to_start: Dict[int, int] = {}
+        self._starts = _SortedStarts()
+        # run length -> starts of runs with that length (insertion-ordered set)
+        self._lengths: Dict[int, Dict[int, None]] = {}
+        self._longest = 0
+        self.insert_many(nums)
+
+    def __len__(self) -> int:
+        """Number of distinct values tracked"""
+        return len(self._counts)
+
+    def __contains__(self, num: int) -> bool:
+        return num in self._counts
+
+    def insert(self, num: int) -> bool:
+        """Add one occurrence of num; returns True if it was a new value"""
+        count = self._counts.get(num, 0)
+        self._counts[num] = count + 1
+        if count:
+            return False
+
+        start = end = num
+        left_start = self._end_to_start.get(num - 1)
+        if left_start is not None:
+            self._remove_run(left_start, num - 1)
+            start = left_start
+        right_end = self._start_to_end.get(num + 1)
+        if right_end is not None:
+            self._remove_run(num + 1, right_end)
+            end = right_end
+        self._add_run(start, end)
+        return True
+
+    def delete(self, num: int) -> bool:
+        """Remove one occurrence of num; returns True if the value is now gone"""
+        count = self._counts.get(num)
+        if count is None:
+            raise KeyError(num)
+        if count > 1:
+            self._counts[num] = count - 1
+            return False
+
+        del self._counts[num]
+        start, end = self.run_containing(num)
+        self._remove_run(start, end)
+        if start < num:
+            self._add_run(start, num - 1)
+        if num < end:
+            self._add_run(num + 1, end)
+        return True
+
+    def insert_many(self, nums: Iterable[int]) -> int:
+        """Insert several values, returning how many were new"""
+        return sum(map(self.insert, nums))
+
+    def delete_many(self, nums: Iterable[int]) -> int:
+        """Delete several values (ignoring absent ones), returning how many are now gone"""
+        gone = 0
+        for num in nums:
+            if num in self._counts:
+                gone += self.delete(num)
+        return gone
+
+    def longest_length(self) -> int:
+        return self._longest
+
+    def longest_run(self) -> Optional[Run]:
+        """The earliest-formed run of maximal length, or None when empty"""
+        if not self._longest:
+            return None
+        start = next(iter(self._lengths[self._longest]))
+        return start, self._start_to_end[start]
+
+    def run_containing(self, num: int) -> Optional[Run]:
+        """(start, end) of the run containing num, or None"""
+        start = self._starts.floor(num)
+        if start is None:
+            return None
+        end = self._start_to_end[start]
+        return (start, end) if num <= end else None
+
+    def runs(self) -> List[Run]:
+        """All runs in ascending order"""
+        return [(start, self._start_to_end[start]) for start in self._starts]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "values": len(self._counts),
+            "runs": len(self._starts),
+            "longest_length": self._longest,
+            "longest_run": self.longest_run(),
+            "complexity": COMPLEXITY
+        }
+
+    def _add_run(self, start: int, end: int) -> None:
+        self._start_to_end[start] = end
+        self._end_to_start[end] = start
+        self._starts.add(start)
+        length = end - start + 1
+        self._lengths.setdefault(length, {})[start] = None
+        if length > self._longest:
+            self._longest = length
+
+    def _remove_run(self, start: int, end: int) -> None:
+        del self._start_to_end[start]
+        del self._end_to_start[end]
+        self._starts.remove(start)
+        length = end - start + 1
+        bucket = self._lengths[length]
+        del bucket[start]
+        if not bucket:
+            del self._lengths[length]
+            # Distinct run lengths number O(sqrt(n)), so this rescan is cheap
+            if length == self._longest:
+                self._longest = max(self._lengths, default=0)
@@ -2,108 +2,141 @@
 Sequence Analysis - Longest Consecutive Sequence
 Time Complexity: O(n), Space Complexity: O(n)
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, AbstractSet
+from ..trace import Trace, TracedAnalyzer
+from . import vectorized
 
-class SequenceTracker:
-    def longest_consecutive(self, nums: List[int]) -> int:
+class SequenceTracker(TracedAnalyzer):
+    def longest_consecutive(self, nums: List[int], num_set: Optional[AbstractSet[int]] = None) -> int:
         """
         Find length of longest consecutive sequence using hash set
+        An already built set of the distinct values can be passed in.
         """
-        if not nums:
+        if not len(nums):
             return 0
-        
-        num_set = set(nums)
+
+        if num_set is None and vectorized.should_vectorize(nums):
+            try:
+                return vectorized.longest_consecutive(nums)
+            except vectorized.Unsupported:
+                pass  # values outside the int64-safe range
+
+        if num_set is None:
+            num_set = set(vectorized.to_ints(nums))
         longest = 0
-        
+
         for num in num_set:
             # Check if this is the start of a sequence
             if num - 1 not in num_set:
                 current_num = num
                 current_streak = 1
-                
+
                 # Extend the sequence
                 while current_num + 1 in num_set:
                     current_num += 1
                     current_streak += 1
-                
+
                 longest = max(longest, current_streak)
-        
+
         return longest
-    
-    def get_steps(self, nums: List[int]) -> List[str]:
-        """Generate step-by-step explanation"""
-        if not nums:
-            return ["Empty array - longest consecutive sequence is 0"]
-        
-        steps = []
-        num_set = set(nums)
+
+    def trace(self, nums: List[int], num_set: Optional[AbstractSet[int]] = None) -> Trace:
+        """
+        Single instrumented run: every sequence start emits a run event
+        """
+        trace = Trace("longest_consecutive", nums, self)
+        if num_set is None:
+            num_set = set(nums)
         longest = 0
-        longest_sequence = []
-        
-        steps.append(f"Input array: {nums}")
-        steps.append(f"Convert to set for O(1) lookups: {sorted(num_set)}")
-        
-        for num in sorted(num_set):
-            # Check if this is the start of a sequence
+
+        for num in num_set:
             if num - 1 not in num_set:
                 current_num = num
-                current_streak = 1
-                sequence = [current_num]
-                
-                steps.append(f"\nFound sequence start: {num} (no {num-1} in set)")
-                
-                # Extend the sequence
                 while current_num + 1 in num_set:
                     current_num += 1
-                    current_streak += 1
-                    sequence.append(current_num)
-                    steps.append(f"Extend sequence: {sequence} (length: {current_streak})")
-                
-                if current_streak > longest:
-                    longest = current_streak
-                    longest_sequence = sequence
-                    steps.append(f"New longest sequence: {sequence} (length: {longest})")
-        
-        steps.append(f"\nFinal result: longest consecutive sequence length = {longest}")
-        if longest_sequence:
-            steps.append(f"Longest sequence: {longest_sequence}")
-        
-        return steps
-    
+
+                length = current_num - num + 1
+                trace.emit("run", start=num, length=length)
+                longest = max(longest, length)
+
+        trace.result = longest
+        trace.state["num_set"] = num_set
+        return trace
+
+    def get_steps(self, nums: List[int]) -> List[str]:
+        """Generate step-by-step explanation"""
+        return self.trace(nums).steps()
+
     def get_visualization_data(self, nums: List[int]) -> Dict[str, Any]:
         """Generate data for visualization"""
-        if not nums:
-            return {"length": 0, "sequences": [], "input": nums}
-        
-        num_set = set(nums)
+        return self.trace(nums).visualization()
+
+    def _sorted_unique(self, trace: Trace) -> List[int]:
+        """Sorted distinct values, computed once per trace for steps and visualization"""
+        if "sorted_unique" not in trace.state:
+            trace.state["sorted_unique"] = sorted(trace.state["num_set"])
+        return trace.state["sorted_unique"]
+
+    def _runs_in_order(self, trace: Trace) -> List[Dict[str, Any]]:
+        """Run events ordered by start value, as they are presented"""
+        return sorted(trace.events_of("run"), key=lambda event: event["start"])
+
+    def iter_steps(self, trace: Trace) -> Iterator[str]:
+        """Render steps from the recorded runs"""
+        if not trace.input:
+            yield "Empty array - longest consecutive sequence is 0"
+            return
+
+        longest = 0
+        longest_sequence = []
+
+        yield f"Input array: {trace.input}"
+        yield f"Convert to set for O(1) lookups: {self._sorted_unique(trace)}"
+
+        for run in self._runs_in_order(trace):
+            start = run["start"]
+            sequence = [start]
+
+            yield f"\nFound sequence start: {start} (no {start-1} in set)"
+
+            for current_num in range(start + 1, start + run["length"]):
+                sequence.append(current_num)
+                yield f"Extend sequence: {sequence} (length: {len(sequence)})"
+
+            if run["length"] > longest:
+                longest = run["length"]
+                longest_sequence = sequence
+                yield f"New longest sequence: {sequence} (length: {longest})"
+
+        yield f"\nFinal result: longest consecutive sequence length = {longest}"
+        if longest_sequence:
+            yield f"Longest sequence: {longest_sequence}"
+
+    def render_visualization(self, trace: Trace) -> Dict[str, Any]:
+        """Render visualization data from the recorded runs"""
+        if not trace.input:
+            return {"length": 0, "sequences": [], "input": trace.input}
+
         sequences = []
         longest_length = 0
         longest_seq = []
-        
-        for num in sorted(num_set):
-            if num - 1 not in num_set:
-                # Start of a sequence
-                current_num = num
-                sequence = [current_num]
-                
-                while current_num + 1 in num_set:
-                    current_num += 1
-                    sequence.append(current_num)
-                
-                sequences.append({
-                    "sequence": sequence,
-                    "start": num,
-                    "length": len(sequence),
-                    "is_longest": len(sequence) > longest_length
-                })
-                
-                if len(sequence) > longest_length:
-                    longest_length = len(sequence)
-                    longest_seq = sequence
-        
+
+        for run in self._runs_in_order(trace):
+            sequence = list(range(run["start"], run["start"] + run["length"]))
+            sequences.append({
+                "sequence": sequence,
+                "start": run["start"],
+                "length": run["length"],
+                "is_longest": run["length"] > longest_length
+            })
+
+            if run["length"] > longest_length:
+                longest_length = run["length"]
+                longest_seq = sequence
+
         return {
-            "input": nums,
-            "unique_numbers": sorted(num_set),
+            "input": trace.input,
+            "unique_numbers": self._sorted_unique(trace),
             "sequences": sequences,
             "longest_length": longest_length,
             "longest_sequence": longest_seq,
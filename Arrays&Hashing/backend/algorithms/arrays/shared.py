@@ -0,0 +1,31 @@
+"""
+Shared Numeric Data - Derived structures reused across analyzers
+Several analyzers need the same view of an array: the frequency Counter
+(FrequencyInsights, DuplicateDetector) and the distinct-value set
+(SequenceTracker). Building them once per dataset lets a batch of analyses
+share the work.
+"""
+from typing import List, Optional, KeysView
+from collections import Counter
+
+class NumericDataset:
+    def __init__(self, nums: List[int]):
+        self.nums = nums
+        self._frequency: Optional[Counter] = None
+
+    @property
+    def frequency(self) -> Counter:
+        """Frequency of each value, built on first use"""
+        if self._frequency is None:
+            self._frequency = Counter(self.nums)
+        return self._frequency
+
+    @property
+    def num_set(self) -> KeysView:
+        """Distinct values; a set-like view over the frequency keys"""
+        return self.frequency.keys()
+
+    def prepare(self) -> "NumericDataset":
+        """Build all derived structures eagerly (before fanning out)"""
+        self.frequency
+        return self
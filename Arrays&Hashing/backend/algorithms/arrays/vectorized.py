@@ -0,0 +1,311 @@
+"""
+Vectorized Numeric Engine - NumPy implementations of the numeric analyzers
+Used automatically by the analyzers' core methods for arrays of at least
+VECTORIZE_THRESHOLD elements when NumPy is installed. Every function returns
+exactly what the pure-Python method would, or raises Unsupported when the
+input cannot be handled safely in int64 (the caller then falls back to the
+pure-Python engine, on to_ints of its input).
+"""
+import os
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python engine is always available
+    np = None
+
+VECTORIZE_THRESHOLD = int(os.environ.get("SMARTPACK_VECTORIZE_THRESHOLD", "50000"))
+
+# Values are kept within +/-2**62 so differences and complements cannot overflow int64
+SAFE_INT_BOUND = 2 ** 62
+
+# bincount is used for top-k when the value range is at most this multiple of n
+BINCOUNT_RANGE_FACTOR = 4
+
+# Sentinel index for "no such occurrence"
+NO_INDEX = 2 ** 63 - 1
+
+# Streaming duplicate engines process the array in chunks of this many values
+DUPLICATE_CHUNK = 1 << 20
+
+# first_pair_end checks occurrences in blocks doubling from this size
+PAIR_SCAN_BLOCK = 1024
+
+class Unsupported(ValueError):
+    """Input cannot be processed exactly in int64"""
+
+def available() -> bool:
+    return np is not None
+
+def should_vectorize(nums: Sequence[int]) -> bool:
+    """Whether the vectorized engine should handle an input of this size"""
+    return np is not None and len(nums) >= VECTORIZE_THRESHOLD
+
+def to_array(nums: Sequence[int]) -> "np.ndarray":
+    """int64 view/copy of nums, raising Unsupported outside the safe range"""
+    try:
+        arr = np.asarray(nums, dtype=np.int64)
+    except (OverflowError, TypeError, ValueError) as e:
+        raise Unsupported(str(e))
+    if arr.ndim != 1:
+        raise Unsupported("expected a one-dimensional array")
+    if arr.size and (arr.min() <= -SAFE_INT_BOUND or arr.max() >= SAFE_INT_BOUND):
+        raise Unsupported("values outside the int64-safe range")
+    return arr
+
+def to_ints(nums: Sequence[int]) -> Sequence[int]:
+    """
+    nums with Python ints for the pure-Python engine: an int64 array (binary
+    payloads, mapped datasets) would wrap around where Python ints grow
+    """
+    if np is not None and isinstance(nums, np.ndarray):
+        return nums.tolist()
+    return nums
+
+def contains_duplicate(nums: Sequence[int]) -> bool:
+    """Duplicate check on a sorted copy"""
+    return has_repeats(to_array(nums))
+
+def has_repeats(arr: "np.ndarray") -> bool:
+    """Whether any value occurs twice (sort and compare neighbours; faster than np.unique)"""
+    values = np.sort(arr)
+    return bool(np.any(values[1:] == values[:-1]))
+
+def bitset_contains_duplicate(nums: Sequence[int], low: int, width: int) -> bool:
+    """
+    Packed bitset over [low, low + width), filled chunk by chunk
+    Raises ValueError (not Unsupported) for values outside the range.
+    """
+    arr = to_array(nums)
+    if arr.size and (int(arr.min()) < low or int(arr.max()) - low >= width):
+        raise ValueError("values outside the bitset range")
+    bits = np.zeros((width + 7) >> 3, dtype=np.uint8)
+    for start in range(0, arr.size, DUPLICATE_CHUNK):
+        offsets = arr[start:start + DUPLICATE_CHUNK] - low
+        if has_repeats(offsets):
+            return True
+        byte, mask = offsets >> 3, (1 << (offsets & 7)).astype(np.uint8)
+        if np.any(bits[byte] & mask):
+            return True
+        np.bitwise_or.at(bits, byte, mask)
+    return False
+
+def sort_contains_duplicate(nums: Sequence[int], in_place: bool = False) -> bool:
+    """Sort (in place for a writable int64 array when allowed) and compare neighbours"""
+    arr = to_array(nums)
+    if not (in_place and arr is nums and arr.flags.writeable):
+        return has_repeats(arr)
+    arr.sort()
+    return bool(np.any(arr[1:] == arr[:-1]))
+
+def _mix64(x: "np.ndarray") -> "np.ndarray":
+    """splitmix64 finalizer on uint64 (wrapping) arithmetic"""
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def bloom_contains_duplicate(nums: Sequence[int], bits: int, hashes: int) -> bool:
+    """
+    Chunked Bloom pre-filter with exact confirmation
+    The filter is blocked: all of a value's bits (at most 10) fall in one
+    64-bit word, so each value costs one gather and one scatter. Values are
+    unique within each chunk or the answer is already True, so a value
+    flagged twice is a duplicate; otherwise the flagged values are counted
+    exactly in a second pass.
+    """
+    arr = to_array(nums)
+    words = np.zeros(-(-bits // 64), dtype=np.uint64)
+    word_count = np.uint64(words.size)
+    flagged = []
+    for start in range(0, arr.size, DUPLICATE_CHUNK):
+        chunk = arr[start:start + DUPLICATE_CHUNK]
+        if has_repeats(chunk):
+            return True
+        h = _mix64(chunk.astype(np.uint64))
+        word = h % word_count
+        g = _mix64(h)
+        mask = np.zeros(chunk.size, dtype=np.uint64)
+        for i in range(min(hashes, 10)):
+            mask |= np.uint64(1) << ((g >> np.uint64(6 * i)) & np.uint64(63))
+        present = (words[word] & mask) == mask
+        np.bitwise_or.at(words, word, mask)
+        flagged.append(chunk[present])
+
+    candidates = np.concatenate(flagged) if flagged else arr[:0]
+    if candidates.size == 0:
+        return False
+    unique_candidates = np.sort(candidates)
+    if np.any(unique_candidates[1:] == unique_candidates[:-1]):
+        return True
+
+    counts = np.zeros(unique_candidates.size, dtype=np.int64)
+    last = unique_candidates.size - 1
+    for start in range(0, arr.size, DUPLICATE_CHUNK):
+        chunk = arr[start:start + DUPLICATE_CHUNK]
+        index = np.minimum(np.searchsorted(unique_candidates, chunk), last)
+        hits = index[unique_candidates[index] == chunk]
+        counts += np.bincount(hits, minlength=counts.size)
+        if counts.max() > 1:
+            return True
+    return False
+
+def value_counts(arr: "np.ndarray"):
+    """Distinct values (ascending) and their counts, via bincount when the range is small"""
+    low, high = int(arr.min()), int(arr.max())
+    if high - low <= BINCOUNT_RANGE_FACTOR * arr.size:
+        counts = np.bincount(arr - low)
+        values = np.flatnonzero(counts)
+        return values + low, counts[values]
+    return np.unique(arr, return_counts=True)
+
+def top_k_frequent(nums: Sequence[int], k: int) -> List[int]:
+    """
+    Top k values by (frequency, value), descending - the same order the
+    heap-based method produces
+    """
+    if k <= 0:
+        return []
+    arr = to_array(nums)
+    if arr.size == 0:
+        return []
+
+    values, counts = value_counts(arr)
+    if k < values.size:
+        # Every value counted strictly above the k-th largest count is selected;
+        # ties at that count are broken by the larger value, as in the heap
+        threshold = np.partition(counts, values.size - k)[values.size - k]
+        above = np.flatnonzero(counts > threshold)
+        ties = np.flatnonzero(counts == threshold)
+        chosen = np.concatenate((above, ties[ties.size - (k - above.size):]))
+        values, counts = values[chosen], counts[chosen]
+
+    order = np.lexsort((values, counts))[::-1]
+    return values[order].tolist()
+
+def longest_consecutive(nums: Sequence[int]) -> int:
+    """Longest run of consecutive values via sort + diff"""
+    arr = to_array(nums)
+    if arr.size == 0:
+        return 0
+
+    low, high = int(arr.min()), int(arr.max())
+    if high - low <= BINCOUNT_RANGE_FACTOR * arr.size:
+        # Small range: a presence mask yields the distinct values already sorted
+        present = np.zeros(high - low + 1, dtype=bool)
+        present[arr - low] = True
+        unique = np.flatnonzero(present)
+    else:
+        unique = np.unique(arr)
+    breaks = np.flatnonzero(np.diff(unique) != 1)
+    bounds = np.concatenate(([-1], breaks, [unique.size - 1]))
+    return int(np.diff(bounds).max())
+
+def two_sum(nums: Sequence[int], target: int) -> Optional[List[int]]:
+    """
+    Two Sum returning the same pair as the single-pass hash map: the smallest
+    index i whose complement occurs earlier, paired with the latest such index
+    Each complement is located with a binary search over a stably sorted copy
+    (rather than a two-pointer walk) so the hash map's first-found pair is kept.
+    """
+    if abs(target) >= SAFE_INT_BOUND:
+        raise Unsupported("target outside the int64-safe range")
+    arr = to_array(nums)
+    n = arr.size
+    if n < 2:
+        return None
+
+    order = np.argsort(arr, kind="stable")
+    sorted_values = arr[order]
+    complements = target - arr
+    lo = np.searchsorted(sorted_values, complements, side="left")
+    hi = np.searchsorted(sorted_values, complements, side="right")
+
+    # Stable sort: order[lo] is the earliest index holding each complement
+    earliest = np.where(lo < hi, order[np.minimum(lo, n - 1)], n)
+    valid = earliest < np.arange(n)
+    if not valid.any():
+        return None
+
+    i = int(np.argmax(valid))
+    candidates = order[lo[i]:hi[i]]
+    j = int(candidates[np.searchsorted(candidates, i) - 1])
+    return [j, i]
+
+def first_occurrences(nums: Sequence[int]):
+    """Distinct values (ascending) with the first and second index of each (NO_INDEX if none)"""
+    arr = to_array(nums)
+    order = np.argsort(arr, kind="stable")
+    sorted_values = arr[order]
+    starts = np.flatnonzero(np.diff(sorted_values, prepend=sorted_values[:1] - 1))
+    counts = np.diff(np.append(starts, arr.size))
+    second = np.full(starts.size, NO_INDEX, dtype=np.int64)
+    repeated = counts > 1
+    second[repeated] = order[starts[repeated] + 1]
+    return sorted_values[starts], order[starts], second
+
+def occurrence_events(values: "np.ndarray", first: "np.ndarray", second: "np.ndarray"):
+    """
+    First and second occurrences of every distinct value - the only
+    positions a pair can end on - as (indices, values, is_second), in index
+    order by blocks doubling from PAIR_SCAN_BLOCK; within a block they are
+    sorted by descending value so any target's complements come out ascending
+    """
+    repeated = second != NO_INDEX
+    indices = np.concatenate((first, second[repeated]))
+    event_values = np.concatenate((values, values[repeated]))
+    is_second = np.concatenate((np.zeros(values.size, dtype=bool), np.ones(int(repeated.sum()), dtype=bool)))
+    order = np.argsort(indices, kind="stable")
+    start, size = 0, PAIR_SCAN_BLOCK
+    while start < order.size:
+        block = order[start:start + size]
+        block[:] = block[np.argsort(-event_values[block], kind="stable")]
+        start, size = start + size, size * 2
+    return indices[order], event_values[order], is_second[order]
+
+def first_pair_end(values: "np.ndarray", first: "np.ndarray", events, target: int) -> Optional[int]:
+    """
+    Smallest index i whose complement occurs before it - the end of the pair
+    single-pass Two Sum returns - from first_occurrences and occurrence_events
+    The occurrence blocks are checked in order and the scan stops at the
+    first block with a pair: O(e log u) for the e occurrences up to about
+    twice the answer, O(u log u) only when no pair sums to target. Complements
+    are searched in ascending order, which keeps the lookups cache-friendly.
+    """
+    if values.size == 0 or not 2 * int(values[0]) <= target <= 2 * int(values[-1]):
+        return None
+    indices, event_values, is_second = events
+    last = values.size - 1
+    start, size = 0, PAIR_SCAN_BLOCK
+    while start < indices.size:
+        stop = start + size
+        block, block_indices = event_values[start:stop], indices[start:stop]
+        complements = target - block
+        pos = np.minimum(np.searchsorted(values, complements), last)
+        found = values[pos] == complements
+        same = complements == block
+        # A first occurrence ends a pair with an earlier different value, a second one with itself
+        hits = found & np.where(is_second[start:stop], same, ~same & (first[pos] < block_indices))
+        if hits.any():
+            return int(block_indices[hits].min())
+        start, size = stop, size * 2
+    return None
+
+def product_except_self(nums: Sequence[int]) -> List[int]:
+    """
+    Prefix/suffix cumulative products in int64
+    Raises Unsupported when any product could exceed int64: every partial
+    product of integers is bounded by the product of the non-zero magnitudes.
+    """
+    arr = to_array(nums)
+    if arr.size == 0:
+        return []
+
+    nonzero = np.abs(arr[arr != 0]).astype(np.float64)
+    if nonzero.size and np.log2(nonzero).sum() >= 62:
+        raise Unsupported("products would overflow int64")
+
+    ones = np.ones(1, dtype=np.int64)
+    prefix = np.cumprod(np.concatenate((ones, arr[:-1])))
+    suffix = np.cumprod(np.concatenate((ones, arr[:0:-1])))[::-1]
+    return (prefix * suffix).tolist()
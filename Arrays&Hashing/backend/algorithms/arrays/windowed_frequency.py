@@ -0,0 +1,229 @@
+"""
+Windowed Frequency - Top K frequent over a sliding or decaying window
+Counts cover the last `size` events and/or the last `seconds` seconds, or
+every event with exponential decay (`half_life` seconds). Window counts are
+kept in frequency buckets so each append or expiry is O(1) and top-k walks
+only the highest buckets instead of rescanning the events. Decayed counters
+all shrink at the same rate, so their order only changes when one is
+incremented; a lazily invalidated max-heap answers top-k in O(k log m) and
+counters decayed below DECAY_PRUNE_WEIGHT are pruned as the heap is
+compacted, keeping m near the values seen in the last ~20 half-lives.
+Once events arrive with explicit timestamps the window runs on event time:
+queries measure expiry and decay from the latest ingested timestamp (or an
+explicit now), not from the wall clock.
+"""
+import heapq
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# Decayed weights are renormalized before they can overflow a float
+MAX_DECAY_EXPONENT = 512
+# Decayed counters whose weight falls below this (about 20 half-lives after a
+# single event) are dropped whenever the counters are compacted
+DECAY_PRUNE_WEIGHT = 1e-6
+# Decay mode compacts once this many counters (or stale heap entries) have accumulated
+MIN_COMPACT_SIZE = 1024
+
+class WindowedFrequency:
+    def __init__(self, size: Optional[int] = None, seconds: Optional[float] = None,
+                 half_life: Optional[float] = None, clock: Callable[[], float] = time.time):
+        if half_life is not None and (size is not None or seconds is not None):
+            raise ValueError("half_life cannot be combined with size or seconds")
+        if size is None and seconds is None and half_life is None:
+            raise ValueError("One of size, seconds or half_life is required")
+        if any(bound is not None and bound <= 0 for bound in (size, seconds, half_life)):
+            raise ValueError("size, seconds and half_life must be positive")
+
+        self.size = size
+        self.seconds = seconds
+        self.half_life = half_life
+        self.clock = clock
+        self.appended = 0
+        self.event_time = False
+        self._last_time = float("-inf")
+
+        # Sliding window: events in arrival order, value -> count, count -> values
+        self._events: deque = deque()
+        self._counts: Dict[Hashable, Any] = {}
+        self._buckets: Dict[int, Dict[Hashable, None]] = {}
+        self._max_count = 0
+
+        # Decay: counts are stored scaled by 2 ** ((t - landmark) / half_life),
+        # mirrored in a max-heap of (-weight, sequence, value) with stale entries
+        self._landmark = None
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._sequence = 0
+        self._compact_at = MIN_COMPACT_SIZE
+
+    @property
+    def decaying(self) -> bool:
+        return self.half_life is not None
+
+    def append(self, value: Hashable, timestamp: Optional[float] = None) -> None:
+        """Add one event (timestamps earlier than the previous event are clamped to it)"""
+        if timestamp is None:
+            self._append_at(value, self.clock())
+        else:
+            self.event_time = True
+            self._append_at(value, timestamp)
+
+    def now(self, now: Optional[float] = None) -> float:
+        """The window's current time: now if given, else the latest event time or the wall clock"""
+        if now is not None:
+            return now
+        return self._last_time if self.event_time else self.clock()
+
+    def _append_at(self, value: Hashable, now: float) -> None:
+        now = max(now, self._last_time)
+        self._last_time = now
+        self.appended += 1
+
+        if self.decaying:
+            self._add_decayed(value, now)
+            return
+
+        self._events.append((now, value))
+        self._increment(value)
+        if self.size is not None and len(self._events) > self.size:
+            self._decrement(self._events.popleft()[1])
+        self.expire(now)
+
+    def extend(self, values: Iterable[Hashable], timestamps: Optional[Iterable[float]] = None) -> None:
+        """Add several events, optionally with one timestamp each"""
+        if timestamps is None:
+            now = self.clock()
+            for value in values:
+                self._append_at(value, now)
+        else:
+            for value, timestamp in zip(values, timestamps):
+                self.append(value, timestamp)
+
+    def expire(self, now: Optional[float] = None) -> None:
+        """Drop events older than the time window"""
+        if self.seconds is None:
+            return
+        cutoff = self.now(now) - self.seconds
+        events = self._events
+        while events and events[0][0] <= cutoff:
+            self._decrement(events.popleft()[1])
+
+    def count(self, value: Hashable, now: Optional[float] = None) -> float:
+        """Current (windowed or decayed) count of value"""
+        if self.decaying:
+            return self._decayed(self._counts.get(value, 0.0), now)
+        self.expire(now)
+        return self._counts.get(value, 0)
+
+    def top_k(self, k: int, now: Optional[float] = None) -> List[Tuple[Hashable, float]]:
+        """
+        Top k (value, count) pairs, highest count first
+        Window mode reads the highest frequency buckets (ties in bucket order);
+        decay mode pops the k best current entries off the heap, dropping
+        stale ones on the way, and pushes them back (O(k log m) amortized).
+        """
+        if k <= 0:
+            return []
+        if self.decaying:
+            heap = self._heap
+            best, seen = [], set()
+            while heap and len(best) < k:
+                entry = heapq.heappop(heap)
+                value = entry[2]
+                # Superseded by a later increment (or a duplicate when an increment did not change the weight)
+                if value in seen or self._counts.get(value) != -entry[0]:
+                    continue
+                seen.add(value)
+                best.append(entry)
+            for entry in best:
+                heapq.heappush(heap, entry)
+            return [(value, self._decayed(-weight, now)) for weight, _, value in best]
+
+        self.expire(now)
+        result = []
+        for count in range(self._max_count, 0, -1):
+            for value in self._buckets.get(count, ()):
+                result.append((value, count))
+                if len(result) == k:
+                    return result
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Window configuration and current size"""
+        return {
+            "size": self.size,
+            "seconds": self.seconds,
+            "half_life": self.half_life,
+            "appended": self.appended,
+            "event_time": self.event_time,
+            "in_window": None if self.decaying else len(self._events),
+            "distinct": len(self._counts)
+        }
+
+    def _increment(self, value: Hashable) -> None:
+        count = self._counts.get(value, 0)
+        if count:
+            self._unbucket(value, count)
+        count += 1
+        self._counts[value] = count
+        self._buckets.setdefault(count, {})[value] = None
+        if count > self._max_count:
+            self._max_count = count
+
+    def _decrement(self, value: Hashable) -> None:
+        count = self._counts[value]
+        self._unbucket(value, count)
+        if count == 1:
+            del self._counts[value]
+        else:
+            self._counts[value] = count - 1
+            self._buckets.setdefault(count - 1, {})[value] = None
+        # Counts move by one, so the maximum drops by at most one per removal
+        if count == self._max_count and count not in self._buckets:
+            self._max_count -= 1
+
+    def _unbucket(self, value: Hashable, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[value]
+        if not bucket:
+            del self._buckets[count]
+
+    def _add_decayed(self, value: Hashable, now: float) -> None:
+        if self._landmark is None:
+            self._landmark = now
+        exponent = (now - self._landmark) / self.half_life
+        if exponent > MAX_DECAY_EXPONENT:
+            self._compact(now, renormalize=True)
+            exponent = 0.0
+        weight = self._counts.get(value, 0.0) + 2.0 ** exponent
+        self._counts[value] = weight
+        self._sequence += 1
+        heapq.heappush(self._heap, (-weight, self._sequence, value))
+        # Each append leaves at most one stale entry, so compaction is amortized O(1) per append
+        if len(self._heap) > self._compact_at:
+            self._compact(now)
+
+    def _compact(self, now: float, renormalize: bool = False) -> None:
+        """
+        Prune counters decayed below DECAY_PRUNE_WEIGHT and rebuild the heap
+        without stale entries, optionally moving the landmark to now
+        """
+        scale = 2.0 ** (-(now - self._landmark) / self.half_life)
+        if renormalize:
+            self._counts = {value: weight * scale for value, weight in self._counts.items()
+                            if weight * scale >= DECAY_PRUNE_WEIGHT}
+            self._landmark = now
+        else:
+            floor = DECAY_PRUNE_WEIGHT / scale
+            self._counts = {value: weight for value, weight in self._counts.items() if weight >= floor}
+        self._heap = [(-weight, sequence, value)
+                      for sequence, (value, weight) in enumerate(self._counts.items(), self._sequence + 1)]
+        self._sequence += len(self._heap)
+        heapq.heapify(self._heap)
+        self._compact_at = max(MIN_COMPACT_SIZE, 2 * len(self._heap))
+
+    def _decayed(self, weight: float, now: Optional[float]) -> float:
+        if self._landmark is None:
+            return 0.0
+        now = max(self.now(now), self._last_time)
+        return weight * 2.0 ** (-(now - self._landmark) / self.half_life)
@@ -0,0 +1,25 @@
+"""
+Parallel Scans - Process pool lent to chunk-parallel analyzers
+The server owns the pool: its dispatcher creates it on start and shuts it
+down with the app. Analyzers only borrow it and scan sequentially when none
+is registered, e.g. inside process-pool workers, which already run requests
+in parallel.
+"""
+from concurrent.futures import Executor
+from typing import Optional
+
+_executor: Optional[Executor] = None
+_workers = 1
+
+def set_executor(executor: Optional[Executor], workers: int = 1) -> None:
+    """Register the pool chunk scans run on (None to scan sequentially)"""
+    global _executor, _workers
+    _executor = executor
+    _workers = workers if executor is not None else 1
+
+def get_executor() -> Optional[Executor]:
+    return _executor
+
+def workers() -> int:
+    """Processes in the registered pool (1 without one)"""
+    return _workers
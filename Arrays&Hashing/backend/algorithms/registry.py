@@ -0,0 +1,255 @@
+"""
+Algorithm Registry - Declarative, lazily loaded analyzer plugins
+Each analysis is registered with its metadata (endpoint name, request schema,
+response info, DSA pattern), the dotted path of its analyzer class and the
+paths of the job and stream tracer that run it, with the named argument
+readers each one takes. Modules are imported on first use only, so a worker
+loads just the algorithms (and NumPy) it actually serves. The
+/analyze/{name} routes, their stream, batch and binary variants and the
+/algorithms/mapping data are generated from the registry.
+"""
+import importlib
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Request schemas an algorithm can declare: a numbers array (with target and
+# k) or a list of strings
+REQUEST_SCHEMAS = ("numeric", "strings")
+
+def split_path(path: str, kind: str) -> Tuple[str, str]:
+    """Split a 'package.module:attribute' path"""
+    module, _, attribute = path.partition(":")
+    if not module or not attribute:
+        raise ValueError(f"{kind} must be a 'package.module:{kind}' path")
+    return module, attribute
+
+class AlgorithmPlugin:
+    """
+    Metadata of one analysis and where its analyzer, job and tracer live
+    job runs on the worker pool as job(data, detail=..., **arguments), where
+    arguments are merged from the named readers in arguments; shared_data
+    jobs also take the prepared NumericDataset of a batch as shared. tracer
+    returns (info, Trace) for the stream endpoint from the data and the
+    trace_arguments readers, which the batch endpoint also passes to job.
+    """
+
+    def __init__(self, name: str, analyzer: str, request: str, info: Dict[str, Any], summary: str,
+                 pattern: str, job: str, tracer: Optional[str] = None, arguments: Sequence[str] = (),
+                 trace_arguments: Sequence[str] = (), shared_data: bool = False,
+                 features: Sequence[str] = (), blind75: Sequence[str] = ()):
+        if request not in REQUEST_SCHEMAS:
+            raise ValueError(f"request must be one of {list(REQUEST_SCHEMAS)}")
+        module, class_name = split_path(analyzer, "ClassName")
+        split_path(job, "function")
+        if tracer is not None:
+            split_path(tracer, "function")
+        self.name = name
+        self.analyzer = analyzer
+        self.module = module
+        self.class_name = class_name
+        self.request = request
+        self.job = job
+        self.tracer = tracer
+        self.arguments = list(arguments)
+        self.trace_arguments = list(trace_arguments)
+        self.shared_data = shared_data
+        self.info = info
+        self.summary = summary
+        self.pattern = pattern
+        self.features = list(features)
+        self.blind75 = list(blind75)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "endpoint": f"/analyze/{self.name}",
+            "request": self.request,
+            "analyzer": self.analyzer,
+            "streamable": self.tracer is not None,
+            "pattern": self.pattern,
+            **self.info
+        }
+
+class AlgorithmRegistry:
+    """Registered plugins in registration order, with one shared analyzer instance per class"""
+
+    def __init__(self):
+        self._plugins: Dict[str, AlgorithmPlugin] = {}
+        self._patterns: Dict[str, List[str]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._functions: Dict[str, Callable[..., Any]] = {}
+        self._lock = threading.Lock()
+
+    def pattern(self, name: str, real_world: Sequence[str]) -> None:
+        """Declare a DSA pattern and its real-world applications"""
+        self._patterns[name] = list(real_world)
+
+    def register(self, plugin: AlgorithmPlugin) -> AlgorithmPlugin:
+        if plugin.name in self._plugins:
+            raise ValueError(f"Algorithm '{plugin.name}' is already registered")
+        if plugin.pattern not in self._patterns:
+            raise ValueError(f"Unknown pattern '{plugin.pattern}' - declare it with pattern() first")
+        self._plugins[plugin.name] = plugin
+        return plugin
+
+    def get(self, name: str) -> AlgorithmPlugin:
+        return self._plugins[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._plugins
+
+    def __iter__(self) -> Iterator[AlgorithmPlugin]:
+        return iter(list(self._plugins.values()))
+
+    def analyzer(self, name: str) -> Any:
+        """The analyzer instance for an algorithm, importing its module on first use"""
+        path = self._plugins[name].analyzer
+        instance = self._instances.get(path)
+        if instance is None:
+            # Worker threads may ask for the same analyzer concurrently
+            with self._lock:
+                instance = self._instances.get(path)
+                if instance is None:
+                    plugin = self._plugins[name]
+                    analyzer_class = getattr(importlib.import_module(plugin.module), plugin.class_name)
+                    instance = self._instances[path] = analyzer_class()
+        return instance
+
+    def _function(self, path: str) -> Callable[..., Any]:
+        function = self._functions.get(path)
+        if function is None:
+            module, attribute = split_path(path, "function")
+            function = self._functions[path] = getattr(importlib.import_module(module), attribute)
+        return function
+
+    def job(self, name: str) -> Callable[..., Any]:
+        """The pool job of an algorithm, importing its module on first use"""
+        return self._function(self._plugins[name].job)
+
+    def tracer(self, name: str) -> Callable[..., Any]:
+        """The stream tracer of an algorithm (KeyError if it has none)"""
+        tracer = self._plugins[name].tracer
+        if tracer is None:
+            raise KeyError(name)
+        return self._function(tracer)
+
+    def is_loaded(self, name: str) -> bool:
+        return self._plugins[name].analyzer in self._instances
+
+    def preload(self, names: Sequence[str]) -> None:
+        """Import analyzers ahead of their first request"""
+        for name in names:
+            self.analyzer(name)
+
+    def mapping(self) -> Dict[str, Any]:
+        """DSA pattern to feature mapping, grouped in pattern declaration order"""
+        patterns = []
+        for pattern, real_world in self._patterns.items():
+            plugins = [plugin for plugin in self._plugins.values() if plugin.pattern == pattern]
+            if not plugins:
+                continue
+            patterns.append({
+                "pattern": pattern,
+                "features": [feature for plugin in plugins for feature in plugin.features],
+                "real_world": real_world,
+                "blind75": [problem for plugin in plugins for problem in plugin.blind75],
+                "algorithms": [plugin.name for plugin in plugins]
+            })
+        return {"patterns": patterns}
+
+registry = AlgorithmRegistry()
+
+registry.pattern("Hash Set/Map", ["Database Deduplication", "Spam Detection", "Log Analysis"])
+registry.pattern("Two Pointers/Complement", ["Recommendation Systems", "Financial Analysis"])
+registry.pattern("Prefix/Suffix Arrays", ["Stock Analysis", "Performance Metrics"])
+registry.pattern("Union Find/Consecutive", ["Social Networks", "System Dependencies"])
+registry.pattern("String Processing", ["API Design", "Data Storage"])
+
+registry.register(AlgorithmPlugin(
+    "duplicates", "algorithms.arrays.duplicate_detector:DuplicateDetector", "numeric",
+    info={
+        "algorithm": "Contains Duplicate (Hash Set)",
+        "complexity": {"time": "O(n)", "space": "O(n)"},
+        "explanation": "Uses hash set to track seen elements in single pass"
+    },
+    summary="Detect duplicates in numeric array",
+    job="services.jobs:run_duplicates", tracer="services.jobs:trace_duplicates",
+    arguments=["engine"], shared_data=True,
+    pattern="Hash Set/Map", features=["Duplicate Detection"], blind75=["Contains Duplicate"]
+))
+registry.register(AlgorithmPlugin(
+    "anagrams", "algorithms.arrays.anagram_analyzer:AnagramAnalyzer", "strings",
+    info={
+        "algorithm": "Valid Anagram (Frequency Count)",
+        "complexity": {"time": "O(n*m log m)", "space": "O(n*m)"},
+        "explanation": "Groups strings by sorted character frequency"
+    },
+    summary="Analyze anagrams in string array",
+    job="services.jobs:run_anagrams", tracer="services.jobs:trace_anagrams",
+    arguments=["key"], trace_arguments=["key"],
+    pattern="Hash Set/Map", features=["Anagram Analysis"], blind75=["Valid Anagram", "Group Anagrams"]
+))
+registry.register(AlgorithmPlugin(
+    "frequency", "algorithms.arrays.frequency_insights:FrequencyInsights", "numeric",
+    info={
+        "algorithm": "Top K Frequent Elements (Heap)",
+        "complexity": {"time": "O(n log k)", "space": "O(n + k)"},
+        "explanation": "Uses frequency counter and min-heap for efficient top-K selection"
+    },
+    summary="Find top K frequent elements",
+    job="services.jobs:run_frequency", tracer="services.jobs:trace_frequency",
+    arguments=["k", "strategy"], trace_arguments=["k", "trace_strategy"], shared_data=True,
+    pattern="Hash Set/Map", features=["Frequency Counting"]
+))
+registry.register(AlgorithmPlugin(
+    "pairs", "algorithms.arrays.pair_calculator:PairCalculator", "numeric",
+    info={
+        "algorithm": "Two Sum (Hash Map)",
+        "complexity": {"time": "O(n)", "space": "O(n)"},
+        "explanation": "Uses hash map to find complement in single pass"
+    },
+    summary="Find two sum pairs, every pair, pair counts, many targets at once or k-Sum combinations",
+    job="services.jobs:run_pairs", tracer="services.jobs:trace_pairs",
+    arguments=["pair_mode"], trace_arguments=["target"],
+    pattern="Two Pointers/Complement", features=["Pair Finding", "Pair Counting", "Multi-Target Search", "k-Sum"],
+    blind75=["Two Sum", "3Sum"]
+))
+registry.register(AlgorithmPlugin(
+    "products", "algorithms.arrays.pair_calculator:PairCalculator", "numeric",
+    info={
+        "algorithm": "Product of Array Except Self",
+        "complexity": {"time": "O(n)", "space": "O(1)"},
+        "explanation": "Uses left and right pass to calculate products without division"
+    },
+    summary="Calculate product of array except self",
+    job="services.jobs:run_products", tracer="services.jobs:trace_products",
+    arguments=["product_mode"],
+    pattern="Prefix/Suffix Arrays", features=["Product Calculations", "Range Queries"],
+    blind75=["Product of Array Except Self"]
+))
+registry.register(AlgorithmPlugin(
+    "sequences", "algorithms.arrays.sequence_tracker:SequenceTracker", "numeric",
+    info={
+        "algorithm": "Longest Consecutive Sequence (Hash Set)",
+        "complexity": {"time": "O(n)", "space": "O(n)"},
+        "explanation": "Uses hash set to identify sequence starts and extend efficiently"
+    },
+    summary="Find longest consecutive sequence",
+    job="services.jobs:run_sequences", tracer="services.jobs:trace_sequences",
+    shared_data=True,
+    pattern="Union Find/Consecutive", features=["Sequence Detection", "Graph Components"],
+    blind75=["Longest Consecutive Sequence"]
+))
+registry.register(AlgorithmPlugin(
+    "encoding", "algorithms.strings.encoder_decoder:EncoderDecoder", "strings",
+    info={
+        "algorithm": "Encode/Decode Strings (Length Prefix)",
+        "complexity": {"time": "O(n)", "space": "O(n)"},
+        "explanation": "Uses length prefix encoding to handle arbitrary delimiters safely"
+    },
+    summary="Encode and decode strings safely",
+    job="services.jobs:run_encoding", tracer="services.jobs:trace_encoding",
+    arguments=["codec"], trace_arguments=["codec"],
+    pattern="String Processing", features=["Safe Encoding", "Data Serialization"],
+    blind75=["Encode and Decode Strings"]
+))
@@ -2,18 +2,40 @@
 String Encoding/Decoding - Encode and Decode Strings
 Time Complexity: O(n), Space Complexity: O(n)
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple, Union
+import base64
+import mmap
+import struct
+from ..trace import Trace, TracedAnalyzer
 
-class EncoderDecoder:
+# Codecs: "string" is the classic len#str over characters; "utf8" is len#str
+# over UTF-8 bytes; "binary" uses a fixed-width big-endian uint32 length header
+CODECS = ("string", "utf8", "binary")
+BINARY_HEADER = struct.Struct(">I")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+def _searchable(data: Buffer) -> Any:
+    """
+    An object with find() over exactly the bytes of data, without copying:
+    data itself, or the bytes/bytearray/mmap a whole-buffer memoryview
+    wraps; None when the view is a slice or cast of its exporter
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    exporter = data.obj
+    if (data.format == "B" and data.c_contiguous and isinstance(exporter, (bytes, bytearray, mmap.mmap))
+            and len(exporter) == data.nbytes):
+        return exporter
+    return None
+
+class EncoderDecoder(TracedAnalyzer):
     def encode(self, strs: List[str]) -> str:
         """
         Encode list of strings using length prefix
         Format: "length#string" for each string
         """
-        encoded = ""
-        for s in strs:
-            encoded += str(len(s)) + "#" + s
-        return encoded
+        return "".join([f"{len(s)}#{s}" for s in strs])
     
     def decode(self, s: str) -> List[str]:
         """
@@ -40,104 +62,236 @@ class EncoderDecoder:
             i = end
         
         return result
+
+    def encode_bytes(self, strs: List[str], codec: str = "utf8") -> bytes:
+        """
+        Encode strings to bytes with "utf8" (len#bytes) or "binary" (uint32 header) framing
+        Headers and payloads are joined once into a single preallocated buffer.
+        """
+        if codec == "binary":
+            pack = BINARY_HEADER.pack
+        elif codec == "utf8":
+            pack = b"%d#".__mod__
+        else:
+            raise ValueError(f"Unknown byte codec '{codec}', expected 'utf8' or 'binary'")
+
+        parts = []
+        append = parts.append
+        for s in strs:
+            payload = s.encode("utf-8")
+            append(pack(len(payload)))
+            append(payload)
+        return b"".join(parts)
+
+    def iter_frames(self, data: Buffer, codec: str = "utf8") -> Iterator[Tuple[int, int]]:
+        """
+        Yield the (start, end) payload offsets of each frame
+        Raises ValueError on a malformed or truncated frame.
+        """
+        if codec == "binary":
+            unpack_from = BINARY_HEADER.unpack_from
+            header_size = BINARY_HEADER.size
+            size = len(memoryview(data))
+            i = 0
+            while i < size:
+                if i + header_size > size:
+                    raise ValueError(f"Truncated length header at offset {i}")
+                start = i + header_size
+                i = start + unpack_from(data, start - header_size)[0]
+                if i > size:
+                    raise ValueError(f"Truncated payload at offset {start}: expected {i - start} bytes")
+                yield start, i
+            return
+
+        # Headers are searched in place; payloads are never copied
+        searchable = _searchable(data)
+        view = memoryview(data)
+        size = view.nbytes
+        i = 0
+        while i < size:
+            if searchable is not None:
+                delimiter_pos = searchable.find(b"#", i, i + 21)
+                digits = searchable[i:delimiter_pos] if delimiter_pos > i else b""
+            else:
+                # Only the (at most 21 byte) header window is copied out of the view
+                window = view[i:i + 21].tobytes()
+                delimiter_pos = window.find(b"#")
+                digits = window[:delimiter_pos] if delimiter_pos > 0 else b""
+                delimiter_pos += i
+            if not digits.isdigit():
+                raise ValueError(f"Malformed length prefix at offset {i}")
+            start = delimiter_pos + 1
+            i = start + int(digits)
+            if i > size:
+                raise ValueError(f"Truncated payload at offset {start}: expected {i - start} bytes")
+            yield start, i
+
+    def iter_decode_bytes(self, data: Buffer, codec: str = "utf8") -> Iterator[memoryview]:
+        """Lazily decode frames as zero-copy memoryview slices of data"""
+        view = memoryview(data)
+        for start, end in self.iter_frames(data, codec):
+            yield view[start:end]
+
+    def decode_bytes(self, data: Buffer, codec: str = "utf8") -> List[str]:
+        """Decode a byte-encoded buffer back to strings"""
+        view = memoryview(data)
+        return [str(view[start:end], "utf-8") for start, end in self.iter_frames(data, codec)]
+
+    def round_trip(self, strs: List[str], codec: str = "string") -> Dict[str, Any]:
+        """Encode then decode strs with the given codec, without tracing"""
+        if codec == "string":
+            encoded = self.encode(strs)
+            return _round_trip_result(strs, encoded, self.decode(encoded), codec)
+        encoded = self.encode_bytes(strs, codec)
+        return _round_trip_result(strs, encoded, self.decode_bytes(encoded, codec), codec)
     
-    def get_steps(self, strs: List[str]) -> List[str]:
-        """Generate step-by-step explanation"""
-        steps = []
-        steps.append(f"Input strings: {strs}")
-        
-        # Encoding steps
-        steps.append("\nEncoding process:")
-        encoded = ""
+    def trace(self, strs: List[str], codec: str = "string") -> Trace:
+        """
+        Single instrumented encode/decode round trip
+        Positions and lengths are in characters for the "string" codec and in
+        bytes for the byte codecs.
+        """
+        trace = Trace("encode_decode", strs, self)
+        trace.state["codec"] = codec
+
+        if codec != "string":
+            encoded = self.encode_bytes(strs, codec)
+            position = 0
+            for i, s in enumerate(strs):
+                length = len(s.encode("utf-8"))
+                prefix = f"[{length}]" if codec == "binary" else f"{length}#"
+                header_size = BINARY_HEADER.size if codec == "binary" else len(prefix)
+                trace.emit("encode", string_index=i, original=s, length=length, prefix=prefix, position=position)
+                position += header_size + length
+
+            decoded = []
+            for start, end in self.iter_frames(encoded, codec):
+                decoded.append(str(memoryview(encoded)[start:end], "utf-8"))
+                trace.emit("decode", string_index=len(decoded) - 1, length=end - start, start=start, end=end)
+
+            trace.result = _round_trip_result(strs, encoded, decoded, codec)
+            return trace
+
+        # Encoding
+        parts = []
+        position = 0
         for i, s in enumerate(strs):
             prefix = str(len(s)) + "#"
-            encoded += prefix + s
-            steps.append(f"String {i+1}: '{s}' -> length={len(s)} -> '{prefix}{s}'")
-        
-        steps.append(f"Final encoded string: '{encoded}'")
-        
-        # Decoding steps
-        steps.append("\nDecoding process:")
-        result = []
+            parts.append(prefix + s)
+            trace.emit("encode", string_index=i, original=s, length=len(s), prefix=prefix, position=position)
+            position += len(prefix) + len(s)
+        encoded = "".join(parts)
+
+        # Decoding
+        decoded = []
         i = 0
-        string_num = 1
-        
         while i < len(encoded):
             delimiter_pos = encoded.find('#', i)
             if delimiter_pos == -1:
                 break
-            
+
             length = int(encoded[i:delimiter_pos])
             start = delimiter_pos + 1
             end = start + length
-            decoded_string = encoded[start:end]
-            result.append(decoded_string)
-            
-            steps.append(f"String {string_num}: length={length} -> extract '{decoded_string}' from position {start} to {end-1}")
-            
+            decoded.append(encoded[start:end])
+            trace.emit("decode", string_index=len(decoded) - 1, length=length, start=start, end=end)
+
             i = end
-            string_num += 1
-        
-        steps.append(f"Final decoded strings: {result}")
-        steps.append(f"Encoding/Decoding successful: {result == strs}")
-        
-        return steps
-    
-    def get_visualization_data(self, strs: List[str]) -> Dict[str, Any]:
+
+        trace.result = _round_trip_result(strs, encoded, decoded, codec)
+        return trace
+
+    def get_steps(self, strs: List[str], codec: str = "string") -> List[str]:
+        """Generate step-by-step explanation"""
+        return self.trace(strs, codec).steps()
+
+    def get_visualization_data(self, strs: List[str], codec: str = "string") -> Dict[str, Any]:
         """Generate data for visualization"""
-        encoded = self.encode(strs)
-        decoded = self.decode(encoded)
-        
+        return self.trace(strs, codec).visualization()
+
+    def iter_steps(self, trace: Trace) -> Iterator[str]:
+        """Render steps from the trace events"""
+        encoded = trace.result["encoded"]
+        decoded = trace.result["decoded"]
+
+        yield f"Input strings: {trace.input}"
+
+        # Encoding steps
+        yield "\nEncoding process:"
+        for event in trace.events_of("encode"):
+            s = event["original"]
+            yield f"String {event['string_index']+1}: '{s}' -> length={event['length']} -> '{event['prefix']}{s}'"
+
+        if trace.state["codec"] == "string":
+            yield f"Final encoded string: '{encoded}'"
+        else:
+            yield f"Final encoded bytes ({trace.result['encoded_size']} bytes, base64): '{encoded}'"
+
+        # Decoding steps
+        yield "\nDecoding process:"
+        for event in trace.events_of("decode"):
+            decoded_string = decoded[event["string_index"]]
+            yield f"String {event['string_index']+1}: length={event['length']} -> extract '{decoded_string}' from position {event['start']} to {event['end']-1}"
+
+        yield f"Final decoded strings: {decoded}"
+        yield f"Encoding/Decoding successful: {trace.result['valid']}"
+
+    def render_visualization(self, trace: Trace) -> Dict[str, Any]:
+        """Render visualization data from the trace events"""
+        strs = trace.input
+        encoded = trace.result["encoded"]
+        decoded = trace.result["decoded"]
+
+        codec = trace.state["codec"]
+        encoded_length = len(encoded) if codec == "string" else trace.result["encoded_size"]
+        payload_length = sum(event["length"] for event in trace.events_of("encode"))
+
         # Track encoding process
         encoding_steps = []
-        current_pos = 0
-        
-        for i, s in enumerate(strs):
-            prefix = str(len(s)) + "#"
+        for event in trace.events_of("encode"):
+            s = event["original"]
+            encoded_part = event["prefix"] + s
+            header_size = BINARY_HEADER.size if codec == "binary" else len(event["prefix"])
             encoding_steps.append({
-                "string_index": i,
+                "string_index": event["string_index"],
                 "original": s,
-                "length": len(s),
-                "prefix": prefix,
-                "encoded_part": prefix + s,
-                "position": current_pos,
-                "end_position": current_pos + len(prefix + s)
+                "length": event["length"],
+                "prefix": event["prefix"],
+                "encoded_part": encoded_part,
+                "position": event["position"],
+                "end_position": event["position"] + header_size + event["length"]
             })
-            current_pos += len(prefix + s)
-        
+
         # Track decoding process
         decoding_steps = []
-        i = 0
-        string_num = 0
-        
-        while i < len(encoded) and string_num < len(strs):
-            delimiter_pos = encoded.find('#', i)
-            if delimiter_pos == -1:
+        for event in trace.events_of("decode"):
+            if event["string_index"] >= len(strs):
                 break
-            
-            length = int(encoded[i:delimiter_pos])
-            start = delimiter_pos + 1
-            end = start + length
-            decoded_string = encoded[start:end]
-            
             decoding_steps.append({
-                "string_index": string_num,
-                "length": length,
-                "start_pos": start,
-                "end_pos": end,
-                "decoded": decoded_string
+                "string_index": event["string_index"],
+                "length": event["length"],
+                "start_pos": event["start"],
+                "end_pos": event["end"],
+                "decoded": decoded[event["string_index"]]
             })
-            
-            i = end
-            string_num += 1
-        
+
         return {
             "input": strs,
             "encoded": encoded,
             "decoded": decoded,
-            "is_valid": decoded == strs,
+            "is_valid": trace.result["valid"],
             "encoding_steps": encoding_steps,
             "decoding_steps": decoding_steps,
-            "encoded_length": len(encoded),
-            "compression_ratio": len(encoded) / sum(len(s) for s in strs) if strs else 1
-        }
\ No newline at end of file
+            "codec": codec,
+            "encoded_length": encoded_length,
+            "compression_ratio": encoded_length / payload_length if payload_length else 1
+        }
+
+def _round_trip_result(strs: List[str], encoded: Union[str, Buffer], decoded: List[str], codec: str) -> Dict[str, Any]:
+    """Round-trip result; byte encodings are reported as base64 for JSON"""
+    result = {"encoded": encoded, "decoded": decoded, "valid": decoded == strs}
+    if codec != "string":
+        result["encoded"] = base64.b64encode(encoded).decode("ascii")
+        result["codec"] = codec
+        result["encoded_size"] = len(encoded)
+    return result
\ No newline at end of file
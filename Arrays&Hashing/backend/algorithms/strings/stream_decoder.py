@@ -0,0 +1,107 @@
+"""
+Incremental Decoding - Length-prefixed frames over byte streams
+Decodes the "utf8" (len#bytes) and "binary" (uint32 header) encodings of
+EncoderDecoder as chunks arrive from a socket or file, buffering partial
+headers and payloads between calls with a bounded buffer.
+"""
+from typing import List, Optional, Tuple, AsyncIterable, AsyncIterator, Iterable, Iterator, Union
+from .encoder_decoder import BINARY_HEADER
+
+DEFAULT_MAX_FRAME_SIZE = 16 << 20  # bytes per payload
+MAX_LENGTH_DIGITS = 20  # longest decimal length prefix accepted by the utf8 codec
+
+class FrameError(ValueError):
+    """Malformed, oversized or truncated frame in an encoded stream"""
+
+class StreamDecoder:
+    def __init__(self, codec: str = "utf8", max_frame_size: int = DEFAULT_MAX_FRAME_SIZE):
+        if codec not in ("utf8", "binary"):
+            raise ValueError(f"Unknown stream codec '{codec}', expected 'utf8' or 'binary'")
+        self.codec = codec
+        self.max_frame_size = max_frame_size
+        self.frames_decoded = 0
+        self._buffer = bytearray()
+
+    @property
+    def pending(self) -> int:
+        """Bytes of an incomplete frame currently buffered"""
+        return len(self._buffer)
+
+    @property
+    def max_buffer_size(self) -> int:
+        """Upper bound on the buffer: one header plus one maximum-size payload"""
+        header_size = BINARY_HEADER.size if self.codec == "binary" else MAX_LENGTH_DIGITS + 1
+        return header_size + self.max_frame_size
+
+    def feed(self, chunk: Union[bytes, bytearray, memoryview]) -> List[str]:
+        """
+        Consume a chunk and return every string completed by it
+        Oversized frames are rejected as soon as their header is read, so at
+        most max_buffer_size bytes are retained between calls.
+        """
+        buffer = self._buffer
+        buffer += chunk
+        decoded = []
+        offset = 0
+        size = len(buffer)
+
+        with memoryview(buffer) as view:
+            while offset < size:
+                start, length = self._read_header(buffer, offset, size)
+                if start is None:
+                    break
+                end = start + length
+                if end > size:
+                    break
+                try:
+                    decoded.append(str(view[start:end], "utf-8"))
+                except UnicodeDecodeError as e:
+                    raise FrameError(f"Frame {self.frames_decoded} is not valid UTF-8: {e}")
+                self.frames_decoded += 1
+                offset = end
+
+        # Only the incomplete tail frame is kept
+        del buffer[:offset]
+        return decoded
+
+    def close(self) -> None:
+        """Signal end of stream, raising FrameError if a frame was left incomplete"""
+        if self._buffer:
+            raise FrameError(f"Stream ended inside frame {self.frames_decoded} ({len(self._buffer)} bytes buffered)")
+
+    def decode_all(self, chunks: Iterable[Union[bytes, bytearray, memoryview]]) -> Iterator[str]:
+        """Decode a synchronous chunk iterator"""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        self.close()
+
+    async def adecode_all(self, chunks: AsyncIterable[Union[bytes, bytearray, memoryview]]) -> AsyncIterator[str]:
+        """Decode an async chunk iterator (e.g. a request body or socket reader)"""
+        async for chunk in chunks:
+            for s in self.feed(chunk):
+                yield s
+        self.close()
+
+    def _read_header(self, buffer: bytearray, offset: int, size: int) -> Tuple[Optional[int], int]:
+        """(payload start, length) of the frame at offset, or (None, 0) if its header is incomplete"""
+        if self.codec == "binary":
+            if offset + BINARY_HEADER.size > size:
+                return None, 0
+            (length,) = BINARY_HEADER.unpack_from(buffer, offset)
+            start = offset + BINARY_HEADER.size
+        else:
+            delimiter_pos = buffer.find(b"#", offset, offset + MAX_LENGTH_DIGITS + 1)
+            if delimiter_pos == -1:
+                tail = buffer[offset:size]
+                if len(tail) > MAX_LENGTH_DIGITS or not tail.isdigit():
+                    raise FrameError(f"Malformed length prefix in frame {self.frames_decoded}")
+                return None, 0
+            digits = buffer[offset:delimiter_pos]
+            if not digits.isdigit():
+                raise FrameError(f"Malformed length prefix in frame {self.frames_decoded}")
+            length = int(digits)
+            start = delimiter_pos + 1
+
+        if length > self.max_frame_size:
+            raise FrameError(f"Frame {self.frames_decoded} is {length} bytes, exceeding max_frame_size={self.max_frame_size}")
+        return start, length
@@ -0,0 +1,108 @@
+"""
+Trace Engine - Single-pass instrumented execution shared by all analyzers
+An analyzer runs its algorithm once and records structured events; the
+step-by-step text and the visualization payload are both rendered from that
+one record instead of re-running the algorithm.
+"""
+from typing import List, Dict, Any, Iterator
+from collections import deque
+
+class Trace:
+    """Result and event stream of one algorithm execution"""
+
+    def __init__(self, algorithm: str, input_data: Any, renderer: "TracedAnalyzer"):
+        self.algorithm = algorithm
+        self.input = input_data
+        self.renderer = renderer
+        self.result: Any = None
+        self.events: List[Dict[str, Any]] = []
+        # Derived structures (counters, sets, prefix arrays) built during the run
+        self.state: Dict[str, Any] = {}
+
+    def emit(self, event: str, **data: Any) -> None:
+        """Record a structured event"""
+        data["event"] = event
+        self.events.append(data)
+
+    def events_of(self, *kinds: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over events of the given kinds in execution order"""
+        for event in self.events:
+            if event["event"] in kinds:
+                yield event
+
+    def iter_steps(self) -> Iterator[str]:
+        """Lazily render the step-by-step explanation"""
+        return self.renderer.iter_steps(self)
+
+    def steps(self) -> List[str]:
+        """Render the full step-by-step explanation"""
+        return list(self.iter_steps())
+
+    def visualization(self) -> Dict[str, Any]:
+        """Render the visualization payload"""
+        return self.renderer.render_visualization(self)
+
+class TracedAnalyzer:
+    """
+    Base for analyzers whose explanations are rendered from a Trace
+    Subclasses produce traces from their trace methods and implement the two
+    renderers, dispatching on trace.algorithm when they host several algorithms.
+    """
+
+    def iter_steps(self, trace: Trace) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render_visualization(self, trace: Trace) -> Dict[str, Any]:
+        raise NotImplementedError
+
+# Detail levels for API responses: "result" skips tracing entirely,
+# "summary" caps the rendered steps, "full" renders everything
+DETAIL_LEVELS = ("result", "summary", "full")
+SUMMARY_MAX_STEPS = 50
+SUMMARY_TAIL_STEPS = 3
+
+def summarize_steps(steps: Iterator[str], max_steps: int = SUMMARY_MAX_STEPS,
+                    tail: int = SUMMARY_TAIL_STEPS) -> List[str]:
+    """
+    Keep the first max_steps steps plus the last few (which carry the final
+    result), replacing the middle with a single omission marker
+    Memory stays bounded regardless of how many steps the trace renders.
+    """
+    head = []
+    last = deque(maxlen=tail)
+    omitted = 0
+
+    for step in steps:
+        if len(head) < max_steps:
+            head.append(step)
+            continue
+        if len(last) == tail:
+            omitted += 1
+        last.append(step)
+
+    if omitted:
+        head.append(f"... {omitted} steps omitted ...")
+    head.extend(last)
+    return head
+
+
+# Delta-encoded traces: frames record only what changed, and a bounded number
+# of full-state checkpoints give random access, keeping traces O(n) in size
+MAX_CHECKPOINTS = 16
+MIN_CHECKPOINT_INTERVAL = 64
+
+def checkpoint_interval(total_steps: int) -> int:
+    """Steps between checkpoints so at most MAX_CHECKPOINTS are taken"""
+    return max(MIN_CHECKPOINT_INTERVAL, -(-total_steps // MAX_CHECKPOINTS))
+
+def restore_state(frames: List[Dict[str, Any]], checkpoints: List[Dict[str, Any]], step: int,
+                  delta_key: str = "delta", state_key: str = "state") -> Dict[Any, Any]:
+    """
+    Rebuild the mapping state as it was before frames[step] by starting from
+    the nearest earlier checkpoint and applying the recorded deltas
+    """
+    base = max((cp for cp in checkpoints if cp["step"] <= step), key=lambda cp: cp["step"])
+    state = dict(base[state_key])
+    for frame in frames[base["step"]:step]:
+        state.update(frame[delta_key])
+    return state
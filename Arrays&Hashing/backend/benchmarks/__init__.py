@@ -0,0 +1,4 @@
+"""
+Scaling Benchmarks - Size sweeps, growth fits and regression comparison
+Run `python -m benchmarks run` from the backend directory; see __main__.
+"""
@@ -0,0 +1,83 @@
+"""
+Benchmark CLI - python -m benchmarks (run from the backend directory)
+
+    python -m benchmarks run [--quick] [--sizes 1000 2000 ...] [--output results.json]
+    python -m benchmarks compare baseline.json current.json [--threshold 1.25]
+
+`run` writes the JSON report to --output (stdout by default) and prints
+progress to stderr; `compare` prints the regressions and exits with status 1
+when there are any.
+"""
+import argparse
+import json
+import sys
+
+from . import compare, suite
+
+def run(args: argparse.Namespace) -> int:
+    sizes = args.sizes or (suite.QUICK_SIZES if args.quick else suite.DEFAULT_SIZES)
+    repeat = args.repeat or (1 if args.quick else suite.DEFAULT_REPEAT)
+    progress = (lambda line: print(line, file=sys.stderr, flush=True)) if not args.silent else (lambda line: None)
+    options = dict(sizes=sorted(sizes), repeat=repeat, max_seconds=args.max_seconds,
+                   names=args.only, distributions=args.distributions, progress=progress)
+
+    results = []
+    if not args.endpoints_only:
+        results += suite.run_analyzers(**options)
+    if not args.analyzers_only:
+        results += suite.run_endpoints(**options)
+
+    report = {
+        "environment": suite.environment(),
+        "settings": {"sizes": sorted(sizes), "repeat": repeat, "max_seconds": args.max_seconds},
+        "results": results
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+def compare_reports(args: argparse.Namespace) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    diff = compare.compare(baseline, current, args.threshold)
+    print(json.dumps(diff if args.all else {k: v for k, v in diff.items() if k != "sweeps"}, indent=2))
+    return 1 if diff["regressions"] else 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="SmartPack scaling benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the size sweeps and emit a JSON report")
+    run_parser.add_argument("--sizes", type=int, nargs="+", help=f"Input sizes (default {list(suite.DEFAULT_SIZES)})")
+    run_parser.add_argument("--quick", action="store_true", help=f"Small sizes {list(suite.QUICK_SIZES)}, one run each")
+    run_parser.add_argument("--repeat", type=int, help=f"Timed runs per size (default {suite.DEFAULT_REPEAT})")
+    run_parser.add_argument("--max-seconds", type=float, default=suite.DEFAULT_MAX_SECONDS,
+                            help="Stop a sweep once one run exceeds this")
+    run_parser.add_argument("--only", nargs="+", help="Analyzer names or endpoint path fragments to run")
+    run_parser.add_argument("--distributions", nargs="+", help="Distributions to run")
+    scope = run_parser.add_mutually_exclusive_group()
+    scope.add_argument("--analyzers-only", action="store_true")
+    scope.add_argument("--endpoints-only", action="store_true")
+    run_parser.add_argument("--output", "-o", help="Write the report here instead of stdout")
+    run_parser.add_argument("--silent", action="store_true", help="No progress on stderr")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="Compare two reports and list regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=compare.DEFAULT_THRESHOLD,
+                                help="Time ratio counted as a regression")
+    compare_parser.add_argument("--all", action="store_true", help="Include every sweep's ratios")
+    compare_parser.set_defaults(handler=compare_reports)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
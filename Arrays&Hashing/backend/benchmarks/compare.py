@@ -0,0 +1,54 @@
+"""
+Benchmark Comparison - Regressions between two benchmark JSON files
+Matches sweeps by (kind, target, distribution, phase) and flags sizes whose
+best time grew by more than the threshold ratio, and sweeps whose fitted
+growth model moved to a faster-growing class.
+"""
+from typing import Any, Dict, List, Tuple
+
+from . import growth
+
+DEFAULT_THRESHOLD = 1.25
+
+SweepKey = Tuple[str, str, str, str]
+
+def index(report: Dict[str, Any]) -> Dict[SweepKey, Dict[str, Any]]:
+    return {(r["kind"], r["target"], r["distribution"], r["phase"]): r for r in report["results"]}
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> Dict[str, Any]:
+    """Per-sweep time ratios (current / baseline) and the regressions among them"""
+    before, after = index(baseline), index(current)
+    sweeps: List[Dict[str, Any]] = []
+    regressions: List[Dict[str, Any]] = []
+
+    for key in before.keys() & after.keys():
+        old_times = {t["n"]: t["min"] for t in before[key]["timings"]}
+        ratios = {t["n"]: t["min"] / old_times[t["n"]]
+                  for t in after[key]["timings"] if old_times.get(t["n"])}
+        old_fit, new_fit = before[key].get("fit"), after[key].get("fit")
+        entry = {
+            "kind": key[0], "target": key[1], "distribution": key[2], "phase": key[3],
+            "ratios": {n: round(ratio, 3) for n, ratio in sorted(ratios.items())},
+            "model": [old_fit and old_fit["model"], new_fit and new_fit["model"]]
+        }
+        sweeps.append(entry)
+
+        slower = [n for n, ratio in ratios.items() if ratio > threshold]
+        # Only the largest sizes are stable enough to call a regression alone
+        largest = max(ratios, default=None)
+        model_worse = (old_fit and new_fit
+                       and growth.order(new_fit["model"]) > growth.order(old_fit["model"]))
+        if (largest is not None and largest in slower) or model_worse:
+            regressions.append(dict(entry, slower_sizes=sorted(slower), model_regressed=bool(model_worse)))
+
+    sort_key = lambda entry: (entry["kind"], entry["target"], entry["distribution"], entry["phase"])
+    return {
+        "threshold": threshold,
+        "baseline_commit": baseline.get("environment", {}).get("commit"),
+        "current_commit": current.get("environment", {}).get("commit"),
+        "only_in_baseline": sorted(" / ".join(key) for key in before.keys() - after.keys()),
+        "only_in_current": sorted(" / ".join(key) for key in after.keys() - before.keys()),
+        "sweeps": sorted(sweeps, key=sort_key),
+        "regressions": sorted(regressions, key=sort_key)
+    }
@@ -0,0 +1,70 @@
+"""
+Benchmark Datasets - Seeded input generators for the scaling benchmarks
+Numeric distributions exercise the hash-based analyzers at their extremes
+(all distinct, heavy duplication, long consecutive runs, Zipf-skewed
+frequencies); string distributions cover short anagram-rich words and long
+strings containing the encoder's delimiter.
+"""
+import random
+import string
+from typing import List
+
+NUMERIC_DISTRIBUTIONS = ("unique", "duplicates", "runs", "skewed")
+STRING_DISTRIBUTIONS = ("anagrams", "long_strings")
+
+# Each value of the "duplicates" distribution occurs about this many times
+DUPLICATION_FACTOR = 10
+# The "runs" distribution is this many consecutive runs, shuffled together
+RUN_COUNT = 8
+ZIPF_EXPONENT = 1.2
+LONG_STRING_LENGTH = 256
+
+def numbers(distribution: str, n: int, seed: int = 0) -> List[int]:
+    """n integers drawn from a numeric distribution"""
+    rng = random.Random(f"{distribution}:{n}:{seed}")
+    if distribution == "unique":
+        return rng.sample(range(-4 * n, 4 * n + 1), n)
+    if distribution == "duplicates":
+        distinct = max(1, n // DUPLICATION_FACTOR)
+        return [rng.randrange(distinct) for _ in range(n)]
+    if distribution == "runs":
+        run_length = max(1, -(-n // RUN_COUNT))
+        values = []
+        start = 0
+        while len(values) < n:
+            length = min(run_length, n - len(values))
+            values.extend(range(start, start + length))
+            start += length + 2  # gap so the runs stay separate
+        rng.shuffle(values)
+        return values
+    if distribution == "skewed":
+        distinct = max(1, n // 4)
+        weights = [1 / (rank + 1) ** ZIPF_EXPONENT for rank in range(distinct)]
+        return rng.choices(range(distinct), weights=weights, k=n)
+    raise ValueError(f"Unknown numeric distribution '{distribution}', expected one of {list(NUMERIC_DISTRIBUTIONS)}")
+
+def strings(distribution: str, n: int, seed: int = 0) -> List[str]:
+    """n strings drawn from a string distribution"""
+    rng = random.Random(f"{distribution}:{n}:{seed}")
+    if distribution == "anagrams":
+        # About 8 shuffled spellings of each base word
+        bases = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+                 for _ in range(max(1, n // 8))]
+        words = []
+        for _ in range(n):
+            letters = list(rng.choice(bases))
+            rng.shuffle(letters)
+            words.append("".join(letters))
+        return words
+    if distribution == "long_strings":
+        alphabet = string.ascii_lowercase + string.digits + "#"
+        return ["".join(rng.choices(alphabet, k=LONG_STRING_LENGTH)) for _ in range(n)]
+    raise ValueError(f"Unknown string distribution '{distribution}', expected one of {list(STRING_DISTRIBUTIONS)}")
+
+def signs(nums: List[int]) -> List[int]:
+    """Map values to +/-1 so exact products stay small and only the scan is measured"""
+    return [1 if num % 2 else -1 for num in nums]
+
+def missing_target(nums: List[int]) -> int:
+    """A Two Sum target no pair reaches, forcing the full scan"""
+    return 2 * max(nums, default=0) + 1
@@ -0,0 +1,82 @@
+"""
+Growth Curves - Empirical complexity fits for benchmark timings
+Each candidate model t = a + c * f(n) (a fixed overhead plus a growth term)
+is fitted by least squares on relative error, so small and large sizes
+weigh the same, and the best model is reported with its residual alongside
+the log-log slope as a model-free growth exponent.
+"""
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+MODELS: Dict[str, Callable[[float], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: n * n
+}
+
+# Relative residuals within this margin of the best are treated as ties and
+# resolved towards the slower-growing model
+TIE_MARGIN = 0.02
+
+def fit_model(sizes: Sequence[int], times: Sequence[float], model: str) -> Dict[str, float]:
+    """Non-negative overhead and coefficient of t = a + c * f(n), with the RMS relative residual"""
+    f = MODELS[model]
+    # Relative error rows: (a + c * f) / t - 1, i.e. basis u = 1/t and v = f/t
+    u = [1 / t for t in times]
+    v = [f(n) / t for n, t in zip(sizes, times)]
+    suu, svv, suv = sum(x * x for x in u), sum(x * x for x in v), sum(x * y for x, y in zip(u, v))
+    su, sv = sum(u), sum(v)
+    determinant = suu * svv - suv * suv
+    overhead = coefficient = -1.0
+    if model != "O(1)" and determinant > 1e-12 * suu * svv:
+        overhead = (su * svv - sv * suv) / determinant
+        coefficient = (sv * suu - su * suv) / determinant
+    if overhead < 0 or coefficient < 0:
+        # Best fit on one term alone
+        only_growth = sv / svv if model != "O(1)" else 0.0
+        only_overhead = su / suu
+        residual = lambda a, c: sum((a * x + c * y - 1) ** 2 for x, y in zip(u, v))
+        overhead, coefficient = min([(only_overhead, 0.0), (0.0, only_growth)], key=lambda ac: residual(*ac))
+    errors = [overhead * x + coefficient * y - 1 for x, y in zip(u, v)]
+    return {
+        "overhead": overhead,
+        "coefficient": coefficient,
+        "residual": math.sqrt(sum(e * e for e in errors) / len(errors))
+    }
+
+def growth_exponent(sizes: Sequence[int], times: Sequence[float]) -> float:
+    """Slope of log(t) against log(n)"""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in times]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+def fit(sizes: Sequence[int], times: Sequence[float]) -> Optional[Dict[str, Any]]:
+    """
+    Best-fitting model for a size sweep, or None with fewer than three
+    distinct sizes or non-positive timings
+    """
+    points = [(n, t) for n, t in zip(sizes, times) if n > 1 and t > 0]
+    if len({n for n, _ in points}) < 3:
+        return None
+    sizes, times = [n for n, _ in points], [t for _, t in points]
+
+    fits = {model: fit_model(sizes, times, model) for model in MODELS}
+    best = min(fit["residual"] for fit in fits.values())
+    model = next(model for model in MODELS if fits[model]["residual"] <= best + TIE_MARGIN)
+    return {
+        "model": model,
+        "overhead": fits[model]["overhead"],
+        "coefficient": fits[model]["coefficient"],
+        "residual": round(fits[model]["residual"], 4),
+        "exponent": round(growth_exponent(sizes, times), 3),
+        "residuals": {name: round(fit["residual"], 4) for name, fit in fits.items()}
+    }
+
+def order(model: str) -> int:
+    """Rank of a model name in increasing growth (unknown names rank last)"""
+    names: List[str] = list(MODELS)
+    return names.index(model) if model in names else len(names)
@@ -0,0 +1,276 @@
+"""
+Benchmark Suite - Size sweeps over every analyzer and /analyze endpoint
+Analyzer benchmarks time the core method separately from get_steps and
+get_visualization_data; endpoint benchmarks time full HTTP round trips
+through the app (in-process, with the result cache disabled) at the
+"result" and "full" detail levels. Every sweep is fitted with a growth
+curve.
+"""
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from algorithms.arrays.duplicate_detector import DuplicateDetector
+from algorithms.arrays.anagram_analyzer import AnagramAnalyzer
+from algorithms.arrays.frequency_insights import FrequencyInsights
+from algorithms.arrays.pair_calculator import PairCalculator
+from algorithms.arrays.sequence_tracker import SequenceTracker
+from algorithms.arrays import vectorized
+from algorithms.strings.encoder_decoder import EncoderDecoder
+from . import datasets, growth
+
+DEFAULT_SIZES = (1000, 2000, 4000, 8000, 16000)
+QUICK_SIZES = (250, 500, 1000, 2000)
+DEFAULT_REPEAT = 5
+# A phase whose single run exceeds this many seconds is not run at larger sizes
+DEFAULT_MAX_SECONDS = 5.0
+TOP_K = 10
+
+Phases = Dict[str, Callable[[], Any]]
+
+def duplicate_phases(nums: List[int]) -> Phases:
+    analyzer = DuplicateDetector()
+    return {
+        "core": lambda: analyzer.contains_duplicate(nums),
+        "get_steps": lambda: analyzer.get_steps(nums),
+        "get_visualization_data": lambda: analyzer.get_visualization_data(nums)
+    }
+
+def anagram_phases(strs: List[str]) -> Phases:
+    analyzer = AnagramAnalyzer()
+    return {
+        "core": lambda: analyzer.group_anagrams(strs),
+        "get_steps": lambda: analyzer.get_steps(strs),
+        "get_visualization_data": lambda: analyzer.get_visualization_data(strs)
+    }
+
+def frequency_phases(nums: List[int]) -> Phases:
+    analyzer = FrequencyInsights()
+    return {
+        "core": lambda: analyzer.top_k_frequent(nums, TOP_K),
+        "get_steps": lambda: analyzer.get_steps(nums, TOP_K),
+        "get_visualization_data": lambda: analyzer.get_visualization_data(nums, TOP_K)
+    }
+
+def two_sum_phases(nums: List[int]) -> Phases:
+    analyzer = PairCalculator()
+    target = datasets.missing_target(nums)
+    return {
+        "core": lambda: analyzer.two_sum(nums, target),
+        "get_steps": lambda: analyzer.get_steps(nums, target),
+        "get_visualization_data": lambda: analyzer.get_visualization_data(nums, target)
+    }
+
+def product_phases(nums: List[int]) -> Phases:
+    analyzer = PairCalculator()
+    nums = datasets.signs(nums)
+    return {
+        "core": lambda: analyzer.product_except_self(nums),
+        "get_steps": lambda: analyzer.get_product_steps(nums),
+        "get_visualization_data": lambda: analyzer.get_product_visualization_data(nums)
+    }
+
+def sequence_phases(nums: List[int]) -> Phases:
+    analyzer = SequenceTracker()
+    return {
+        "core": lambda: analyzer.longest_consecutive(nums),
+        "get_steps": lambda: analyzer.get_steps(nums),
+        "get_visualization_data": lambda: analyzer.get_visualization_data(nums)
+    }
+
+def encoding_phases(strs: List[str]) -> Phases:
+    analyzer = EncoderDecoder()
+    return {
+        "core": lambda: analyzer.decode(analyzer.encode(strs)),
+        "get_steps": lambda: analyzer.get_steps(strs),
+        "get_visualization_data": lambda: analyzer.get_visualization_data(strs)
+    }
+
+# Analyzer benchmark name -> (input kind, phase builder)
+ANALYZERS: Dict[str, Tuple[str, Callable[[list], Phases]]] = {
+    "DuplicateDetector": ("numeric", duplicate_phases),
+    "AnagramAnalyzer": ("strings", anagram_phases),
+    "FrequencyInsights": ("numeric", frequency_phases),
+    "PairCalculator.two_sum": ("numeric", two_sum_phases),
+    "PairCalculator.product_except_self": ("numeric", product_phases),
+    "SequenceTracker": ("numeric", sequence_phases),
+    "EncoderDecoder": ("strings", encoding_phases)
+}
+
+def numeric_body(algorithm: str, nums: List[int], detail: str) -> Dict[str, Any]:
+    """JSON request body for a numeric endpoint"""
+    if algorithm == "products":
+        nums = datasets.signs(nums)
+    body: Dict[str, Any] = {"numbers": nums, "options": {"detail": detail}}
+    if algorithm == "pairs":
+        body["target"] = datasets.missing_target(nums)
+    if algorithm == "frequency":
+        body["k"] = TOP_K
+    return body
+
+# Endpoint benchmark name -> (input kind, request builder(client, data, detail) -> callable)
+def _json_post(path: str, body_for: Callable[[list, str], Dict[str, Any]]):
+    def build(client, data: list, detail: str) -> Callable[[], Any]:
+        body = body_for(data, detail)
+        return lambda: _check(client.post(path, json=body))
+    return build
+
+def _binary_post(algorithm: str):
+    def build(client, data: list, detail: str) -> Callable[[], Any]:
+        from array import array
+        nums = datasets.signs(data) if algorithm == "products" else data
+        query = f"?detail={detail}"
+        if algorithm == "pairs":
+            query += f"&target={datasets.missing_target(data)}"
+        if algorithm == "frequency":
+            query += f"&k={TOP_K}"
+        content = array("q", nums).tobytes() if sys.byteorder == "little" else _little_endian(nums)
+        headers = {"content-type": "application/octet-stream"}
+        return lambda: _check(client.post(f"/analyze/{algorithm}/binary{query}", content=content, headers=headers))
+    return build
+
+def _stream_post(algorithm: str, body_for: Callable[[list, str], Dict[str, Any]]):
+    def build(client, data: list, detail: str) -> Callable[[], Any]:
+        body = body_for(data, "full")
+        return lambda: _check(client.post(f"/analyze/{algorithm}/stream", json=body))
+    return build
+
+def _decode_post(client, data: list, detail: str) -> Callable[[], Any]:
+    content = EncoderDecoder().encode_bytes(data, "utf8")
+    return lambda: _check(client.post("/analyze/encoding/decode?codec=utf8", content=content,
+                                      headers={"content-type": "application/octet-stream"}))
+
+def _little_endian(nums: List[int]) -> bytes:
+    return b"".join(num.to_bytes(8, "little", signed=True) for num in nums)
+
+def _check(response) -> Any:
+    if response.status_code != 200:
+        raise RuntimeError(f"{response.request.url} returned {response.status_code}: {response.text[:200]}")
+    return response
+
+NUMERIC_ENDPOINTS = ("duplicates", "frequency", "pairs", "products", "sequences")
+
+def endpoint_cases() -> Dict[str, Tuple[str, Callable, Tuple[str, ...]]]:
+    """Endpoint benchmark name -> (input kind, request builder, detail levels)"""
+    both, single = ("result", "full"), ("full",)
+    cases: Dict[str, Tuple[str, Callable, Tuple[str, ...]]] = {}
+    for algorithm in NUMERIC_ENDPOINTS:
+        body_for = lambda nums, detail, algorithm=algorithm: numeric_body(algorithm, nums, detail)
+        cases[f"POST /analyze/{algorithm}"] = ("numeric", _json_post(f"/analyze/{algorithm}", body_for), both)
+        cases[f"POST /analyze/{algorithm}/binary"] = ("numeric", _binary_post(algorithm), both)
+        cases[f"POST /analyze/{algorithm}/stream"] = ("numeric", _stream_post(algorithm, body_for), single)
+    for algorithm in ("anagrams", "encoding"):
+        body_for = lambda strs, detail: {"strings": strs, "options": {"detail": detail}}
+        cases[f"POST /analyze/{algorithm}"] = ("strings", _json_post(f"/analyze/{algorithm}", body_for), both)
+        cases[f"POST /analyze/{algorithm}/stream"] = ("strings", _stream_post(algorithm, body_for), single)
+    cases["POST /analyze/encoding/decode"] = ("strings", _decode_post, ("result",))
+    cases["POST /analyze/batch"] = ("numeric", _json_post("/analyze/batch", lambda nums, detail: {
+        "numbers": nums, "algorithms": ["duplicates", "frequency", "sequences"], "k": TOP_K,
+        "options": {"detail": detail}
+    }), both)
+    return cases
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Best and median wall time of repeat runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"min": min(times), "median": statistics.median(times)}
+
+def sweep(fn_for_size: Callable[[int], Callable[[], Any]], sizes: Sequence[int],
+          repeat: int, max_seconds: float) -> Dict[str, Any]:
+    """Time one phase across sizes (stopping once a run exceeds max_seconds) and fit its growth"""
+    timings = []
+    for n in sizes:
+        fn = fn_for_size(n)
+        timing = measure(fn, 1)
+        if timing["min"] <= max_seconds and repeat > 1:
+            timing = measure(fn, repeat)
+        timings.append({"n": n, "min": timing["min"], "median": timing["median"]})
+        if timing["min"] > max_seconds:
+            break
+    return {
+        "timings": timings,
+        "fit": growth.fit([t["n"] for t in timings], [t["min"] for t in timings])
+    }
+
+def input_data(kind: str, distribution: str, n: int) -> list:
+    return datasets.numbers(distribution, n) if kind == "numeric" else datasets.strings(distribution, n)
+
+def distributions_for(kind: str, selected: Optional[Sequence[str]]) -> List[str]:
+    available = datasets.NUMERIC_DISTRIBUTIONS if kind == "numeric" else datasets.STRING_DISTRIBUTIONS
+    return [d for d in available if selected is None or d in selected]
+
+def run_analyzers(sizes: Sequence[int], repeat: int, max_seconds: float,
+                  names: Optional[Sequence[str]] = None, distributions: Optional[Sequence[str]] = None,
+                  progress: Callable[[str], None] = lambda line: None) -> List[Dict[str, Any]]:
+    results = []
+    for name, (kind, build_phases) in ANALYZERS.items():
+        if names is not None and name not in names:
+            continue
+        for distribution in distributions_for(kind, distributions):
+            data = {n: input_data(kind, distribution, n) for n in sizes}
+            for phase in ("core", "get_steps", "get_visualization_data"):
+                progress(f"{name} [{distribution}] {phase}")
+                result = sweep(lambda n: build_phases(data[n])[phase], sizes, repeat, max_seconds)
+                results.append({"kind": "analyzer", "target": name, "distribution": distribution,
+                                "phase": phase, **result})
+    return results
+
+def run_endpoints(sizes: Sequence[int], repeat: int, max_seconds: float,
+                  names: Optional[Sequence[str]] = None, distributions: Optional[Sequence[str]] = None,
+                  progress: Callable[[str], None] = lambda line: None) -> List[Dict[str, Any]]:
+    # Cached responses would turn every repeat into a lookup
+    os.environ["SMARTPACK_CACHE_MAX_BYTES"] = "0"
+    from fastapi.testclient import TestClient
+    import main
+
+    results = []
+    with TestClient(main.app) as client:
+        for name, (kind, build, details) in endpoint_cases().items():
+            if names is not None and not any(selected in name for selected in names):
+                continue
+            for distribution in distributions_for(kind, distributions):
+                data = {n: input_data(kind, distribution, n) for n in sizes}
+                for detail in details:
+                    progress(f"{name} [{distribution}] detail={detail}")
+                    result = sweep(lambda n: build(client, data[n], detail), sizes, repeat, max_seconds)
+                    results.append({"kind": "endpoint", "target": name, "distribution": distribution,
+                                    "phase": f"detail={detail}", "claimed": _claimed(client, name, data[sizes[0]]),
+                                    **result})
+    return results
+
+def _claimed(client, name: str, data: list) -> Optional[str]:
+    """Time complexity the endpoint reports for itself, if any"""
+    method, path = name.split(" ", 1)
+    if path.count("/") != 2 or path == "/analyze/batch":
+        return None
+    algorithm = path.rsplit("/", 1)[1]
+    body = numeric_body(algorithm, data, "result") if algorithm in NUMERIC_ENDPOINTS else {
+        "strings": data, "options": {"detail": "result"}}
+    return client.post(path, json=body).json().get("complexity", {}).get("time")
+
+def environment() -> Dict[str, Any]:
+    """Machine and build details recorded with every run"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    numpy = vectorized.np.__version__ if vectorized.available() else None
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy,
+        "vectorize_threshold": vectorized.VECTORIZE_THRESHOLD
+    }
@@ -1,19 +1,35 @@
 """
 SmartPack Backend - FastAPI server for DSA pattern analysis
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from typing import List, Dict, Any, Callable, Optional, Tuple, Union
+import asyncio
+import functools
+import json
+import os
+import shutil
+import time
+import tempfile
 import uvicorn
 
 # Import algorithm modules
-from algorithms.arrays.duplicate_detector import DuplicateDetector
-from algorithms.arrays.anagram_analyzer import AnagramAnalyzer
-from algorithms.arrays.frequency_insights import FrequencyInsights
-from algorithms.arrays.pair_calculator import PairCalculator
-from algorithms.arrays.sequence_tracker import SequenceTracker
-from algorithms.strings.encoder_decoder import EncoderDecoder
+# Analyzer modules (and NumPy, which they pull in) and the jobs that run them
+# are imported through the algorithm registry on first use; modules only some
+# endpoints need are imported inside those endpoints
+from algorithms.arrays.anagram_keys import KEY_STRATEGIES
+from algorithms.arrays.shared import NumericDataset
+from algorithms.registry import AlgorithmPlugin, registry as algorithm_registry
+from algorithms.trace import Trace, DETAIL_LEVELS
+from services import binary, metrics, serialization
+from services.anagram_index import AnagramIndex
+from services.cache import ResultCache
+from services.datasets import DatasetStore, DatasetRef, DatasetNotFoundError, DatasetStoreFullError, int64_bytes
+from services.dispatcher import Dispatcher, QueueFullError
+from services.jobs import AnalysisResponse, DUPLICATE_ENGINE_INFO, FREQUENCY_STRATEGY_INFO, PAIR_MODE_INFO
+from services.streaming import STREAM_FORMATS, iter_frames, encode_frames
 
 app = FastAPI(
     title="SmartPack API",
@@ -29,6 +45,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Per-route latency and phase histograms, served on /metrics
+app.add_middleware(metrics.MetricsMiddleware)
 
 # Request/Response Models
 class TextAnalysisRequest(BaseModel):
@@ -36,7 +54,8 @@ class TextAnalysisRequest(BaseModel):
     options: Optional[Dict[str, Any]] = {}
 
 class NumericAnalysisRequest(BaseModel):
-    numbers: List[int]
+    numbers: Optional[List[int]] = None
+    dataset_id: Optional[str] = None
     target: Optional[int] = None
     k: Optional[int] = None
     options: Optional[Dict[str, Any]] = {}
@@ -45,189 +64,847 @@ class AnagramRequest(BaseModel):
     strings: List[str]
     options: Optional[Dict[str, Any]] = {}
 
-class AnalysisResponse(BaseModel):
-    result: Any
-    algorithm: str
-    complexity: Dict[str, str]
-    explanation: str
-    steps: List[str]
-    visualization_data: Optional[Dict[str, Any]] = None
-
-# Initialize algorithm instances
-duplicate_detector = DuplicateDetector()
-anagram_analyzer = AnagramAnalyzer()
-frequency_insights = FrequencyInsights()
-pair_calculator = PairCalculator()
-sequence_tracker = SequenceTracker()
-encoder_decoder = EncoderDecoder()
+class BatchAnalysisRequest(BaseModel):
+    numbers: Optional[List[int]] = None
+    datasets: Optional[List[List[int]]] = None
+    dataset_ids: Optional[List[str]] = None
+    algorithms: List[str]
+    target: Optional[int] = None
+    k: Optional[int] = None
+    options: Optional[Dict[str, Any]] = {}
 
-@app.get("/")
-async def root():
-    return {"message": "SmartPack DSA Pattern Explorer API", "version": "1.0.0"}
+class WordsRequest(BaseModel):
+    words: List[str]
+
+class NumbersRequest(BaseModel):
+    numbers: List[int]
+
+class FrequencyWindowConfig(BaseModel):
+    size: Optional[int] = None
+    seconds: Optional[float] = None
+    half_life: Optional[float] = None
+
+class FrequencyEventsRequest(BaseModel):
+    events: List[Union[int, str]]
+    timestamps: Optional[List[float]] = None
+
+# Request model per registered request schema
+REQUEST_MODELS = {
+    "numeric": NumericAnalysisRequest,
+    "strings": AnagramRequest
+}
+
+# Algorithms to import at startup rather than on first request (comma-separated names or "all")
+PRELOAD_ALGORITHMS = os.environ.get("SMARTPACK_PRELOAD", "")
+
+# Server-side directory that /analyze/file may read from by relative path (disabled if unset)
+DATA_DIR = os.environ.get("SMARTPACK_DATA_DIR")
+
+# Worker pool for CPU-bound analysis, configured from SMARTPACK_* environment variables
+dispatcher = Dispatcher.from_env()
+
+# Content-addressed response cache, configured from SMARTPACK_CACHE_* environment variables
+result_cache = ResultCache.from_env()
+
+# Uploaded int64 datasets shared by every worker process, configured from SMARTPACK_DATASET_* environment variables
+dataset_store = DatasetStore.from_env()
 
-@app.post("/analyze/duplicates", response_model=AnalysisResponse)
-async def analyze_duplicates(request: NumericAnalysisRequest):
-    """Detect duplicates in numeric array"""
+# Persistent anagram index, configured from SMARTPACK_ANAGRAM_* environment variables
+anagram_index = AnagramIndex.from_env()
+
+# Named sliding-window / decaying frequency trackers (WindowedFrequency), updated on the event loop
+frequency_windows: Dict[str, Any] = {}
+
+# Named incremental consecutive-run trackers (RunTracker), updated on the event loop
+sequence_trackers: Dict[str, Any] = {}
+
+def get_profile(options: Optional[Dict[str, Any]]) -> bool:
+    """Read and validate options.profile (defaults to false)"""
+    profile = (options or {}).get("profile", False)
+    if not isinstance(profile, bool):
+        raise HTTPException(status_code=400, detail="options.profile must be a boolean")
+    return profile
+
+def get_detail(options: Optional[Dict[str, Any]]) -> str:
+    """Read and validate options.detail (defaults to full)"""
+    detail = (options or {}).get("detail", "full")
+    if detail not in DETAIL_LEVELS:
+        raise HTTPException(status_code=400, detail=f"options.detail must be one of {list(DETAIL_LEVELS)}")
+    return detail
+
+def get_codec(options: Optional[Dict[str, Any]]) -> str:
+    """Read and validate options.codec for the encoding endpoint (defaults to string)"""
+    from algorithms.strings.encoder_decoder import CODECS
+    codec = (options or {}).get("codec", "string")
+    if codec not in CODECS:
+        raise HTTPException(status_code=400, detail=f"options.codec must be one of {list(CODECS)}")
+    return codec
+
+def get_anagram_key(options: Optional[Dict[str, Any]]) -> str:
+    """Read and validate options.key, the group anagrams key strategy (defaults to sorted)"""
+    key = (options or {}).get("key", "sorted")
+    if key not in KEY_STRATEGIES:
+        raise HTTPException(status_code=400, detail=f"options.key must be one of {list(KEY_STRATEGIES)}")
+    return key
+
+def get_top_k_options(options: Optional[Dict[str, Any]]) -> Tuple[str, int]:
+    """Read and validate options.strategy (defaults to heap) and options.capacity for top-k frequency"""
+    from algorithms.arrays.heavy_hitters import DEFAULT_CAPACITY
+    options = options or {}
+    strategy = options.get("strategy", "heap")
+    if strategy not in FREQUENCY_STRATEGY_INFO:
+        raise HTTPException(status_code=400, detail=f"options.strategy must be one of {list(FREQUENCY_STRATEGY_INFO)}")
+    capacity = options.get("capacity", DEFAULT_CAPACITY)
+    if not isinstance(capacity, int) or capacity < 1:
+        raise HTTPException(status_code=400, detail="options.capacity must be a positive integer")
+    return strategy, capacity
+
+def get_product_options(options: Optional[Dict[str, Any]]) -> Tuple[str, int]:
+    """Read and validate options.mode (defaults to exact) and options.modulus for products"""
+    from algorithms.arrays.products import PRODUCT_MODES, DEFAULT_MODULUS
+    options = options or {}
+    mode = options.get("mode", "exact")
+    if mode not in PRODUCT_MODES:
+        raise HTTPException(status_code=400, detail=f"options.mode must be one of {list(PRODUCT_MODES)}")
+    modulus = options.get("modulus", DEFAULT_MODULUS)
+    if not isinstance(modulus, int) or modulus < 1:
+        raise HTTPException(status_code=400, detail="options.modulus must be a positive integer")
+    return mode, modulus
+
+def get_duplicate_options(options: Optional[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    """Read and validate options.engine (defaults to hash) with options.range or options.error_rate"""
+    from algorithms.arrays.duplicate_engines import DEFAULT_ERROR_RATE, MAX_BITSET_BITS
+    options = options or {}
+    engine = options.get("engine", "hash")
+    if engine not in DUPLICATE_ENGINE_INFO:
+        raise HTTPException(status_code=400, detail=f"options.engine must be one of {list(DUPLICATE_ENGINE_INFO)}")
+    if engine == "bitset":
+        value_range = options.get("range")
+        if value_range is None:
+            return engine, {}
+        if (not isinstance(value_range, list) or len(value_range) != 2
+                or not all(isinstance(bound, int) for bound in value_range)):
+            raise HTTPException(status_code=400, detail="options.range must be [low, high] integers")
+        low, high = value_range
+        if not 1 <= high - low + 1 <= MAX_BITSET_BITS:
+            raise HTTPException(status_code=400, detail=f"options.range must span 1 to {MAX_BITSET_BITS} values")
+        return engine, {"low": low, "high": high}
+    if engine == "bloom":
+        error_rate = options.get("error_rate", DEFAULT_ERROR_RATE)
+        if not isinstance(error_rate, (int, float)) or not 0 < error_rate < 1:
+            raise HTTPException(status_code=400, detail="options.error_rate must be between 0 and 1")
+        return engine, {"error_rate": error_rate}
+    if engine == "sort":
+        # Request data belongs to the job, so it can be sorted without a copy
+        return engine, {"in_place": True}
+    return engine, {}
+
+def get_pair_options(options: Optional[Dict[str, Any]]) -> Tuple[str, Optional[List[int]], int]:
+    """Read and validate options.mode (defaults to first), options.targets and options.limit for pairs"""
+    from algorithms.arrays.pair_search import DEFAULT_PAIR_LIMIT, MAX_TARGETS
+    options = options or {}
+    mode = options.get("mode", "first")
+    if mode not in PAIR_MODE_INFO:
+        raise HTTPException(status_code=400, detail=f"options.mode must be one of {list(PAIR_MODE_INFO)}")
+    targets = options.get("targets")
+    if mode == "multi" and (not isinstance(targets, list)
+                            or not all(isinstance(t, int) and not isinstance(t, bool) for t in targets)):
+        raise HTTPException(status_code=400, detail="options.targets must be a list of integers for multi mode")
+    if mode == "multi" and len(targets) > MAX_TARGETS:
+        raise HTTPException(status_code=400, detail=f"options.targets may hold at most {MAX_TARGETS} targets")
+    limit = options.get("limit", DEFAULT_PAIR_LIMIT)
+    if not isinstance(limit, int) or limit < 1:
+        raise HTTPException(status_code=400, detail="options.limit must be a positive integer")
+    return mode, targets, limit
+
+def dataset_ref(dataset_id: str, results_only: bool = False) -> DatasetRef:
+    """Job argument for an uploaded dataset, resolved to a zero-copy view on the worker"""
     try:
-        result = duplicate_detector.contains_duplicate(request.numbers)
-        return AnalysisResponse(
-            result=result,
-            algorithm="Contains Duplicate (Hash Set)",
-            complexity={"time": "O(n)", "space": "O(n)"},
-            explanation="Uses hash set to track seen elements in single pass",
-            steps=duplicate_detector.get_steps(request.numbers),
-            visualization_data=duplicate_detector.get_visualization_data(request.numbers)
-        )
+        return dataset_store.ref(dataset_id, results_only)
+    except DatasetNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+def numbers_argument(request: NumericAnalysisRequest, detail: str = "full") -> Union[List[int], DatasetRef]:
+    """Inline numbers or the dataset named by dataset_id (exactly one is required)"""
+    if (request.numbers is None) == (request.dataset_id is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of numbers or dataset_id")
+    if request.numbers is not None:
+        return request.numbers
+    # Results-only jobs may read the mapped int64 array directly
+    return dataset_ref(request.dataset_id, results_only=detail == "result")
+
+# Argument readers - a plugin names the readers whose keyword arguments its
+# job (arguments) and its tracer (trace_arguments) take; each reads and
+# validates fields of the request
+def target_argument(request: BaseModel) -> Dict[str, Any]:
+    if request.target is None:
+        raise HTTPException(status_code=400, detail="Target value required for pair analysis")
+    return {"target": request.target}
+
+def k_argument(request: BaseModel) -> Dict[str, Any]:
+    return {"k": request.k}
+
+def engine_arguments(request: BaseModel) -> Dict[str, Any]:
+    engine, engine_options = get_duplicate_options(request.options)
+    return {"engine": engine, "engine_options": engine_options}
+
+def strategy_arguments(request: BaseModel) -> Dict[str, Any]:
+    strategy, capacity = get_top_k_options(request.options)
+    return {"strategy": strategy, "capacity": capacity}
+
+def trace_strategy_argument(request: BaseModel) -> Dict[str, Any]:
+    strategy, _ = get_top_k_options(request.options)
+    if strategy == "approximate":
+        raise HTTPException(status_code=400, detail="options.strategy 'approximate' has no step-by-step trace")
+    return {"strategy": strategy}
+
+def pair_mode_arguments(request: BaseModel) -> Dict[str, Any]:
+    mode, targets, limit = get_pair_options(request.options)
+    if request.target is None and mode != "multi":
+        raise HTTPException(status_code=400, detail="Target value required for pair analysis")
+    if mode == "ksum" and request.k is not None and request.k < 2:
+        raise HTTPException(status_code=400, detail="k must be at least 2 for k-Sum")
+    return {"target": request.target, "mode": mode, "targets": targets, "k": request.k, "limit": limit}
+
+def product_mode_arguments(request: BaseModel) -> Dict[str, Any]:
+    mode, modulus = get_product_options(request.options)
+    return {"mode": mode, "modulus": modulus}
+
+def key_argument(request: BaseModel) -> Dict[str, Any]:
+    return {"key": get_anagram_key(request.options)}
+
+def codec_argument(request: BaseModel) -> Dict[str, Any]:
+    return {"codec": get_codec(request.options)}
+
+ARGUMENT_READERS: Dict[str, Callable[[BaseModel], Dict[str, Any]]] = {
+    "target": target_argument,
+    "k": k_argument,
+    "engine": engine_arguments,
+    "strategy": strategy_arguments,
+    "trace_strategy": trace_strategy_argument,
+    "pair_mode": pair_mode_arguments,
+    "product_mode": product_mode_arguments,
+    "key": key_argument,
+    "codec": codec_argument
+}
+
+def read_arguments(names: List[str], request: BaseModel) -> Dict[str, Any]:
+    """Keyword arguments of a job or tracer, merged from its argument readers"""
+    arguments = {}
+    for name in names:
+        arguments.update(ARGUMENT_READERS[name](request))
+    return arguments
+
+def request_data(plugin: AlgorithmPlugin, request: BaseModel, detail: str = "full") -> Any:
+    """The data a plugin's job or tracer runs on: numbers (or a dataset) or strings"""
+    if plugin.request == "numeric":
+        return numbers_argument(request, detail)
+    return request.strings
+
+def analysis_job(plugin: AlgorithmPlugin, detail: str, arguments: Dict[str, Any], **extra: Any) -> Callable[..., Any]:
+    """A plugin's job bound to its detail level and arguments, ready to dispatch with the data"""
+    return functools.partial(algorithm_registry.job(plugin.name), detail=detail, **arguments, **extra)
+
+# Batch and binary analyses - any numeric algorithm; shared_data ones share one parsed dataset
+def numeric_plugins() -> Dict[str, AlgorithmPlugin]:
+    return {plugin.name: plugin for plugin in algorithm_registry if plugin.request == "numeric"}
+
+def prepare_dataset(numbers: Union[List[int], DatasetRef]) -> NumericDataset:
+    with dataset_store.attach([numbers]) as (numbers,):
+        return NumericDataset(numbers).prepare()
+
+def run_batch_item(job: Callable[..., AnalysisResponse], shared: NumericDataset,
+                   shared_data: bool) -> Dict[str, Any]:
+    """Run one algorithm of a batch against a prepared dataset, handed to shared_data jobs"""
+    with dataset_store.attach([shared.nums]) as (numbers,):
+        if shared_data:
+            return serialization.fields(job(numbers, shared=shared))
+        return serialization.fields(job(numbers))
+
+def run_binary(job: Callable[..., AnalysisResponse], numbers: Any, detail: str) -> AnalysisResponse:
+    """
+    Run a numeric job on a decoded binary payload
+    The buffer is only handed over as-is when the vectorized engine will read
+    it (the analyzers convert it to ints before any pure-Python fallback);
+    traces and the pure-Python engine get plain ints.
+    """
+    from algorithms.arrays import vectorized
+    if detail != "result":
+        numbers = binary.to_list(numbers)
+    elif binary.is_ndarray(numbers):
+        try:
+            if not vectorized.should_vectorize(numbers):
+                raise vectorized.Unsupported("below the vectorize threshold")
+            vectorized.to_array(numbers)
+        except vectorized.Unsupported:
+            numbers = binary.to_list(numbers)
+    return job(numbers)
+
+# File analyses - chunked, bounded-memory versions of the numeric analyzers
+FILE_ALGORITHMS = {
+    "duplicates": {
+        "algorithm": "Contains Duplicate (Chunked Hash Set)",
+        "complexity": {"time": "O(n)", "space": "O(min(n, budget))"},
+        "explanation": "Streams the file in chunks with early exit, spilling hash partitions to disk past the memory budget"
+    },
+    "frequency": {
+        "algorithm": "Top K Frequent Elements (Chunked Count Merge)",
+        "complexity": {"time": "O(n log k)", "space": "O(min(u, budget))"},
+        "explanation": "Merges per-chunk counts, counting disk partitions separately past the memory budget"
+    },
+    "sequences": {
+        "algorithm": "Longest Consecutive Sequence (Interval Merge)",
+        "complexity": {"time": "O(n log n)", "space": "O(runs + chunk)"},
+        "explanation": "Reduces each chunk to sorted runs and merges them into disjoint intervals in batches"
+    }
+}
+
+def run_file_analysis(algorithm: str, path: str, fmt: str, k: int, chunk_size: Optional[int]) -> AnalysisResponse:
+    from algorithms.arrays.chunked import ChunkedAnalyzer, iter_file_chunks, max_values, DEFAULT_CHUNK_SIZE
+    chunked_analyzer = ChunkedAnalyzer()
+    chunks = iter_file_chunks(path, fmt, chunk_size or DEFAULT_CHUNK_SIZE)
+    # Spill partitions are sized from the file so one level usually fits the memory budget
+    size_hint = max_values(path, fmt)
+    if algorithm == "duplicates":
+        result, stats = chunked_analyzer.contains_duplicate(chunks, size_hint)
+    elif algorithm == "frequency":
+        result, stats = chunked_analyzer.top_k_frequent(chunks, k, size_hint)
+    else:
+        result, stats = chunked_analyzer.longest_consecutive(chunks)
+
+    steps = [f"Read {stats['values_read']} values in {stats['chunks']} chunks"]
+    if stats.get("spilled_partitions"):
+        steps.append(f"Memory budget exceeded - spilled to {stats['spilled_partitions']} disk partitions "
+                     f"over {stats['partition_levels']} level(s)")
+    return AnalysisResponse.model_construct(
+        result=result,
+        steps=steps,
+        visualization_data={"type": "chunked", "format": fmt, "stats": stats},
+        **FILE_ALGORITHMS[algorithm]
+    )
+
+def resolve_data_path(path: str) -> str:
+    """Resolve a path inside SMARTPACK_DATA_DIR, rejecting anything outside it"""
+    if not DATA_DIR:
+        raise HTTPException(status_code=400, detail="Server-side paths are disabled (SMARTPACK_DATA_DIR is not set)")
+    root = os.path.realpath(DATA_DIR)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if not resolved.startswith(root + os.sep) or not os.path.isfile(resolved):
+        raise HTTPException(status_code=404, detail=f"No such data file: {path}")
+    return resolved
+
+def trace_analysis(algorithm: str, data: Any, arguments: Dict[str, Any]) -> Tuple[Dict[str, Any], Trace]:
+    """Trace an analysis by endpoint name, returning its response metadata and trace"""
+    with dataset_store.attach([data]) as (data,):
+        return algorithm_registry.tracer(algorithm)(data, **arguments)
+
+async def dispatch(job, *args, profile: bool = False) -> Any:
+    """
+    Run an analysis job on the worker pool, mapping pool errors to HTTP errors
+    The job's phase timings (and cProfile entries with profile) are added to
+    the current request's metrics; time outside the job counts as dispatch.
+    """
+    request_metrics = metrics.current_request()
+    if request_metrics is not None:
+        request_metrics.mark_parsed()
+    start = time.perf_counter()
+    try:
+        result, phases, profile_entries = await dispatcher.run(metrics.run_instrumented, job, args, profile)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"Analysis exceeded {dispatcher.timeout}s timeout")
+    except DatasetNotFoundError as e:
+        # Deleted or evicted after the request was accepted
+        raise HTTPException(status_code=404, detail=str(e))
+    except (OverflowError, ValueError) as e:
+        # Input the chosen algorithm cannot represent (int64 overflow, values outside a bitset range)
+        raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/analyze/anagrams", response_model=AnalysisResponse)
-async def analyze_anagrams(request: AnagramRequest):
-    """Analyze anagrams in string array"""
+    if request_metrics is not None:
+        job_seconds = phases.pop("job")
+        for name, seconds in phases.items():
+            request_metrics.add(name, seconds)
+        request_metrics.add("dispatch", max(0.0, time.perf_counter() - start - job_seconds))
+        if profile_entries is not None:
+            request_metrics.profile = profile_entries
+    return result
+
+def run_serialized(job, *args) -> bytes:
+    """Run a job and serialize its response on the worker, ready for caching"""
+    with dataset_store.attach(args) as args:
+        response = job(*args)
+    with metrics.phase("serialize"):
+        return serialization.encode_response(response)
+
+def json_response(response: AnalysisResponse) -> Response:
+    """Encode a response built by a job directly, skipping FastAPI's response_model re-validation"""
+    with metrics.phase("serialize"):
+        return Response(content=serialization.encode_response(response), media_type="application/json")
+
+def input_size(request: BaseModel) -> Optional[int]:
+    """Number of input elements, for the size label of request metrics"""
+    for field in ("numbers", "strings"):
+        values = getattr(request, field, None)
+        if values is not None:
+            return len(values)
+    dataset_id = getattr(request, "dataset_id", None)
+    if dataset_id is not None:
+        try:
+            return dataset_store.info(dataset_id)["length"]
+        except DatasetNotFoundError:
+            return None
+    return None
+
+def with_profile(body: bytes) -> bytes:
+    """Add the current request's phase breakdown and cProfile entries to a response body"""
+    request_metrics = metrics.current_request()
+    data = json.loads(body)
+    data["profile"] = {
+        "phases": {name: round(seconds, 6) for name, seconds in request_metrics.phases.items()},
+        "cprofile": request_metrics.profile
+    } if request_metrics is not None else None
+    return serialization.dumps(data)
+
+def cache_key(endpoint: str, request: BaseModel) -> str:
+    """Result cache key of a request, computed on the pool (dumping and hashing the payload is O(n))"""
+    with metrics.phase("cache_key"):
+        return result_cache.make_key(endpoint, request.model_dump())
+
+async def cached_dispatch(endpoint: str, request: BaseModel, job, *args) -> Response:
+    """
+    Serve an analysis from the result cache, dispatching the job on a miss
+    With options.profile the cache is bypassed and the phase breakdown and
+    top cProfile entries are returned in a "profile" field.
+    """
+    metrics.handler_started(input_size(request))
+    if get_profile(getattr(request, "options", None)):
+        body = await dispatch(run_serialized, job, *args, profile=True)
+        return Response(content=with_profile(body), media_type="application/json")
+    if not result_cache.enabled:
+        return Response(content=await dispatch(run_serialized, job, *args), media_type="application/json")
+
+    key = await dispatch(cache_key, endpoint, request)
+    body = await cache_call(result_cache.get, key)
+    if body is None:
+        body = await dispatch(run_serialized, job, *args)
+        await cache_call(result_cache.set, key, body)
+    return Response(content=body, media_type="application/json")
+
+async def cache_call(method: Callable[..., Any], *args: Any) -> Any:
+    """Call a result cache method, on a thread when it may wait on the sqlite tier"""
+    if result_cache.blocking:
+        return await asyncio.to_thread(method, *args)
+    return method(*args)
+
+@app.on_event("startup")
+async def start_dispatcher():
+    dispatcher.start()
+
+@app.on_event("startup")
+async def preload_algorithms():
+    names = [name.strip() for name in PRELOAD_ALGORITHMS.split(",") if name.strip()]
+    if names == ["all"]:
+        names = [plugin.name for plugin in algorithm_registry]
+    algorithm_registry.preload(names)
+
+@app.on_event("shutdown")
+async def stop_dispatcher():
+    dispatcher.shutdown()
+
+@app.on_event("shutdown")
+async def save_anagram_index():
+    if anagram_index.snapshot_path:
+        anagram_index.snapshot()
+
+@app.get("/")
+async def root():
+    return {"message": "SmartPack DSA Pattern Explorer API", "version": "1.0.0"}
+
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Get result cache hit/miss counters and memory usage"""
+    return await cache_call(result_cache.stats)
+
+@app.delete("/cache")
+async def clear_cache():
+    """Drop all cached analysis results"""
+    await cache_call(result_cache.clear)
+    return {"cleared": True}
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus metrics: request counts, latencies and per-phase timings by route and input size"""
+    return Response(content=metrics.registry.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/dispatcher/stats")
+async def get_dispatcher_stats():
+    """Get worker pool configuration and current load"""
+    return dispatcher.stats()
+
+@app.post("/datasets")
+async def upload_dataset(request: Request):
+    """
+    Store an int64 array once for analyses by dataset_id: a JSON {"numbers": [...]}
+    body, raw little-endian int64 (application/octet-stream) or a msgpack array
+    Identical content returns the id it is already stored under.
+    """
+    media_type = request.headers.get("content-type", "application/json").split(";")[0].strip()
+    if media_type not in ("application/json", binary.BINARY_MEDIA_TYPE, binary.MSGPACK_MEDIA_TYPE):
+        raise HTTPException(status_code=415, detail=f"Unsupported content type '{media_type}'")
+    body = await request.body()
     try:
-        if len(request.strings) == 2:
-            # Valid anagram check
-            result = anagram_analyzer.is_valid_anagram(request.strings[0], request.strings[1])
-            algorithm = "Valid Anagram (Frequency Count)"
+        if media_type == binary.BINARY_MEDIA_TYPE:
+            data = body
+        elif media_type == binary.MSGPACK_MEDIA_TYPE:
+            data = int64_bytes(binary.decode_numbers(body, media_type))
         else:
-            # Group anagrams
-            result = anagram_analyzer.group_anagrams(request.strings)
-            algorithm = "Group Anagrams (Hash Map)"
-        
-        return AnalysisResponse(
-            result=result,
-            algorithm=algorithm,
-            complexity={"time": "O(n*m log m)", "space": "O(n*m)"},
-            explanation="Groups strings by sorted character frequency",
-            steps=anagram_analyzer.get_steps(request.strings),
-            visualization_data=anagram_analyzer.get_visualization_data(request.strings)
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+            data = int64_bytes(NumbersRequest.model_validate_json(body).numbers)
+    except (OverflowError, ValueError) as e:
+        # Includes pydantic validation errors and values outside int64
+        raise HTTPException(status_code=422, detail=str(e))
 
-@app.post("/analyze/frequency", response_model=AnalysisResponse)
-async def analyze_frequency(request: NumericAnalysisRequest):
-    """Find top K frequent elements"""
+    metrics.handler_started(len(data) // 8)
     try:
-        k = request.k or 1
-        result = frequency_insights.top_k_frequent(request.numbers, k)
-        return AnalysisResponse(
-            result=result,
-            algorithm="Top K Frequent Elements (Heap)",
-            complexity={"time": "O(n log k)", "space": "O(n + k)"},
-            explanation="Uses frequency counter and min-heap for efficient top-K selection",
-            steps=frequency_insights.get_steps(request.numbers, k),
-            visualization_data=frequency_insights.get_visualization_data(request.numbers, k)
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        return dataset_store.ingest(data)
+    except DatasetStoreFullError as e:
+        raise HTTPException(status_code=507, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/datasets")
+async def list_datasets():
+    """Stored datasets (most recently used first) and store usage"""
+    return {"datasets": dataset_store.list_datasets(), **dataset_store.stats()}
 
-@app.post("/analyze/pairs", response_model=AnalysisResponse)
-async def analyze_pairs(request: NumericAnalysisRequest):
-    """Find two sum pairs"""
+@app.get("/datasets/{dataset_id}")
+async def get_dataset(dataset_id: str):
+    """Size and last use of a stored dataset"""
     try:
-        if request.target is None:
-            raise HTTPException(status_code=400, detail="Target value required for pair analysis")
-        
-        result = pair_calculator.two_sum(request.numbers, request.target)
-        return AnalysisResponse(
-            result=result,
-            algorithm="Two Sum (Hash Map)",
-            complexity={"time": "O(n)", "space": "O(n)"},
-            explanation="Uses hash map to find complement in single pass",
-            steps=pair_calculator.get_steps(request.numbers, request.target),
-            visualization_data=pair_calculator.get_visualization_data(request.numbers, request.target)
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        return dataset_store.info(dataset_id)
+    except DatasetNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
-@app.post("/analyze/products", response_model=AnalysisResponse)
-async def analyze_products(request: NumericAnalysisRequest):
-    """Calculate product of array except self"""
+@app.delete("/datasets/{dataset_id}")
+async def delete_dataset(dataset_id: str):
+    """Drop a stored dataset; analyses already running on it finish normally"""
     try:
-        result = pair_calculator.product_except_self(request.numbers)
-        return AnalysisResponse(
-            result=result,
-            algorithm="Product of Array Except Self",
-            complexity={"time": "O(n)", "space": "O(1)"},
-            explanation="Uses left and right pass to calculate products without division",
-            steps=pair_calculator.get_product_steps(request.numbers),
-            visualization_data=pair_calculator.get_product_visualization_data(request.numbers)
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        dataset_store.delete(dataset_id)
+    except DatasetNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"deleted": dataset_id}
 
-@app.post("/analyze/sequences", response_model=AnalysisResponse)
-async def analyze_sequences(request: NumericAnalysisRequest):
-    """Find longest consecutive sequence"""
+@app.get("/anagrams/index")
+async def get_anagram_index_stats():
+    """Get anagram index size and configuration"""
+    return await asyncio.to_thread(anagram_index.stats)
+
+@app.post("/anagrams/index")
+async def add_to_anagram_index(request: WordsRequest):
+    """Add words to the anagram index"""
+    # Index updates run on a thread (not the analysis pool, which may be processes)
+    added = await asyncio.to_thread(anagram_index.add, request.words)
+    return {"added": added, "words": len(anagram_index)}
+
+@app.post("/anagrams/index/remove")
+async def remove_from_anagram_index(request: WordsRequest):
+    """Remove words from the anagram index"""
+    removed = await asyncio.to_thread(anagram_index.remove, request.words)
+    return {"removed": removed, "words": len(anagram_index)}
+
+@app.post("/anagrams/index/snapshot")
+async def snapshot_anagram_index():
+    """Write the anagram index to its snapshot file"""
+    if not anagram_index.snapshot_path:
+        raise HTTPException(status_code=400, detail="No snapshot path configured (set SMARTPACK_ANAGRAM_INDEX)")
+    path = await asyncio.to_thread(anagram_index.snapshot)
+    return {"path": path, "words": len(anagram_index)}
+
+@app.get("/anagrams/index/{word}")
+async def lookup_anagrams(word: str):
+    """Indexed anagrams of a word and the size of its group"""
+    # The index lock can be held by a bulk update, so lookups wait on a thread
+    anagrams = await asyncio.to_thread(anagram_index.lookup, word)
+    return {"word": word, "anagrams": anagrams, "group_size": len(anagrams), "indexed": word in anagrams}
+
+# Analysis routes - POST /analyze/{name} for every registered algorithm,
+# built from the job and argument readers its plugin declares
+def add_analysis_route(plugin: AlgorithmPlugin) -> None:
+    """Register the cached, pool-dispatched POST /analyze/{name} endpoint of a plugin"""
+    unknown = [name for name in plugin.arguments + plugin.trace_arguments if name not in ARGUMENT_READERS]
+    if unknown:
+        raise ValueError(f"Algorithm '{plugin.name}' declares unknown argument readers {unknown}, "
+                         f"expected any of {list(ARGUMENT_READERS)}")
+
+    async def analyze(request: REQUEST_MODELS[plugin.request]):
+        detail = get_detail(request.options)
+        job = analysis_job(plugin, detail, read_arguments(plugin.arguments, request))
+        return await cached_dispatch(plugin.name, request, job, request_data(plugin, request, detail))
+
+    analyze.__doc__ = plugin.summary
+    app.add_api_route(f"/analyze/{plugin.name}", analyze, methods=["POST"],
+                      response_model=AnalysisResponse, name=f"analyze_{plugin.name}")
+
+for plugin in algorithm_registry:
+    add_analysis_route(plugin)
+
+def get_frequency_window(name: str) -> Any:
+    if name not in frequency_windows:
+        raise HTTPException(status_code=404, detail=f"No frequency window named '{name}'")
+    return frequency_windows[name]
+
+@app.get("/analyze/frequency/windows")
+async def list_frequency_windows():
+    """List frequency windows and their configuration"""
+    return {name: window.stats() for name, window in frequency_windows.items()}
+
+@app.put("/analyze/frequency/windows/{name}")
+async def create_frequency_window(name: str, config: FrequencyWindowConfig):
+    """Create (or reset) a window over the last size events / seconds, or a half_life decay"""
+    from algorithms.arrays.windowed_frequency import WindowedFrequency
     try:
-        result = sequence_tracker.longest_consecutive(request.numbers)
-        return AnalysisResponse(
-            result=result,
-            algorithm="Longest Consecutive Sequence (Hash Set)",
-            complexity={"time": "O(n)", "space": "O(n)"},
-            explanation="Uses hash set to identify sequence starts and extend efficiently",
-            steps=sequence_tracker.get_steps(request.numbers),
-            visualization_data=sequence_tracker.get_visualization_data(request.numbers)
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        window = WindowedFrequency(config.size, config.seconds, config.half_life)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    frequency_windows[name] = window
+    return window.stats()
+
+@app.post("/analyze/frequency/windows/{name}/events")
+async def append_frequency_events(name: str, request: FrequencyEventsRequest):
+    """Append events (with optional per-event timestamps) to a frequency window"""
+    window = get_frequency_window(name)
+    if request.timestamps is not None and len(request.timestamps) != len(request.events):
+        raise HTTPException(status_code=400, detail="timestamps must match events one to one")
+    window.extend(request.events, request.timestamps)
+    return window.stats()
+
+@app.get("/analyze/frequency/windows/{name}")
+async def query_frequency_window(name: str, k: int = 1, now: Optional[float] = None):
+    """
+    Top K frequent events currently in a window, as of now (defaults to the
+    latest event timestamp when events carry timestamps, else the wall clock)
+    """
+    window = get_frequency_window(name)
+    top_k = window.top_k(k, now)
+    return {
+        "result": [value for value, count in top_k],
+        "counts": [{"value": value, "count": count} for value, count in top_k],
+        "window": window.stats()
+    }
+
+@app.delete("/analyze/frequency/windows/{name}")
+async def delete_frequency_window(name: str):
+    """Drop a frequency window"""
+    get_frequency_window(name)
+    del frequency_windows[name]
+    return {"deleted": name}
+
+def get_sequence_tracker(name: str) -> Any:
+    if name not in sequence_trackers:
+        raise HTTPException(status_code=404, detail=f"No sequence tracker named '{name}'")
+    return sequence_trackers[name]
+
+@app.get("/analyze/sequences/trackers")
+async def list_sequence_trackers():
+    """List sequence trackers and their longest runs"""
+    return {name: tracker.stats() for name, tracker in sequence_trackers.items()}
+
+@app.put("/analyze/sequences/trackers/{name}")
+async def create_sequence_tracker(name: str, request: NumbersRequest):
+    """Create (or reset) a sequence tracker seeded with numbers"""
+    from algorithms.arrays.run_tracker import RunTracker
+    tracker = sequence_trackers[name] = RunTracker(request.numbers)
+    return tracker.stats()
+
+@app.post("/analyze/sequences/trackers/{name}/insert")
+async def insert_sequence_numbers(name: str, request: NumbersRequest):
+    """Insert numbers into a sequence tracker"""
+    tracker = get_sequence_tracker(name)
+    added = tracker.insert_many(request.numbers)
+    return {"added": added, **tracker.stats()}
+
+@app.post("/analyze/sequences/trackers/{name}/delete")
+async def delete_sequence_numbers(name: str, request: NumbersRequest):
+    """Delete numbers from a sequence tracker"""
+    tracker = get_sequence_tracker(name)
+    removed = tracker.delete_many(request.numbers)
+    return {"removed": removed, **tracker.stats()}
+
+@app.get("/analyze/sequences/trackers/{name}")
+async def query_sequence_tracker(name: str, x: Optional[int] = None, runs: bool = False):
+    """Longest run, plus the run containing x and/or every run on request"""
+    tracker = get_sequence_tracker(name)
+    response = tracker.stats()
+    if x is not None:
+        response["run_containing"] = tracker.run_containing(x)
+    if runs:
+        response["all_runs"] = tracker.runs()
+    return response
+
+@app.delete("/analyze/sequences/trackers/{name}")
+async def delete_sequence_tracker(name: str):
+    """Drop a sequence tracker"""
+    get_sequence_tracker(name)
+    del sequence_trackers[name]
+    return {"deleted": name}
 
-@app.post("/analyze/encoding", response_model=AnalysisResponse)
-async def analyze_encoding(request: AnagramRequest):
-    """Encode and decode strings safely"""
+@app.post("/analyze/encoding/decode")
+async def decode_encoding_stream(request: Request, codec: str = "utf8"):
+    """Decode a length-prefixed byte stream incrementally as the request body arrives"""
+    from algorithms.strings.stream_decoder import StreamDecoder, FrameError
     try:
-        encoded = encoder_decoder.encode(request.strings)
-        decoded = encoder_decoder.decode(encoded)
-        
-        return AnalysisResponse(
-            result={"encoded": encoded, "decoded": decoded, "valid": decoded == request.strings},
-            algorithm="Encode/Decode Strings (Length Prefix)",
-            complexity={"time": "O(n)", "space": "O(n)"},
-            explanation="Uses length prefix encoding to handle arbitrary delimiters safely",
-            steps=encoder_decoder.get_steps(request.strings),
-            visualization_data=encoder_decoder.get_visualization_data(request.strings)
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        decoder = StreamDecoder(codec)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        decoded = [s async for s in decoder.adecode_all(request.stream())]
+    except FrameError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"decoded": decoded, "count": len(decoded), "codec": codec}
+
+@app.post("/analyze/batch")
+async def analyze_batch(request: BatchAnalysisRequest):
+    """Run several numeric algorithms over one or more arrays (inline or uploaded) in a single request"""
+    plugins = numeric_plugins()
+    unknown = [name for name in request.algorithms if name not in plugins]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported batch algorithms {unknown}, expected any of {list(plugins)}")
+    detail = get_detail(request.options)
+    # Each algorithm reads its options exactly as its own POST /analyze/{name} does
+    jobs = {name: analysis_job(plugins[name], detail, read_arguments(plugins[name].arguments, request))
+            for name in request.algorithms}
+    prepare = any(plugins[name].shared_data for name in request.algorithms)
+
+    if request.dataset_ids is not None:
+        # Prepared datasets need plain ints for their Counter and distinct set
+        datasets = [dataset_ref(dataset_id, results_only=detail == "result" and not prepare)
+                    for dataset_id in request.dataset_ids]
+    else:
+        datasets = request.datasets if request.datasets is not None else [request.numbers or []]
+    metrics.handler_started(sum(len(numbers) for numbers in datasets))
+
+    # Derived structures (Counter, distinct set) are built once per dataset
+    if prepare:
+        shared = await asyncio.gather(*(dispatch(prepare_dataset, numbers) for numbers in datasets))
+    else:
+        shared = [NumericDataset(numbers) for numbers in datasets]
+
+    items = [(index, name) for index in range(len(datasets)) for name in request.algorithms]
+    outcomes = await asyncio.gather(
+        *(dispatch(run_batch_item, jobs[name], shared[index], plugins[name].shared_data) for index, name in items),
+        return_exceptions=True
+    )
+
+    results = []
+    for (index, name), outcome in zip(items, outcomes):
+        entry = {"dataset": index, "algorithm": name}
+        if isinstance(outcome, HTTPException):
+            entry["error"] = outcome.detail
+        elif isinstance(outcome, Exception):
+            entry["error"] = str(outcome)
+        else:
+            entry["response"] = outcome
+        results.append(entry)
+    with metrics.phase("serialize"):
+        return Response(content=serialization.dumps({"results": results}), media_type="application/json")
+
+@app.post("/analyze/{algorithm}/binary", response_model=AnalysisResponse)
+async def analyze_binary(algorithm: str, request: Request, target: Optional[int] = None,
+                         k: Optional[int] = None, detail: str = "result", engine: str = "hash"):
+    """
+    Analyze a raw little-endian int64 (application/octet-stream) or msgpack
+    (application/x-msgpack) array. Array results are returned as raw int64
+    when the client accepts application/octet-stream. engine selects the
+    duplicates engine (the bitset range is taken from the data).
+    """
+    plugin = numeric_plugins().get(algorithm)
+    if plugin is None:
+        raise HTTPException(status_code=404, detail=f"Unsupported binary algorithm: {algorithm}")
+    if detail not in DETAIL_LEVELS:
+        raise HTTPException(status_code=400, detail=f"detail must be one of {list(DETAIL_LEVELS)}")
+    # Query parameters stand in for the JSON request fields the plugin's argument readers take
+    query = NumericAnalysisRequest(target=target, k=k, options={"engine": engine})
+    job = analysis_job(plugin, detail, read_arguments(plugin.arguments, query))
+
+    media_type = request.headers.get("content-type", binary.BINARY_MEDIA_TYPE).split(";")[0].strip()
+    try:
+        numbers = binary.decode_numbers(await request.body(), media_type,
+                                        picklable=dispatcher.executor_type == "process")
+    except ValueError as e:
+        status = 415 if media_type not in (binary.BINARY_MEDIA_TYPE, binary.MSGPACK_MEDIA_TYPE) else 400
+        raise HTTPException(status_code=status, detail=str(e))
+
+    metrics.handler_started(len(numbers))
+    response = await dispatch(run_binary, job, numbers, detail)
+
+    accept = request.headers.get("accept", "")
+    if binary.BINARY_MEDIA_TYPE in accept:
+        encoded = binary.encode_int64(response.result)
+        if encoded is not None:
+            return Response(content=encoded, media_type=binary.BINARY_MEDIA_TYPE,
+                            headers={"X-Algorithm": response.algorithm, "X-Result-Length": str(len(response.result))})
+    if binary.MSGPACK_MEDIA_TYPE in accept and binary.msgpack_available():
+        return Response(content=binary.encode_msgpack(response.model_dump()), media_type=binary.MSGPACK_MEDIA_TYPE)
+    return json_response(response)
+
+@app.post("/analyze/file/{algorithm}", response_model=AnalysisResponse)
+async def analyze_file(algorithm: str, file: Optional[UploadFile] = File(None), path: Optional[str] = Form(None),
+                       format: str = Form("binary"), k: int = Form(1), chunk_size: Optional[int] = Form(None)):
+    """
+    Analyze an uploaded file (or one under SMARTPACK_DATA_DIR) of int64 values
+    or newline-delimited integers with bounded memory
+    """
+    if algorithm not in FILE_ALGORITHMS:
+        raise HTTPException(status_code=404, detail=f"Unsupported file algorithm: {algorithm}")
+    if format not in ("binary", "text"):
+        raise HTTPException(status_code=400, detail="format must be 'binary' or 'text'")
+    if (file is None) == (path is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of file or path")
+
+    if path is not None:
+        return json_response(await dispatch(run_file_analysis, algorithm, resolve_data_path(path), format, k, chunk_size))
+
+    # Uploads are copied to a real file so binary input can be memory-mapped;
+    # the blocking copy runs on a thread, off the event loop
+    with tempfile.NamedTemporaryFile(prefix="smartpack-upload-") as upload:
+        await asyncio.to_thread(shutil.copyfileobj, file.file, upload, 1 << 20)
+        upload.flush()
+        return json_response(await dispatch(run_file_analysis, algorithm, upload.name, format, k, chunk_size))
+
+@app.post("/analyze/{algorithm}/stream")
+async def analyze_stream(algorithm: str, request: Request, format: str = "ndjson"):
+    """Stream an analysis as NDJSON lines or Server-Sent Events, one frame per step"""
+    if algorithm not in algorithm_registry or algorithm_registry.get(algorithm).tracer is None:
+        raise HTTPException(status_code=404, detail=f"Unknown algorithm: {algorithm}")
+    if format not in STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {list(STREAM_FORMATS)}")
+
+    plugin = algorithm_registry.get(algorithm)
+    try:
+        payload = REQUEST_MODELS[plugin.request].model_validate(await request.json())
+    except (ValueError, ValidationError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    arguments = read_arguments(plugin.trace_arguments, payload)
+    data = request_data(plugin, payload)
+
+    # The algorithm runs once on the pool; steps are rendered lazily while streaming
+    info, trace = await dispatch(trace_analysis, algorithm, data, arguments)
+    return StreamingResponse(
+        encode_frames(iter_frames(info, trace), format),
+        media_type=STREAM_FORMATS[format]
+    )
+
+@app.get("/algorithms")
+async def list_algorithms():
+    """Registered algorithms, their request schema and whether this process has loaded them"""
+    return [dict(plugin.describe(), loaded=algorithm_registry.is_loaded(plugin.name)) for plugin in algorithm_registry]
 
 @app.get("/algorithms/mapping")
 async def get_algorithm_mapping():
     """Get DSA pattern to feature mapping"""
-    return {
-        "patterns": [
-            {
-                "pattern": "Hash Set/Map",
-                "features": ["Duplicate Detection", "Anagram Analysis", "Frequency Counting"],
-                "real_world": ["Database Deduplication", "Spam Detection", "Log Analysis"],
-                "blind75": ["Contains Duplicate", "Valid Anagram", "Group Anagrams"]
-            },
-            {
-                "pattern": "Two Pointers/Complement",
-                "features": ["Pair Finding", "Sum Calculations"],
-                "real_world": ["Recommendation Systems", "Financial Analysis"],
-                "blind75": ["Two Sum", "3Sum"]
-            },
-            {
-                "pattern": "Prefix/Suffix Arrays",
-                "features": ["Product Calculations", "Range Queries"],
-                "real_world": ["Stock Analysis", "Performance Metrics"],
-                "blind75": ["Product of Array Except Self"]
-            },
-            {
-                "pattern": "Union Find/Consecutive",
-                "features": ["Sequence Detection", "Graph Components"],
-                "real_world": ["Social Networks", "System Dependencies"],
-                "blind75": ["Longest Consecutive Sequence"]
-            },
-            {
-                "pattern": "String Processing",
-                "features": ["Safe Encoding", "Data Serialization"],
-                "real_world": ["API Design", "Data Storage"],
-                "blind75": ["Encode and Decode Strings"]
-            }
-        ]
-    }
+    return algorithm_registry.mapping()
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""
+SmartPack Backend Services
+Infrastructure shared by the API routes
+"""
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Anagram Index - Long-lived anagram groups keyed by canonical signature
+Words are added and removed incrementally; "which words are anagrams of X"
+is a single key computation plus a dict lookup. The index can be snapshotted
+to a JSON file and reloaded on startup without recomputing every key.
+Every read and write holds the index lock; bulk updates compute keys outside
+it and apply them in batches, so lookups wait for one batch at most.
+"""
+import json
+import os
+import threading
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from algorithms.arrays.anagram_keys import get_key_strategy
+
+# Only exact keys are indexable; hash keys would need verification on every lookup
+INDEX_KEY_STRATEGIES = ("sorted", "count")
+SNAPSHOT_VERSION = 1
+
+# Words applied per lock acquisition by add and remove
+UPDATE_BATCH = 10000
+
+class AnagramIndex:
+    def __init__(self, key: str = "sorted", snapshot_path: Optional[str] = None):
+        if key not in INDEX_KEY_STRATEGIES:
+            raise ValueError(f"Index key must be one of {list(INDEX_KEY_STRATEGIES)}, got '{key}'")
+        self.key = key
+        self.snapshot_path = snapshot_path
+        self._strategy = get_key_strategy(key)
+        # signature -> insertion-ordered set of words (dict with None values)
+        self._groups: Dict[Any, Dict[str, None]] = {}
+        self._words = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "AnagramIndex":
+        """
+        Build an index from SMARTPACK_ANAGRAM_KEY (sorted | count) and
+        SMARTPACK_ANAGRAM_INDEX (snapshot path, loaded now if it exists)
+        """
+        index = cls(
+            key=os.environ.get("SMARTPACK_ANAGRAM_KEY", "sorted"),
+            snapshot_path=os.environ.get("SMARTPACK_ANAGRAM_INDEX") or None
+        )
+        if index.snapshot_path and os.path.exists(index.snapshot_path):
+            index.load(index.snapshot_path)
+        return index
+
+    def __len__(self) -> int:
+        return self._words
+
+    def _keyed_batches(self, words: Iterable[str]) -> Iterator[List[Tuple[Any, str]]]:
+        """(signature, word) pairs in batches of UPDATE_BATCH, keyed without the lock"""
+        key = self._strategy.key
+        words = iter(words)
+        while True:
+            batch = [(key(word), word) for word in islice(words, UPDATE_BATCH)]
+            if not batch:
+                return
+            yield batch
+
+    def add(self, words: Iterable[str]) -> int:
+        """Insert words, returning how many were new"""
+        added = 0
+        for batch in self._keyed_batches(words):
+            with self._lock:
+                for signature, word in batch:
+                    group = self._groups.setdefault(signature, {})
+                    if word not in group:
+                        group[word] = None
+                        added += 1
+                        self._words += 1
+        return added
+
+    def remove(self, words: Iterable[str]) -> int:
+        """Delete words, returning how many were present"""
+        removed = 0
+        for batch in self._keyed_batches(words):
+            with self._lock:
+                for signature, word in batch:
+                    group = self._groups.get(signature)
+                    if group is not None and word in group:
+                        del group[word]
+                        removed += 1
+                        self._words -= 1
+                        if not group:
+                            del self._groups[signature]
+        return removed
+
+    def lookup(self, word: str) -> List[str]:
+        """All indexed anagrams of word (including word itself if indexed)"""
+        signature = self._strategy.key(word)
+        with self._lock:
+            group = self._groups.get(signature)
+            return list(group) if group else []
+
+    def group_size(self, word: str) -> int:
+        """Number of indexed words sharing word's signature"""
+        signature = self._strategy.key(word)
+        with self._lock:
+            group = self._groups.get(signature)
+            return len(group) if group else 0
+
+    def contains(self, word: str) -> bool:
+        signature = self._strategy.key(word)
+        with self._lock:
+            group = self._groups.get(signature)
+            return bool(group) and word in group
+
+    def clear(self) -> None:
+        with self._lock:
+            self._groups.clear()
+            self._words = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Size of the index and of its largest group"""
+        with self._lock:
+            largest = max(map(len, self._groups.values()), default=0)
+            return {
+                "words": self._words,
+                "groups": len(self._groups),
+                "largest_group": largest,
+                "key": self.key,
+                "snapshot_path": self.snapshot_path
+            }
+
+    def snapshot(self, path: Optional[str] = None) -> str:
+        """
+        Write the groups to path atomically (temp file + rename)
+        Only the words are stored; on reload one key per group is recomputed.
+        """
+        path = path or self.snapshot_path
+        if not path:
+            raise ValueError("No snapshot path configured (set SMARTPACK_ANAGRAM_INDEX)")
+        with self._lock:
+            payload = {"version": SNAPSHOT_VERSION, "key": self.key, "groups": [list(group) for group in self._groups.values()]}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, path: Optional[str] = None) -> int:
+        """Replace the index contents with a snapshot, returning the word count"""
+        path = path or self.snapshot_path
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported anagram index snapshot version {payload.get('version')}")
+
+        # Snapshots taken with another key strategy are re-keyed word by word
+        if payload["key"] != self.key:
+            self.clear()
+            return self.add(word for group in payload["groups"] for word in group)
+
+        key = self._strategy.key
+        groups = {key(group[0]): dict.fromkeys(group) for group in payload["groups"] if group}
+        with self._lock:
+            self._groups = groups
+            self._words = sum(map(len, groups.values()))
+            return self._words
@@ -0,0 +1,87 @@
+"""
+Binary Payloads - Compact numeric request/response encodings
+Numeric arrays can be sent as raw little-endian int64 (application/octet-stream)
+or msgpack (application/x-msgpack) instead of JSON. Raw int64 bodies are
+decoded zero-copy into NumPy arrays or memoryviews that the analyzers consume
+directly.
+"""
+import sys
+from array import array
+from typing import Any, Optional, Sequence
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; raw int64 needs no extra dependency
+    msgpack = None
+
+BINARY_MEDIA_TYPE = "application/octet-stream"
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+def decode_numbers(body: bytes, media_type: str, picklable: bool = False) -> Sequence[int]:
+    """
+    Decode a numeric request body
+    Raw int64 is wrapped without copying (a read-only NumPy array, or a
+    memoryview when NumPy is missing). memoryviews cannot cross process
+    boundaries, so picklable=True falls back to a single-copy array.
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        if msgpack is None:
+            raise ValueError("msgpack is not installed on this server")
+        numbers = msgpack.unpackb(body)
+        if not isinstance(numbers, list) or not all(isinstance(num, int) for num in numbers):
+            raise ValueError("msgpack body must be an array of integers")
+        return numbers
+
+    if media_type != BINARY_MEDIA_TYPE:
+        raise ValueError(f"Unsupported content type '{media_type}'")
+    if len(body) % 8:
+        raise ValueError(f"Body must hold whole int64 values, got {len(body)} bytes")
+
+    np = _numpy()
+    if np is not None:
+        return np.frombuffer(body, dtype="<i8")
+    if sys.byteorder == "little" and not picklable:
+        return memoryview(body).cast("q")
+    numbers = array("q")
+    numbers.frombytes(body)
+    if sys.byteorder != "little":
+        numbers.byteswap()
+    return numbers
+
+def _numpy() -> Any:
+    """NumPy, imported by the first raw int64 request rather than at startup (None if not installed)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def is_ndarray(numbers: Any) -> bool:
+    # Nothing can be an ndarray before NumPy has been imported
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(numbers, np.ndarray)
+
+def to_list(numbers: Sequence[int]) -> list:
+    """Plain list of Python ints (for traces, which render their input)"""
+    if isinstance(numbers, list):
+        return numbers
+    return numbers.tolist()
+
+def encode_int64(values: Any) -> Optional[bytes]:
+    """Raw little-endian int64 bytes for a list of ints, or None if it does not fit"""
+    if not isinstance(values, list) or not all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+        return None
+    if values and (min(values) < INT64_MIN or max(values) > INT64_MAX):
+        return None
+    encoded = array("q", values)
+    if sys.byteorder != "little":
+        encoded.byteswap()
+    return encoded.tobytes()
+
+def encode_msgpack(payload: Any) -> bytes:
+    return msgpack.packb(payload)
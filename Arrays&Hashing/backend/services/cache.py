@@ -0,0 +1,191 @@
+"""
+Result Cache - Content-addressed cache for serialized analysis responses
+Keys are hashes of (endpoint, canonicalized payload); values are response
+bodies held in a memory-bounded LRU with TTL, with an optional sqlite tier
+that survives restarts. The sqlite tier has its own byte budget and evicts
+its least recently written or read rows past it (memory hits do not touch
+disk); its calls block on disk, so the API makes them off the event loop.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+class ResultCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: Optional[float] = 300.0,
+                 disk_path: Optional[str] = None, disk_max_bytes: int = 1024 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_path = disk_path
+        self.disk_max_bytes = disk_max_bytes
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "disk_hits": 0, "evictions": 0, "disk_evictions": 0,
+                          "expirations": 0}
+
+        self._db = None
+        if disk_path:
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            columns = [row[1] for row in self._db.execute("PRAGMA table_info(results)")]
+            if columns and "used" not in columns:
+                # A cache file without last-use times cannot be evicted in order; start it over
+                self._db.execute("DROP TABLE results")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, expires REAL, used REAL, size INTEGER, body BLOB)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+            self._db.commit()
+            self._disk_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    @classmethod
+    def from_env(cls) -> "ResultCache":
+        """
+        Build a cache from SMARTPACK_CACHE_MAX_BYTES (0 disables caching),
+        SMARTPACK_CACHE_TTL (seconds, 0 for no expiry), SMARTPACK_CACHE_DB
+        (sqlite path enabling the on-disk tier) and SMARTPACK_CACHE_DB_MAX_BYTES
+        (the on-disk tier's budget)
+        """
+        ttl = float(os.environ.get("SMARTPACK_CACHE_TTL", "300"))
+        return cls(
+            max_bytes=int(os.environ.get("SMARTPACK_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            ttl=ttl or None,
+            disk_path=os.environ.get("SMARTPACK_CACHE_DB") or None,
+            disk_max_bytes=int(os.environ.get("SMARTPACK_CACHE_DB_MAX_BYTES", str(1024 * 1024 * 1024)))
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def blocking(self) -> bool:
+        """Whether calls may wait on the sqlite tier (callers on an event loop use a thread)"""
+        return self._db is not None
+
+    @staticmethod
+    def make_key(endpoint: str, payload: Any) -> str:
+        """Hash of the endpoint and the canonical JSON form of the payload"""
+        canonical = json.dumps([endpoint, payload], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for key, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, body = entry
+                if expires >= now:
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return body
+                self._remove(key)
+                self._counters["expirations"] += 1
+
+        entry = self._disk_get(key, now)
+        with self._lock:
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["hits"] += 1
+            self._counters["disk_hits"] += 1
+        self._memory_set(key, entry[1], entry[0])
+        return entry[1]
+
+    def set(self, key: str, body: bytes) -> None:
+        """Store a response body under key"""
+        if not self.enabled:
+            return
+        expires = time.time() + self.ttl if self.ttl else float("inf")
+        self._memory_set(key, body, expires)
+        if self._db is not None and len(body) <= self.disk_max_bytes:
+            with self._lock:
+                self._disk_delete(key)
+                self._db.execute(
+                    "INSERT INTO results (key, expires, used, size, body) VALUES (?, ?, ?, ?, ?)",
+                    (key, expires, time.time(), len(body), body)
+                )
+                self._disk_bytes += len(body)
+                # Least recently used rows go first, as in memory
+                while self._disk_bytes > self.disk_max_bytes:
+                    oldest = self._db.execute("SELECT key FROM results ORDER BY used LIMIT 1").fetchone()
+                    self._disk_delete(oldest[0])
+                    self._counters["disk_evictions"] += 1
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current memory usage"""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": self._counters["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "disk_tier": self.disk_path,
+                "disk_bytes": self._disk_bytes,
+                "disk_max_bytes": self.disk_max_bytes
+            }
+
+    def _memory_set(self, key: str, body: bytes, expires: float) -> None:
+        # Bodies larger than the whole budget are only kept on disk
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires, body)
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._counters["evictions"] += 1
+
+    def _remove(self, key: str) -> None:
+        _, body = self._entries.pop(key)
+        self._bytes -= len(body)
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, bytes]]:
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT expires, body FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[0] < now:
+                self._disk_delete(key)
+                self._db.commit()
+                self._counters["expirations"] += 1
+                return None
+            self._db.execute("UPDATE results SET used = ? WHERE key = ?", (now, key))
+            self._db.commit()
+        return row[0], bytes(row[1])
+
+    def _disk_delete(self, key: str) -> None:
+        # Caller holds the lock and commits
+        row = self._db.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._disk_bytes -= row[0]
@@ -0,0 +1,300 @@
+"""
+Dataset Store - Upload-once int64 arrays shared by every worker process
+Datasets are raw little-endian int64 files in a shared directory (/dev/shm
+when available), named by a hash of their content. Any worker process maps
+a dataset read-only and hands analyzers a zero-copy view instead of a
+re-sent JSON array. While a process holds references to a dataset it keeps
+a shared flock on the file; ingesting past the byte budget evicts the least
+recently used datasets that no process has locked.
+"""
+import fcntl
+import hashlib
+import mmap
+import os
+import re
+import sys
+import tempfile
+import threading
+from array import array
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+DATASET_SUFFIX = ".i64"
+DATASET_ID = re.compile(r"[0-9a-f]{32}")
+
+def default_directory() -> str:
+    """/dev/shm (memory-backed on Linux) when present, the temp directory otherwise"""
+    root = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(root, "smartpack-datasets")
+
+def int64_bytes(numbers: Sequence[int]) -> bytes:
+    """Little-endian int64 encoding of a list of ints (OverflowError outside int64)"""
+    values = array("q", numbers)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tobytes()
+
+class DatasetNotFoundError(LookupError):
+    """Raised for unknown or evicted dataset ids"""
+
+class DatasetStoreFullError(Exception):
+    """Raised when a dataset cannot fit because the datasets in use fill the budget"""
+
+class DatasetRef:
+    """
+    Picklable handle on a stored dataset, resolved on the worker by
+    DatasetStore.attach (results_only jobs may receive the raw int64 array)
+    """
+    __slots__ = ("id", "length", "results_only")
+
+    def __init__(self, dataset_id: str, length: int, results_only: bool = False):
+        self.id = dataset_id
+        self.length = length
+        self.results_only = results_only
+
+    def __len__(self) -> int:
+        return self.length
+
+class _Mapping:
+    """A dataset mapped into this process, with its reference count"""
+
+    def __init__(self, fd: int, buffer: Optional[mmap.mmap]):
+        self.fd = fd
+        self.buffer = buffer
+        self.refs = 0
+
+class DatasetStore:
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 1024 * 1024 * 1024):
+        self.directory = directory or default_directory()
+        self.max_bytes = max_bytes
+        self._mappings: Dict[str, _Mapping] = {}
+        self._lock = threading.Lock()
+        self._counters = {"ingested": 0, "deduplicated": 0, "evictions": 0, "attached": 0}
+        os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> "DatasetStore":
+        """
+        Build a store from SMARTPACK_DATASET_DIR (shared by every worker
+        process; defaults to /dev/shm/smartpack-datasets) and
+        SMARTPACK_DATASET_MAX_BYTES
+        """
+        return cls(
+            directory=os.environ.get("SMARTPACK_DATASET_DIR") or None,
+            max_bytes=int(os.environ.get("SMARTPACK_DATASET_MAX_BYTES", str(1024 * 1024 * 1024)))
+        )
+
+    def _path(self, dataset_id: str) -> str:
+        if not DATASET_ID.fullmatch(dataset_id):
+            raise DatasetNotFoundError(f"No dataset '{dataset_id}'")
+        return os.path.join(self.directory, dataset_id + DATASET_SUFFIX)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Serialize ingestion and eviction across processes"""
+        fd = os.open(os.path.join(self.directory, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def ingest(self, data: bytes) -> Dict[str, Any]:
+        """
+        Store little-endian int64 bytes, returning the dataset info
+        Identical content maps to the same id and is stored once.
+        """
+        if len(data) % 8:
+            raise ValueError(f"Dataset must hold whole int64 values, got {len(data)} bytes")
+        if len(data) > self.max_bytes:
+            raise DatasetStoreFullError(f"Dataset of {len(data)} bytes exceeds the {self.max_bytes} byte budget")
+        dataset_id = hashlib.blake2b(data, digest_size=16).hexdigest()
+        path = self._path(dataset_id)
+
+        with self._exclusive():
+            if os.path.exists(path):
+                os.utime(path)
+                self._counters["deduplicated"] += 1
+                return self.info(dataset_id)
+            self._evict(len(data))
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".ingest-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        self._counters["ingested"] += 1
+        return self.info(dataset_id)
+
+    def _evict(self, incoming: int) -> None:
+        """Unlink least recently used datasets until incoming bytes fit (exclusive lock held)"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(DATASET_SUFFIX):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total + incoming <= self.max_bytes:
+                break
+            if self._try_unlink(os.path.join(self.directory, name)):
+                total -= size
+                self._counters["evictions"] += 1
+        if total + incoming > self.max_bytes:
+            raise DatasetStoreFullError(
+                f"Datasets in use hold {total} of {self.max_bytes} bytes; cannot fit {incoming} more"
+            )
+
+    @staticmethod
+    def _try_unlink(path: str) -> bool:
+        """Unlink a dataset unless some process holds a reference (its shared lock)"""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            return True
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        else:
+            # Processes that opened the file before the unlink keep intact data until they unmap it
+            os.unlink(path)
+            return True
+        finally:
+            os.close(fd)
+
+    def info(self, dataset_id: str) -> Dict[str, Any]:
+        try:
+            stat = os.stat(self._path(dataset_id))
+        except FileNotFoundError:
+            raise DatasetNotFoundError(f"No dataset '{dataset_id}' (never uploaded, deleted or evicted)")
+        mapping = self._mappings.get(dataset_id)
+        return {
+            "id": dataset_id,
+            "length": stat.st_size // 8,
+            "bytes": stat.st_size,
+            "last_used": stat.st_mtime,
+            "references": mapping.refs if mapping is not None else 0
+        }
+
+    def list_datasets(self) -> List[Dict[str, Any]]:
+        """Stored datasets, most recently used first"""
+        datasets = []
+        for name in os.listdir(self.directory):
+            if name.endswith(DATASET_SUFFIX):
+                try:
+                    datasets.append(self.info(name[:-len(DATASET_SUFFIX)]))
+                except DatasetNotFoundError:
+                    continue
+        return sorted(datasets, key=lambda dataset: dataset["last_used"], reverse=True)
+
+    def delete(self, dataset_id: str) -> None:
+        """Remove a dataset; analyses already holding it finish on their mapping"""
+        path = self._path(dataset_id)
+        with self._exclusive():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                raise DatasetNotFoundError(f"No dataset '{dataset_id}'")
+
+    def ref(self, dataset_id: str, results_only: bool = False) -> DatasetRef:
+        """Handle on an existing dataset for a job argument"""
+        return DatasetRef(dataset_id, self.info(dataset_id)["length"], results_only)
+
+    def _acquire(self, dataset_id: str) -> _Mapping:
+        with self._lock:
+            mapping = self._mappings.get(dataset_id)
+            if mapping is None:
+                path = self._path(dataset_id)
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except FileNotFoundError:
+                    raise DatasetNotFoundError(f"No dataset '{dataset_id}' (deleted or evicted)")
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_SH)
+                    size = os.fstat(fd).st_size
+                    buffer = mmap.mmap(fd, size, access=mmap.ACCESS_READ) if size else None
+                except BaseException:
+                    os.close(fd)
+                    raise
+                mapping = self._mappings[dataset_id] = _Mapping(fd, buffer)
+                try:
+                    os.utime(path)  # LRU order is the file's modification time
+                except OSError:
+                    pass
+            mapping.refs += 1
+            self._counters["attached"] += 1
+            return mapping
+
+    def _release(self, dataset_id: str) -> None:
+        with self._lock:
+            mapping = self._mappings[dataset_id]
+            mapping.refs -= 1
+            if mapping.refs:
+                return
+            del self._mappings[dataset_id]
+        if mapping.buffer is not None:
+            try:
+                mapping.buffer.close()
+            except BufferError:
+                pass  # a view outlived the job; the mapping is freed with it
+        os.close(mapping.fd)
+
+    @staticmethod
+    def _numbers(mapping: _Mapping, results_only: bool) -> Any:
+        """
+        A mapped dataset as a job reads it: the zero-copy int64 array when the
+        job is results-only and the vectorized engine will take it, plain ints
+        otherwise (traces render their input, and the pure-Python engine is
+        fastest on ints). The array is read-only; analyzers that fall back
+        from the vectorized engine convert it to ints first.
+        """
+        if mapping.buffer is None:
+            return []
+        if results_only:
+            from algorithms.arrays import vectorized
+            if vectorized.np is not None and len(mapping.buffer) // 8 >= vectorized.VECTORIZE_THRESHOLD:
+                return vectorized.np.frombuffer(mapping.buffer, dtype="<i8")
+        if sys.byteorder == "little":
+            return memoryview(mapping.buffer).cast("q").tolist()
+        values = array("q")
+        values.frombytes(mapping.buffer)
+        values.byteswap()
+        return values.tolist()
+
+    @contextmanager
+    def attach(self, values: Sequence[Any]) -> Iterator[List[Any]]:
+        """Replace every DatasetRef in values with its numbers, holding a reference until the block exits"""
+        refs = [value for value in values if isinstance(value, DatasetRef)]
+        if not refs:
+            yield list(values)
+            return
+        attached = []
+        try:
+            resolved = []
+            for value in values:
+                if isinstance(value, DatasetRef):
+                    mapping = self._acquire(value.id)
+                    attached.append(value.id)
+                    value = self._numbers(mapping, value.results_only)
+                resolved.append(value)
+            yield resolved
+        finally:
+            for dataset_id in attached:
+                self._release(dataset_id)
+
+    def stats(self) -> Dict[str, Any]:
+        datasets = self.list_datasets()
+        return {
+            "directory": self.directory,
+            "count": len(datasets),
+            "bytes": sum(dataset["bytes"] for dataset in datasets),
+            "max_bytes": self.max_bytes,
+            "mapped": len(self._mappings),
+            **self._counters
+        }
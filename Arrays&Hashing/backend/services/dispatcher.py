@@ -0,0 +1,130 @@
+"""
+Analysis Dispatcher - Runs CPU-bound analyzer calls off the asyncio event loop
+Work goes to a thread or process pool behind a bounded queue so one large
+request cannot stall every other client. With the thread pool it also owns
+the parallel scan pool that chunk-parallel analyzers borrow.
+"""
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from algorithms import parallel
+
+EXECUTOR_TYPES = ("thread", "process")
+
+class QueueFullError(Exception):
+    """Raised when the dispatcher cannot accept more work (backpressure)"""
+
+class Dispatcher:
+    def __init__(self, executor: str = "thread", max_workers: Optional[int] = None,
+                 max_queue: int = 64, timeout: Optional[float] = 30.0,
+                 parallel_workers: Optional[int] = None):
+        if executor not in EXECUTOR_TYPES:
+            raise ValueError(f"Unknown executor type '{executor}', expected one of {EXECUTOR_TYPES}")
+
+        self.executor_type = executor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+        # A process pool already runs requests in parallel, so its workers scan sequentially
+        self.parallel_workers = (parallel_workers or os.cpu_count() or 1) if executor == "thread" else 1
+        self._executor: Optional[Executor] = None
+        self._scan_executor: Optional[Executor] = None
+        self._pending = 0
+        # Released from pool threads as calls finish
+        self._pending_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "Dispatcher":
+        """
+        Build a dispatcher from SMARTPACK_EXECUTOR, SMARTPACK_WORKERS,
+        SMARTPACK_QUEUE_SIZE, SMARTPACK_TIMEOUT (seconds, 0 disables) and
+        SMARTPACK_PARALLEL_WORKERS (parallel scan processes, 1 disables)
+        """
+        workers = os.environ.get("SMARTPACK_WORKERS")
+        parallel_workers = os.environ.get("SMARTPACK_PARALLEL_WORKERS")
+        timeout = float(os.environ.get("SMARTPACK_TIMEOUT", "30"))
+        return cls(
+            executor=os.environ.get("SMARTPACK_EXECUTOR", "thread"),
+            max_workers=int(workers) if workers else None,
+            max_queue=int(os.environ.get("SMARTPACK_QUEUE_SIZE", "64")),
+            timeout=timeout or None,
+            parallel_workers=int(parallel_workers) if parallel_workers else None
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of running plus queued calls"""
+        return self.max_workers + self.max_queue
+
+    @property
+    def pending(self) -> int:
+        """Number of calls currently running or queued"""
+        return self._pending
+
+    def start(self) -> None:
+        """Create the worker pool, and the parallel scan pool for a thread pool (idempotent)"""
+        if self._executor is not None:
+            return
+        if self.executor_type == "process":
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="smartpack-worker")
+        if self.parallel_workers > 1:
+            # Spawned, not forked: the server process already runs threads
+            self._scan_executor = ProcessPoolExecutor(max_workers=self.parallel_workers,
+                                                      mp_context=multiprocessing.get_context("spawn"))
+            parallel.set_executor(self._scan_executor, self.parallel_workers)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool and the parallel scan pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        if self._scan_executor is not None:
+            parallel.set_executor(None)
+            self._scan_executor.shutdown(wait=wait, cancel_futures=True)
+            self._scan_executor = None
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run fn(*args, **kwargs) on the pool
+        Raises QueueFullError when the queue is full and asyncio.TimeoutError
+        when the call exceeds the per-request timeout. A timed-out call keeps
+        its slot until the pool actually finishes (or drops) it, so calls
+        still occupying workers count against the capacity. With a process
+        pool, fn and its arguments must be picklable.
+        """
+        with self._pending_lock:
+            if self._pending >= self.capacity:
+                raise QueueFullError(f"Analysis queue is full ({self.capacity} pending requests)")
+            self._pending += 1
+
+        try:
+            self.start()
+            future = self._executor.submit(functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        # Cancelling the wrapper on timeout also drops the call if it has not started yet
+        return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+
+    def _release(self, future: Optional[Future] = None) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Current pool configuration and load"""
+        return {
+            "executor": self.executor_type,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "timeout": self.timeout,
+            "parallel_workers": self.parallel_workers,
+            "pending": self._pending
+        }
\ No newline at end of file
@@ -0,0 +1,243 @@
+"""
+Analysis Jobs - The pool-run job and stream tracer of each registered algorithm
+Jobs are plain module-level functions, named by their "module:function"
+path in the algorithm registry, so any pool type can run them. Every job
+takes the request data first, then detail and the keyword arguments the
+plugin's argument readers produce; numeric jobs that share derived
+structures also take shared. Tracers take the data and the plugin's trace
+arguments and return the response metadata with a single traced run.
+"""
+from typing import List, Dict, Any, Optional, Tuple
+from pydantic import BaseModel
+from algorithms.arrays.shared import NumericDataset
+from algorithms.registry import registry as algorithm_registry
+from algorithms.trace import Trace, summarize_steps
+from . import metrics
+
+class AnalysisResponse(BaseModel):
+    result: Any
+    algorithm: str
+    complexity: Dict[str, str]
+    explanation: str
+    steps: List[str]
+    visualization_data: Optional[Dict[str, Any]] = None
+
+def analyzer(name: str) -> Any:
+    """Registered analyzer instance, imported and created on first use"""
+    return algorithm_registry.analyzer(name)
+
+# Response metadata per analysis
+DUPLICATES_INFO = algorithm_registry.get("duplicates").info
+DUPLICATE_ENGINE_INFO = {
+    "hash": DUPLICATES_INFO,
+    "bitset": {
+        "algorithm": "Contains Duplicate (Bitset)",
+        "complexity": {"time": "O(n)", "space": "O(r/8) bytes for a range of r values"},
+        "explanation": "Marks each value's bit in a bitset over the value range, stopping at the first bit already set"
+    },
+    "sort": {
+        "algorithm": "Contains Duplicate (Sort)",
+        "complexity": {"time": "O(n log n)", "space": "O(1) extra"},
+        "explanation": "Sorts the values in place and compares neighbours"
+    },
+    "bloom": {
+        "algorithm": "Contains Duplicate (Bloom Pre-Filter)",
+        "complexity": {"time": "O(n)", "space": "O(n log(1/p)) bits + O(flagged)"},
+        "explanation": "Streams values through a Bloom filter and exactly confirms only the values it flags"
+    }
+}
+VALID_ANAGRAM_INFO = algorithm_registry.get("anagrams").info
+GROUP_ANAGRAMS_INFO = dict(VALID_ANAGRAM_INFO, algorithm="Group Anagrams (Hash Map)")
+FREQUENCY_INFO = algorithm_registry.get("frequency").info
+FREQUENCY_STRATEGY_INFO = {
+    "heap": FREQUENCY_INFO,
+    "bucket": {
+        "algorithm": "Top K Frequent Elements (Bucket Sort)",
+        "complexity": {"time": "O(n + k log k)", "space": "O(n)"},
+        "explanation": "Buckets values by frequency and reads the buckets from the highest frequency down"
+    },
+    "nlargest": {
+        "algorithm": "Top K Frequent Elements (heapq.nlargest)",
+        "complexity": {"time": "O(n log k)", "space": "O(n + k)"},
+        "explanation": "Counts frequencies and selects the k largest (frequency, value) pairs"
+    },
+    "approximate": {
+        "algorithm": "Approximate Top K (Space-Saving)",
+        "complexity": {"time": "O(n log m)", "space": "O(m)"},
+        "explanation": "Keeps m counters, replacing the smallest; estimates overcount by at most n/m"
+    }
+}
+PAIRS_INFO = algorithm_registry.get("pairs").info
+PAIR_MODE_INFO = {
+    "first": PAIRS_INFO,
+    "all": {
+        "algorithm": "All Pairs (Value Index)",
+        "complexity": {"time": "O(n + p)", "space": "O(n)"},
+        "explanation": "Maps each value to its indices and lists every earlier complement index"
+    },
+    "count": {
+        "algorithm": "Pair Count (Value Index)",
+        "complexity": {"time": "O(n)", "space": "O(n)"},
+        "explanation": "Multiplies the occurrence counts of each value and its complement"
+    },
+    "multi": {
+        "algorithm": "Multi-Target Two Sum (Shared Index)",
+        "complexity": {"time": "O(n + t*u)", "space": "O(n)"},
+        "explanation": "Builds the value index once and answers every target over the distinct values"
+    },
+    "ksum": {
+        "algorithm": "k-Sum (Sorted Two Pointers)",
+        "complexity": {"time": "O(n log n + n^(k-1))", "space": "O(n)"},
+        "explanation": "Sorts once, fixes k-2 values and sweeps two pointers, skipping duplicates at every level"
+    }
+}
+PRODUCTS_INFO = algorithm_registry.get("products").info
+PRODUCT_MODE_NAMES = {
+    "mod": "Modular",
+    "log": "Float64 Log Space",
+    "int64": "Int64 Overflow-Checked"
+}
+SEQUENCES_INFO = algorithm_registry.get("sequences").info
+ENCODING_INFO = algorithm_registry.get("encoding").info
+
+def build_response(info: Dict[str, Any], result: Any) -> AnalysisResponse:
+    """Results-only response: no trace is computed"""
+    # Values come straight from the analyzers, so the model is built without re-validation
+    with metrics.phase("response_model"):
+        return AnalysisResponse.model_construct(result=result, steps=[], **info)
+
+def build_traced_response(info: Dict[str, Any], trace: Trace, detail: str) -> AnalysisResponse:
+    """Response rendered from a trace at the requested detail level"""
+    with metrics.phase("steps"):
+        if detail == "summary":
+            steps = summarize_steps(trace.iter_steps())
+        else:
+            steps = trace.steps()
+    with metrics.phase("visualization"):
+        visualization_data = trace.visualization()
+    with metrics.phase("response_model"):
+        return AnalysisResponse.model_construct(
+            result=trace.result,
+            steps=steps,
+            visualization_data=visualization_data,
+            **info
+        )
+
+def run_duplicates(numbers: List[int], detail: str = "full", shared: Optional[NumericDataset] = None,
+                   engine: str = "hash", engine_options: Optional[Dict[str, Any]] = None) -> AnalysisResponse:
+    if engine != "hash":
+        # Memory-lean engines are results-only; the walkthrough is the hash set scan
+        response = build_response(DUPLICATE_ENGINE_INFO[engine],
+                                  analyzer("duplicates").contains_duplicate(numbers, engine=engine, **(engine_options or {})))
+        if detail != "result":
+            response.visualization_data = {"engine": engine, **(engine_options or {})}
+        return response
+    if detail == "result":
+        frequency = shared.frequency if shared else None
+        return build_response(DUPLICATES_INFO, analyzer("duplicates").contains_duplicate(numbers, frequency))
+    return build_traced_response(DUPLICATES_INFO, analyzer("duplicates").trace(numbers), detail)
+
+def trace_duplicates(numbers: List[int]) -> Tuple[Dict[str, Any], Trace]:
+    return DUPLICATES_INFO, analyzer("duplicates").trace(numbers)
+
+def run_anagrams(strings: List[str], detail: str = "full", key: str = "sorted") -> AnalysisResponse:
+    # Valid anagram check for two strings, group anagrams otherwise
+    if detail == "result":
+        if len(strings) == 2:
+            return build_response(VALID_ANAGRAM_INFO, analyzer("anagrams").is_valid_anagram(strings[0], strings[1]))
+        return build_response(GROUP_ANAGRAMS_INFO, analyzer("anagrams").group_anagrams(strings, key))
+    info, trace = trace_anagrams(strings, key)
+    return build_traced_response(info, trace, detail)
+
+def trace_anagrams(strings: List[str], key: str = "sorted") -> Tuple[Dict[str, Any], Trace]:
+    trace = analyzer("anagrams").trace(strings, key)
+    return (VALID_ANAGRAM_INFO if trace.algorithm == "valid_anagram" else GROUP_ANAGRAMS_INFO), trace
+
+def run_frequency(numbers: List[int], detail: str = "full", shared: Optional[NumericDataset] = None,
+                  k: Optional[int] = None, strategy: str = "heap",
+                  capacity: Optional[int] = None) -> AnalysisResponse:
+    k = k or 1
+    if strategy == "approximate":
+        if capacity is None:
+            from algorithms.arrays.heavy_hitters import DEFAULT_CAPACITY
+            capacity = DEFAULT_CAPACITY
+        summary = analyzer("frequency").approximate_top_k(numbers, k, capacity)
+        response = build_response(FREQUENCY_STRATEGY_INFO[strategy], summary["top_k"])
+        if detail != "result":
+            response.visualization_data = summary
+        return response
+
+    frequency = shared.frequency if shared else None
+    if detail == "result":
+        return build_response(FREQUENCY_STRATEGY_INFO[strategy],
+                              analyzer("frequency").top_k_frequent(numbers, k, frequency, strategy))
+    return build_traced_response(FREQUENCY_STRATEGY_INFO[strategy],
+                                 analyzer("frequency").trace(numbers, k, frequency, strategy), detail)
+
+def trace_frequency(numbers: List[int], k: Optional[int] = None,
+                    strategy: str = "heap") -> Tuple[Dict[str, Any], Trace]:
+    return FREQUENCY_STRATEGY_INFO[strategy], analyzer("frequency").trace(numbers, k or 1, None, strategy)
+
+def run_pairs(numbers: List[int], detail: str = "full", target: Optional[int] = None, mode: str = "first",
+              targets: Optional[List[int]] = None, k: Optional[int] = None,
+              limit: Optional[int] = None) -> AnalysisResponse:
+    pair_calculator = analyzer("pairs")
+    if mode != "first":
+        # Search modes are results-only; the walkthrough is single-target Two Sum
+        from algorithms.arrays.pair_search import DEFAULT_PAIR_LIMIT
+        limit = limit or DEFAULT_PAIR_LIMIT
+        if mode == "multi":
+            result = pair_calculator.two_sum_many(numbers, targets)
+        elif mode == "ksum":
+            result = pair_calculator.k_sum(numbers, target, k or 3, limit)
+        else:
+            result = pair_calculator.find_pairs(numbers, target, mode, limit)
+        response = build_response(PAIR_MODE_INFO[mode], result)
+        if detail != "result":
+            response.visualization_data = {"mode": mode, "target": target, "targets": targets,
+                                           "k": (k or 3) if mode == "ksum" else None}
+        return response
+    if detail == "result":
+        return build_response(PAIRS_INFO, pair_calculator.two_sum(numbers, target))
+    return build_traced_response(PAIRS_INFO, pair_calculator.trace(numbers, target), detail)
+
+def trace_pairs(numbers: List[int], target: int) -> Tuple[Dict[str, Any], Trace]:
+    return PAIRS_INFO, analyzer("pairs").trace(numbers, target)
+
+def run_products(numbers: List[int], detail: str = "full", mode: str = "exact",
+                 modulus: Optional[int] = None) -> AnalysisResponse:
+    pair_calculator = analyzer("products")
+    if mode != "exact":
+        # Numeric modes are results-only; the walkthrough is the exact algorithm
+        if modulus is None:
+            from algorithms.arrays.products import DEFAULT_MODULUS
+            modulus = DEFAULT_MODULUS
+        info = dict(PRODUCTS_INFO, algorithm=f"Product of Array Except Self ({PRODUCT_MODE_NAMES[mode]})")
+        response = build_response(info, pair_calculator.product_except_self(numbers, mode, modulus))
+        if detail != "result":
+            response.visualization_data = {"mode": mode, "modulus": modulus if mode == "mod" else None}
+        return response
+    if detail == "result":
+        return build_response(PRODUCTS_INFO, pair_calculator.product_except_self(numbers))
+    return build_traced_response(PRODUCTS_INFO, pair_calculator.trace_products(numbers), detail)
+
+def trace_products(numbers: List[int]) -> Tuple[Dict[str, Any], Trace]:
+    return PRODUCTS_INFO, analyzer("products").trace_products(numbers)
+
+def run_sequences(numbers: List[int], detail: str = "full",
+                  shared: Optional[NumericDataset] = None) -> AnalysisResponse:
+    num_set = shared.num_set if shared else None
+    if detail == "result":
+        return build_response(SEQUENCES_INFO, analyzer("sequences").longest_consecutive(numbers, num_set))
+    return build_traced_response(SEQUENCES_INFO, analyzer("sequences").trace(numbers, num_set), detail)
+
+def trace_sequences(numbers: List[int]) -> Tuple[Dict[str, Any], Trace]:
+    return SEQUENCES_INFO, analyzer("sequences").trace(numbers)
+
+def run_encoding(strings: List[str], detail: str = "full", codec: str = "string") -> AnalysisResponse:
+    if detail == "result":
+        return build_response(ENCODING_INFO, analyzer("encoding").round_trip(strings, codec))
+    return build_traced_response(ENCODING_INFO, analyzer("encoding").trace(strings, codec), detail)
+
+def trace_encoding(strings: List[str], codec: str = "string") -> Tuple[Dict[str, Any], Trace]:
+    return ENCODING_INFO, analyzer("encoding").trace(strings, codec)
@@ -0,0 +1,262 @@
+"""
+Request Metrics - Per-endpoint, per-phase latency histograms and profiling
+MetricsMiddleware times every request and binds a RequestMetrics record to
+the request's context; the handler path adds the parse and dispatch phases,
+and jobs run through run_instrumented on the worker pool report their own
+phases (algorithm, steps, visualization, response model, serialization)
+back with the result. Everything is exposed in the Prometheus text format.
+"""
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Input sizes are labelled by the power of ten they fall under
+SIZE_BUCKETS = (10, 100, 1000, 10_000, 100_000, 1_000_000, 10_000_000)
+PROFILE_TOP = int(os.environ.get("SMARTPACK_PROFILE_TOP", "25"))
+
+Labels = Tuple[Tuple[str, str], ...]
+
+def size_bucket(n: Optional[int]) -> str:
+    """Label for an input size: the smallest bucket bound it does not exceed"""
+    if n is None:
+        return "none"
+    for bound in SIZE_BUCKETS:
+        if n <= bound:
+            return f"le_{bound}"
+    return f"gt_{SIZE_BUCKETS[-1]}"
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+class MetricsRegistry:
+    """Named histograms and counters keyed by label sets"""
+
+    def __init__(self):
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, text: str) -> None:
+        self._help[name] = text
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    def inc(self, name: str, amount: float = 1, **labels: Any) -> None:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def render(self) -> str:
+        """Prometheus text exposition (format 0.0.4)"""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                self._header(lines, name, "counter")
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+            for name, series in sorted(self._histograms.items()):
+                self._header(lines, name, "histogram")
+                for labels, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', _format_value(bound)),))} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def _header(self, lines: List[str], name: str, kind: str) -> None:
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, value in labels)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}"
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+registry = MetricsRegistry()
+registry.describe("smartpack_requests_total", "HTTP requests by route template and status code")
+registry.describe("smartpack_request_seconds", "End-to-end request latency by route template and input size")
+registry.describe("smartpack_phase_seconds", "Time spent per request phase by route template and input size")
+
+class RequestMetrics:
+    """Phase timings of one in-flight request"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.size: Optional[int] = None
+        self.phases: Dict[str, float] = {}
+        self.profile: Optional[List[Dict[str, Any]]] = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def mark_parsed(self) -> None:
+        """Close the parse phase (body read and validation) on first call"""
+        if "parse" not in self.phases:
+            self.phases["parse"] = time.perf_counter() - self.start
+
+_current_request: ContextVar[Optional[RequestMetrics]] = ContextVar("smartpack_request_metrics", default=None)
+# Phase collector of the job running on this worker thread
+_current_job: ContextVar[Optional[Dict[str, float]]] = ContextVar("smartpack_job_phases", default=None)
+
+def current_request() -> Optional[RequestMetrics]:
+    return _current_request.get()
+
+def handler_started(size: Optional[int] = None) -> None:
+    """Called by a handler once its input is parsed: closes the parse phase and records the input size"""
+    request = _current_request.get()
+    if request is not None:
+        request.mark_parsed()
+        if size is not None:
+            request.size = size
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block as one phase of the job (or request) in progress; a no-op outside one"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        job = _current_job.get()
+        if job is not None:
+            job[name] = job.get(name, 0.0) + elapsed
+        else:
+            request = _current_request.get()
+            if request is not None:
+                request.add(name, elapsed)
+
+def run_instrumented(job: Callable[..., Any], args: Tuple[Any, ...],
+                     profile: bool = False) -> Tuple[Any, Dict[str, float], Optional[List[Dict[str, Any]]]]:
+    """
+    Run job(*args) on a worker, returning its result, its phase timings and
+    (with profile) the top cProfile entries by cumulative time
+    Time not claimed by a named phase is reported as "algorithm".
+    """
+    phases: Dict[str, float] = {}
+    token = _current_job.set(phases)
+    profiler = cProfile.Profile() if profile else None
+    start = time.perf_counter()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        try:
+            result = job(*args)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+    finally:
+        _current_job.reset(token)
+    total = time.perf_counter() - start
+    phases["algorithm"] = max(0.0, total - sum(phases.values()))
+    phases["job"] = total
+    return result, phases, profile_entries(profiler) if profiler is not None else None
+
+def profile_entries(profiler: cProfile.Profile, limit: int = PROFILE_TOP) -> List[Dict[str, Any]]:
+    """Top functions by cumulative time as plain dicts"""
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    entries = []
+    for (filename, line, function), (_, calls, total, cumulative, _) in stats.stats.items():
+        entries.append({
+            "function": f"{os.path.basename(filename)}:{line}({function})",
+            "calls": calls,
+            "total_time": round(total, 6),
+            "cumulative_time": round(cumulative, 6)
+        })
+    entries.sort(key=lambda entry: entry["cumulative_time"], reverse=True)
+    return entries[:limit]
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request counts and latencies per route
+    template, and phase histograms for requests whose handler reported them
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = registry):
+        self.app = app
+        self.registry = registry
+        self._templates: Dict[Any, str] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = _current_request.set(metrics)
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_request.reset(token)
+            elapsed = time.perf_counter() - metrics.start
+            endpoint = self._template(scope)
+            size = size_bucket(metrics.size)
+            self.registry.inc("smartpack_requests_total", endpoint=endpoint, method=scope["method"],
+                              status=status["code"])
+            self.registry.observe("smartpack_request_seconds", elapsed, endpoint=endpoint, size=size)
+            if metrics.phases:
+                # Whatever no phase claimed: routing, response encoding and sending
+                metrics.add("respond", max(0.0, elapsed - sum(metrics.phases.values())))
+            for name, seconds in metrics.phases.items():
+                self.registry.observe("smartpack_phase_seconds", seconds, endpoint=endpoint, phase=name, size=size)
+
+    def _template(self, scope) -> str:
+        """Route path template of the matched endpoint (bounded label cardinality)"""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        template = self._templates.get(endpoint)
+        if template is None:
+            app = scope.get("app")
+            template = next((route.path for route in getattr(app, "routes", ())
+                             if getattr(route, "endpoint", None) is endpoint), "unmatched")
+            self._templates[endpoint] = template
+        return template
@@ -0,0 +1,58 @@
+"""
+Response Serialization - Fast JSON encoding of analysis responses
+Responses are encoded straight from their fields, without re-validating or
+dumping the pydantic model first. orjson (when installed) encodes nested
+visualization data natively, including int dict keys and NumPy arrays;
+payloads it cannot represent (integers beyond 64 bits) fall back to the
+stdlib encoder. SMARTPACK_JSON_ENCODER selects orjson, pydantic
+(model_dump_json) or stdlib explicitly.
+"""
+import json
+import os
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is always available
+    orjson = None
+
+from pydantic import BaseModel
+
+ENCODERS = ("orjson", "pydantic", "stdlib")
+ENCODER = os.environ.get("SMARTPACK_JSON_ENCODER", "orjson" if orjson is not None else "stdlib")
+if ENCODER not in ENCODERS or (ENCODER == "orjson" and orjson is None):
+    raise ValueError(f"SMARTPACK_JSON_ENCODER must be one of {list(ENCODERS)} (orjson requires the orjson package)")
+
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else 0
+
+def fields(model: BaseModel) -> Dict[str, Any]:
+    """A model's field values in declaration order, without copying or re-validating them"""
+    return {name: getattr(model, name) for name in type(model).model_fields}
+
+def _default(obj: Any) -> Any:
+    """Values neither encoder handles natively"""
+    if isinstance(obj, BaseModel):
+        return fields(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "tolist"):  # NumPy arrays and scalars
+        return obj.tolist()
+    return str(obj)
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+def dumps(obj: Any) -> bytes:
+    """Compact JSON for any response payload"""
+    if ENCODER == "orjson":
+        try:
+            return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+        except TypeError:
+            pass  # integers beyond 64 bits; orjson.JSONEncodeError is a TypeError
+    return _stdlib_dumps(obj)
+
+def encode_response(response: BaseModel) -> bytes:
+    """JSON body of a response model, field order matching model_dump_json"""
+    if ENCODER == "pydantic":
+        return response.model_dump_json().encode()
+    return dumps(fields(response))
@@ -0,0 +1,37 @@
+"""
+Trace Streaming - Incremental NDJSON / Server-Sent Events encoding of traces
+Steps are rendered lazily from the trace and written frame by frame, so the
+full steps list and response body are never held in memory at once.
+"""
+from typing import Any, Dict, Iterator
+from algorithms.trace import Trace
+from . import serialization
+
+STREAM_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream"
+}
+
+def iter_frames(info: Dict[str, Any], trace: Trace) -> Iterator[Dict[str, Any]]:
+    """
+    Yield response frames in order: meta, result, one frame per step,
+    visualization, done
+    """
+    yield {"type": "meta", **info}
+    yield {"type": "result", "result": trace.result}
+
+    count = 0
+    for count, step in enumerate(trace.iter_steps(), 1):
+        yield {"type": "step", "index": count - 1, "text": step}
+
+    yield {"type": "visualization", "data": trace.visualization()}
+    yield {"type": "done", "total_steps": count}
+
+def encode_frames(frames: Iterator[Dict[str, Any]], fmt: str = "ndjson") -> Iterator[str]:
+    """Serialize frames as NDJSON lines or SSE events"""
+    for frame in frames:
+        data = serialization.dumps(frame).decode()
+        if fmt == "sse":
+            yield f"event: {frame['type']}\ndata: {data}\n\n"
+        else:
+            yield data + "\n"
@@ -1,10 +1,14 @@
 """
 Template for new DSA algorithm implementations
-Replace TemplateName with your algorithm name
+Replace TemplateName with your algorithm name, add its job (and tracer) to
+services/jobs.py, then register it in algorithms/registry.py with the
+"module:attribute" paths of all three (imported lazily) and the argument
+readers its job takes; its routes and mapping entry are generated
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+from ..trace import Trace, TracedAnalyzer
 
-class TemplateName:
+class TemplateName(TracedAnalyzer):
     def algorithm_method(self, input_data: List[Any]) -> Any:
         """
         Brief description of what the algorithm does
@@ -12,18 +16,35 @@ class TemplateName:
         """
         # Implementation here
         pass
-    
+
+    def trace(self, input_data: List[Any]) -> Trace:
+        """
+        Single instrumented run of algorithm_method
+        """
+        trace = Trace("algorithm_method", input_data, self)
+        # Run the algorithm once, calling trace.emit(...) at each decision point
+        # and keeping derived structures in trace.state
+        trace.result = None
+        return trace
+
     def get_steps(self, input_data: List[Any]) -> List[str]:
         """Generate step-by-step explanation"""
-        steps = []
-        # Add step-by-step logic here
-        return steps
-    
+        return self.trace(input_data).steps()
+
     def get_visualization_data(self, input_data: List[Any]) -> Dict[str, Any]:
         """Generate data for visualization"""
+        return self.trace(input_data).visualization()
+
+    def iter_steps(self, trace: Trace) -> Iterator[str]:
+        """Render steps from the trace events"""
+        # Add step-by-step rendering of trace.events here
+        yield from []
+
+    def render_visualization(self, trace: Trace) -> Dict[str, Any]:
+        """Render visualization data from the trace"""
         return {
-            "input": input_data,
-            "output": None,
-            "steps": [],
+            "input": trace.input,
+            "output": trace.result,
+            "steps": trace.events,
             "complexity": {"time": "O(?)", "space": "O(?)"}
         }
\ No newline at end of file
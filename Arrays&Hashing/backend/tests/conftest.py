@@ -0,0 +1,56 @@
+"""
+Test configuration - puts backend/ on sys.path so tests import its packages
+the way main.py does (run with python -m pytest from backend/), and provides
+the numeric engine fixture and inputs shared by the equivalence tests
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.arrays import vectorized  # noqa: E402 (needs backend/ on sys.path)
+
+@pytest.fixture(params=["python", "numpy"])
+def numeric_engine(request, monkeypatch):
+    """Run a test once on the pure-Python engine and once on the vectorized one (when NumPy is installed)"""
+    if request.param == "numpy":
+        if not vectorized.available():
+            pytest.skip("NumPy is not installed")
+        monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 1)
+    else:
+        monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", float("inf"))
+    return request.param
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    """Test client over a fresh result cache and dataset store"""
+    from fastapi.testclient import TestClient
+    import main
+    from services.cache import ResultCache
+    from services.datasets import DatasetStore
+    monkeypatch.setattr(main, "result_cache", ResultCache())
+    monkeypatch.setattr(main, "dataset_store", DatasetStore(str(tmp_path / "datasets")))
+    with TestClient(main.app) as client:
+        yield client
+
+def numeric_inputs(seed: int = 0):
+    """Small arrays covering the shapes the engines special-case, plus random ones"""
+    rng = random.Random(seed)
+    cases = [
+        [], [7], [3, 3], [1, 2], [-1, 1], [0, 0, 0],
+        [5, 4, 3, 2, 1], [1, 2, 2, 3, 3, 3], [-3, -2, -1, 0, 2, 3],
+        [10 ** 12, -10 ** 12, 10 ** 12 + 1],
+        [2 ** 61, -2 ** 61, 0, 2 ** 61],
+    ]
+    for size in (10, 50, 200):
+        cases.append(rng.sample(range(-10 * size, 10 * size), size))  # unique, sparse
+        cases.append([rng.randint(-size // 4, size // 4) for _ in range(size)])  # many duplicates
+        cases.append([rng.randint(-10 ** 15, 10 ** 15) for _ in range(size)])  # wide range
+        start = rng.randint(-100, 100)
+        runs = list(range(start, start + size // 2)) + list(range(start + size, start + size + size // 3))
+        rng.shuffle(runs)
+        cases.append(runs)  # consecutive runs
+    return cases
@@ -0,0 +1,86 @@
+"""
+Anagram Index - lookups, counts and snapshots agree with grouping by sorted
+letters, and reads never run on the event loop or skip the index lock
+"""
+import random
+import threading
+
+import pytest
+
+from services import anagram_index as anagram_index_module
+from services.anagram_index import AnagramIndex
+
+def random_words(seed: int, count: int):
+    rng = random.Random(seed)
+    letters = "abcde"  # a small alphabet makes plenty of anagrams
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(1, 4))) for _ in range(count)]
+
+def brute_lookup(words, word):
+    """Distinct indexed words with word's letters, in first-insertion order"""
+    return [w for w in dict.fromkeys(words) if sorted(w) == sorted(word)]
+
+@pytest.fixture(params=["sorted", "count"])
+def index(request):
+    return AnagramIndex(request.param)
+
+def test_lookups_match_grouping_by_sorted_letters(index, monkeypatch):
+    monkeypatch.setattr(anagram_index_module, "UPDATE_BATCH", 7)  # many lock batches
+    words = random_words(1, 300)
+    assert index.add(words) == len(set(words))
+    assert index.add(words[:50]) == 0
+    removed = words[::3]
+    assert index.remove(removed + ["zzzz"]) == len(set(removed))
+    remaining = [w for w in words if w not in set(removed)]
+
+    assert len(index) == len(set(remaining))
+    for word in random_words(2, 100) + words[:20]:
+        expected = brute_lookup(remaining, word)
+        assert index.lookup(word) == expected
+        assert index.group_size(word) == len(expected)
+        assert index.contains(word) == (word in expected)
+    stats = index.stats()
+    assert stats["groups"] == len({"".join(sorted(w)) for w in remaining})
+
+def test_snapshot_round_trip_and_rekeying(tmp_path):
+    words = random_words(3, 200)
+    path = str(tmp_path / "index.json")
+    source = AnagramIndex("sorted")
+    source.add(words)
+    source.snapshot(path)
+    for key in ("sorted", "count"):
+        loaded = AnagramIndex(key)
+        assert loaded.load(path) == len(set(words))
+        for word in words[:30] + ["edcba"]:
+            assert sorted(loaded.lookup(word)) == sorted(source.lookup(word))
+
+@pytest.mark.parametrize("read", ["lookup", "group_size", "contains"])
+def test_reads_wait_for_the_index_lock(read):
+    index = AnagramIndex()
+    index.add(["listen", "silent"])
+    finished = threading.Event()
+    with index._lock:
+        reader = threading.Thread(target=lambda: (getattr(index, read)("enlist"), finished.set()))
+        reader.start()
+        assert not finished.wait(0.05)
+    reader.join(5)
+    assert finished.is_set()
+
+def test_lookup_route_runs_off_the_event_loop(api, monkeypatch):
+    import main
+    index = AnagramIndex()
+    threads = []
+    lookup = index.lookup
+
+    def recording_lookup(word):
+        threads.append(threading.current_thread())
+        return lookup(word)
+
+    async def loop_thread():
+        return threading.current_thread()
+
+    monkeypatch.setattr(index, "lookup", recording_lookup)
+    monkeypatch.setattr(main, "anagram_index", index)
+    assert api.post("/anagrams/index", json={"words": ["listen", "silent", "google"]}).json()["added"] == 3
+    assert api.get("/anagrams/index/enlist").json() == {
+        "word": "enlist", "anagrams": ["listen", "silent"], "group_size": 2, "indexed": False}
+    assert threads and threads[0] is not api.portal.call(loop_thread)
@@ -0,0 +1,49 @@
+"""
+Anagram Key Tests - every key strategy groups words exactly like grouping by
+their sorted characters, including forced multiset hash collisions
+"""
+import random
+from collections import defaultdict
+
+import pytest
+
+from algorithms.arrays.anagram_analyzer import AnagramAnalyzer
+from algorithms.arrays.anagram_keys import KEY_STRATEGIES, MultisetHashKey, group_by_key
+
+def random_words(seed: int, alphabet: str, count: int):
+    rng = random.Random(seed)
+    roots = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6))) for _ in range(count // 4 + 1)]
+    return ["".join(rng.sample(root, len(root))) for root in (rng.choice(roots) for _ in range(count))]
+
+CASES = [
+    [], [""], ["eat", "tea", "tan", "ate", "nat", "bat"], ["a", "A", "ab", "ba", "aab", "abb"],
+    random_words(1, "abc", 200), random_words(2, "abcdefghijklmnopqrstuvwxyz", 500),
+    random_words(3, "aZé🙂 1", 300),  # outside the count key's alphabet
+]
+
+def sorted_groups(strs):
+    """Groups in first-seen order by sorted characters"""
+    groups = defaultdict(list)
+    for s in strs:
+        groups["".join(sorted(s))].append(s)
+    return list(groups.values())
+
+@pytest.mark.parametrize("strs", CASES)
+@pytest.mark.parametrize("key", list(KEY_STRATEGIES))
+def test_key_strategies_group_like_sorting(strs, key):
+    assert sorted(AnagramAnalyzer().group_anagrams(strs, key)) == sorted(sorted_groups(strs))
+
+@pytest.mark.parametrize("strs", CASES)
+def test_hash_collisions_are_split_by_verification(strs):
+    strategy = MultisetHashKey()
+    strategy._hashes = defaultdict(lambda: 1)  # every word of a length collides
+    groups, keys = group_by_key(strs, strategy)
+    assert sorted(groups) == sorted(sorted_groups(strs))
+    assert keys == [(len(s), len(s)) for s in strs]
+
+@pytest.mark.parametrize("key", list(KEY_STRATEGIES))
+def test_anagram_route_groups_with_each_key(api, key):
+    strs = CASES[4]
+    response = api.post("/analyze/anagrams", json={"strings": strs, "options": {"key": key, "detail": "result"}})
+    assert response.status_code == 200, response.text
+    assert sorted(response.json()["result"]) == sorted(sorted_groups(strs))
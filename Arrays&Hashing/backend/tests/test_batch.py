@@ -0,0 +1,45 @@
+"""
+Batch Analysis - every (dataset, algorithm) entry of /analyze/batch matches
+the response of the algorithm's own POST /analyze/{name}
+"""
+import pytest
+
+DATASETS = [[3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5], [10, 11, 12, 40, 41, 7, 7, 7, -2], []]
+
+CASES = [
+    ("duplicates", {}, {}),
+    ("duplicates", {}, {"engine": "bloom", "error_rate": 0.5}),
+    ("duplicates", {}, {"engine": "sort"}),
+    ("duplicates", {}, {"engine": "bitset", "range": [-10, 100]}),
+    ("frequency", {"k": 2}, {}),
+    ("frequency", {"k": 2}, {"strategy": "bucket"}),
+    ("frequency", {"k": 2}, {"strategy": "approximate", "capacity": 4}),
+    ("sequences", {}, {}),
+    ("products", {}, {}),
+    ("products", {}, {"mode": "mod", "modulus": 97}),
+    ("products", {}, {"mode": "log"}),
+    ("pairs", {"target": 10}, {}),
+    ("pairs", {"target": 10}, {"mode": "count"}),
+    ("pairs", {"target": 10}, {"mode": "all", "limit": 2}),
+    ("pairs", {"target": 12, "k": 3}, {"mode": "ksum"}),
+    ("pairs", {}, {"mode": "multi", "targets": [5, 10, 14]}),
+]
+
+@pytest.mark.parametrize("detail", ["result", "full"])
+@pytest.mark.parametrize("algorithm, fields, options", CASES)
+def test_batch_entries_match_the_single_route(api, algorithm, fields, options, detail):
+    options = {**options, "detail": detail}
+    batch = api.post("/analyze/batch", json={"datasets": DATASETS, "algorithms": [algorithm],
+                                             "options": options, **fields})
+    assert batch.status_code == 200, batch.text
+    for entry, numbers in zip(batch.json()["results"], DATASETS):
+        single = api.post(f"/analyze/{algorithm}", json={"numbers": numbers, "options": options, **fields})
+        assert single.status_code == 200, single.text
+        assert entry["response"] == single.json()
+
+def test_batch_rejects_invalid_options_like_the_single_route(api):
+    options = {"engine": "nope"}
+    batch = api.post("/analyze/batch", json={"numbers": [1, 2], "algorithms": ["duplicates"], "options": options})
+    single = api.post("/analyze/duplicates", json={"numbers": [1, 2], "options": options})
+    assert batch.status_code == single.status_code == 400
+    assert batch.json() == single.json()
@@ -0,0 +1,98 @@
+"""
+Benchmark Suite Tests - growth fits recover the model synthetic timings were
+drawn from, report comparison flags regressions, and every sweep target runs
+at a small size
+"""
+import math
+
+import pytest
+
+from benchmarks import compare, datasets, growth, suite
+from algorithms.arrays.pair_calculator import PairCalculator
+
+SIZES = [1000, 2000, 4000, 8000, 16000, 32000, 64000]
+
+@pytest.mark.parametrize("model", list(growth.MODELS))
+@pytest.mark.parametrize("overhead", [0.0, 1e-4])
+def test_fit_recovers_the_generating_model(model, overhead):
+    f = growth.MODELS[model]
+    scale = 1e-3 / f(SIZES[-1])
+    times = [overhead + scale * f(n) for n in SIZES]
+    result = growth.fit(SIZES, times)
+    assert result["model"] == model
+    assert result["residual"] < 1e-3
+    if overhead == 0.0 and model in ("O(n)", "O(n^2)"):
+        assert result["exponent"] == pytest.approx(math.log2(f(4) / f(2)), abs=1e-3)
+
+def test_fit_needs_three_sizes_and_positive_times():
+    assert growth.fit([1000, 2000], [1.0, 2.0]) is None
+    assert growth.fit([1000, 2000, 4000], [1.0, 0.0, 4.0]) is None
+    assert growth.fit([1, 2000, 4000, 8000], [1.0, 2.0, 4.0, 8.0])["model"] == "O(n)"
+
+def report(sweeps):
+    """A minimal report: {(target, model): {n: seconds}}"""
+    results = []
+    for (target, model), times in sweeps.items():
+        results.append({"kind": "analyzer", "target": target, "distribution": "unique", "phase": "core",
+                        "timings": [{"n": n, "min": t} for n, t in sorted(times.items())],
+                        "fit": {"model": model}})
+    return {"results": results}
+
+def test_compare_flags_largest_size_and_model_regressions():
+    baseline = report({
+        ("steady", "O(n)"): {1000: 1.0, 2000: 2.0},
+        ("small_noise", "O(n)"): {1000: 1.0, 2000: 2.0},
+        ("slower", "O(n)"): {1000: 1.0, 2000: 2.0},
+        ("worse_model", "O(n)"): {1000: 1.0, 2000: 2.0},
+        ("removed", "O(n)"): {1000: 1.0},
+    })
+    current = report({
+        ("steady", "O(n)"): {1000: 1.1, 2000: 2.2},
+        ("small_noise", "O(n)"): {1000: 2.0, 2000: 2.0},
+        ("slower", "O(n)"): {1000: 1.0, 2000: 3.0},
+        ("worse_model", "O(n^2)"): {1000: 1.0, 2000: 2.0},
+        ("added", "O(1)"): {1000: 1.0},
+    })
+    diff = compare.compare(baseline, current, threshold=1.25)
+    regressions = {entry["target"]: entry for entry in diff["regressions"]}
+    assert set(regressions) == {"slower", "worse_model"}
+    assert regressions["slower"]["slower_sizes"] == [2000] and not regressions["slower"]["model_regressed"]
+    assert regressions["worse_model"]["model_regressed"]
+    assert diff["only_in_baseline"] == ["analyzer / removed / unique / core"]
+    assert diff["only_in_current"] == ["analyzer / added / unique / core"]
+    assert {entry["target"]: entry["ratios"] for entry in diff["sweeps"]}["small_noise"] == {1000: 2.0, 2000: 1.0}
+
+@pytest.mark.parametrize("distribution", datasets.NUMERIC_DISTRIBUTIONS)
+def test_numeric_distributions(distribution):
+    nums = datasets.numbers(distribution, 400)
+    assert len(nums) == 400 and nums == datasets.numbers(distribution, 400)
+    if distribution == "unique":
+        assert len(set(nums)) == 400
+    if distribution == "duplicates":
+        assert len(set(nums)) <= 400 // datasets.DUPLICATION_FACTOR
+    assert PairCalculator().two_sum(nums, datasets.missing_target(nums)) is None
+
+@pytest.mark.parametrize("name", list(suite.ANALYZERS))
+def test_analyzer_phases_run(name):
+    kind, build_phases = suite.ANALYZERS[name]
+    data = suite.input_data(kind, suite.distributions_for(kind, None)[0], 60)
+    phases = build_phases(data)
+    core, steps, visualization = (phases[phase]() for phase in ("core", "get_steps", "get_visualization_data"))
+    assert steps and isinstance(visualization, dict)
+    if name == "EncoderDecoder":
+        assert core == data
+
+def test_run_analyzers_sweeps_every_phase():
+    results = suite.run_analyzers([20, 40, 80], repeat=1, max_seconds=5.0, names=["SequenceTracker"],
+                                  distributions=["runs"])
+    assert [r["phase"] for r in results] == ["core", "get_steps", "get_visualization_data"]
+    for result in results:
+        assert [t["n"] for t in result["timings"]] == [20, 40, 80]
+        assert result["fit"] is None or result["fit"]["model"] in growth.MODELS
+
+@pytest.mark.parametrize("name", list(suite.endpoint_cases()))
+def test_endpoint_cases_succeed(api, name):
+    kind, build, details = suite.endpoint_cases()[name]
+    data = suite.input_data(kind, suite.distributions_for(kind, None)[0], 40)
+    for detail in details:
+        build(api, data, detail)()  # raises on a non-200 response
@@ -0,0 +1,72 @@
+"""
+Binary Payloads - raw int64 requests reach the analyzers as int64 arrays;
+results must match the JSON route, including when products leave int64
+"""
+import struct
+
+import pytest
+
+from algorithms.arrays import vectorized
+
+pytestmark = pytest.mark.skipif(not vectorized.available(), reason="NumPy is not installed")
+
+def int64_body(values):
+    return struct.pack(f"<{len(values)}q", *values)
+
+@pytest.fixture
+def vectorize_small(monkeypatch):
+    """Hand even tiny payloads to the vectorized engine, as SMARTPACK_VECTORIZE_THRESHOLD=4 would"""
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 4)
+
+def post_binary(api, algorithm, values, accept="application/json", **params):
+    return api.post(f"/analyze/{algorithm}/binary", content=int64_body(values), params=params,
+                    headers={"content-type": "application/octet-stream", "accept": accept})
+
+def test_overflowing_products_are_exact(api, vectorize_small):
+    values = [2 ** 20] * 6
+    response = post_binary(api, "products", values)
+    assert response.status_code == 200
+    assert response.json()["result"] == [2 ** 100] * 6
+    assert response.json()["result"] == api.post("/analyze/products", json={"numbers": values}).json()["result"]
+
+def test_overflowing_products_are_not_sent_as_int64(api, vectorize_small):
+    response = post_binary(api, "products", [2 ** 20] * 6, accept="application/octet-stream")
+    assert response.headers["content-type"].startswith("application/json")
+    assert response.json()["result"] == [2 ** 100] * 6
+
+def test_products_in_int64_are_sent_as_int64(api, vectorize_small):
+    response = post_binary(api, "products", [1, 2, 3, 4], accept="application/octet-stream")
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert struct.unpack("<4q", response.content) == (24, 12, 8, 6)
+
+def test_zero_shortcut_products_are_exact(api, vectorize_small):
+    values = [2 ** 40, 0, 2 ** 40, 3]
+    assert post_binary(api, "products", values).json()["result"] == [0, 3 * 2 ** 80, 0, 0]
+
+@pytest.mark.parametrize("values, target", [
+    ([2 ** 62 - 1, 5, 2 ** 62 - 1, 1], 2 ** 63 - 2),
+    ([2 ** 62 + 1, 2 ** 62 + 2, 3, 4], 2 ** 63 + 3),
+])
+def test_pairs_near_int64_match_the_json_route(api, vectorize_small, values, target):
+    binary = post_binary(api, "pairs", values, target=target).json()["result"]
+    assert binary == api.post("/analyze/pairs", json={"numbers": values, "target": target}).json()["result"]
+
+@pytest.mark.parametrize("algorithm", ["duplicates", "frequency", "sequences"])
+def test_values_past_the_safe_range_match_the_json_route(api, vectorize_small, algorithm):
+    values = [2 ** 63 - 1, 2 ** 63 - 2, 2 ** 63 - 1, -2 ** 63]
+    binary = post_binary(api, algorithm, values, k=1).json()["result"]
+    assert binary == api.post(f"/analyze/{algorithm}", json={"numbers": values, "k": 1}).json()["result"]
+
+def test_analyzer_fallbacks_take_decoded_arrays_as_ints(vectorize_small):
+    from algorithms.arrays.pair_calculator import PairCalculator
+    from services import binary
+    calculator = PairCalculator()
+    big = binary.decode_numbers(int64_body([2 ** 40, 2 ** 40, 3, 2 ** 40]), binary.BINARY_MEDIA_TYPE)
+    with pytest.raises(OverflowError):
+        calculator.product_except_self(big, "int64")
+    modulus = 2 ** 61 - 1
+    assert calculator.product_except_self(big, "mod", modulus) == [
+        product % modulus for product in calculator.product_except_self(big.tolist())]
+    huge = binary.decode_numbers(int64_body([2 ** 62, 1, 2 ** 62, 2 ** 62]), binary.BINARY_MEDIA_TYPE)
+    assert calculator.k_sum(huge, 3 * 2 ** 62, 3) == {"combinations": [[2 ** 62] * 3], "truncated": False}
+    assert calculator.k_sum(huge, 2 ** 63 + 1, 3) == {"combinations": [[1, 2 ** 62, 2 ** 62]], "truncated": False}
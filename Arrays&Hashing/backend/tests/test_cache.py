@@ -0,0 +1,185 @@
+"""
+Result cache - LRU and TTL eviction in memory, and the sqlite tier
+"""
+import sqlite3
+
+import pytest
+
+from services import cache as cache_module
+from services.cache import ResultCache
+
+class Clock:
+    """Stand-in for time.time in the cache module"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return clock
+
+def test_keys_ignore_payload_key_order():
+    assert (ResultCache.make_key("/analyze/pairs", {"numbers": [1, 2], "target": 3})
+            == ResultCache.make_key("/analyze/pairs", {"target": 3, "numbers": [1, 2]}))
+    assert ResultCache.make_key("/analyze/pairs", {"numbers": [1, 2]}) != ResultCache.make_key("/analyze/products", {"numbers": [1, 2]})
+
+def test_least_recently_used_entry_is_evicted_past_the_byte_budget():
+    cache = ResultCache(max_bytes=30, ttl=None)
+    for key in ("a", "b", "c"):
+        cache.set(key, b"x" * 10)
+    assert cache.get("a") == b"x" * 10  # a is now the most recently used
+    cache.set("d", b"y" * 10)
+
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in ("a", "c", "d")] == [b"x" * 10, b"x" * 10, b"y" * 10]
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 30
+    assert stats["entries"] == 3
+
+def test_replacing_an_entry_updates_its_size():
+    cache = ResultCache(max_bytes=100, ttl=None)
+    cache.set("a", b"x" * 40)
+    cache.set("a", b"x" * 10)
+    assert cache.stats()["bytes"] == 10
+
+def test_bodies_larger_than_the_budget_are_not_kept_in_memory():
+    cache = ResultCache(max_bytes=10, ttl=None)
+    cache.set("big", b"x" * 11)
+    assert cache.get("big") is None
+    assert cache.stats()["bytes"] == 0
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = ResultCache(max_bytes=100, ttl=60)
+    cache.set("a", b"body")
+    clock.now += 59
+    assert cache.get("a") == b"body"
+    clock.now += 2
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["entries"] == 0 and stats["bytes"] == 0
+
+def test_disabled_cache_stores_nothing():
+    cache = ResultCache(max_bytes=0)
+    assert not cache.enabled
+    cache.set("a", b"body")
+    assert cache.get("a") is None
+
+def test_sqlite_tier_survives_a_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    ResultCache(max_bytes=100, ttl=None, disk_path=path).set("a", b"body")
+
+    restarted = ResultCache(max_bytes=100, ttl=None, disk_path=path)
+    assert restarted.get("a") == b"body"
+    assert restarted.stats()["disk_hits"] == 1
+    # The disk hit is promoted to memory
+    assert restarted.get("a") == b"body"
+    assert restarted.stats()["disk_hits"] == 1
+    assert restarted.stats()["entries"] == 1
+
+def test_sqlite_tier_keeps_bodies_evicted_from_memory(tmp_path):
+    cache = ResultCache(max_bytes=10, ttl=None, disk_path=str(tmp_path / "cache.db"))
+    cache.set("a", b"x" * 10)
+    cache.set("b", b"y" * 10)
+    cache.set("big", b"z" * 50)
+    assert cache.get("a") == b"x" * 10
+    assert cache.get("big") == b"z" * 50
+    assert cache.stats()["disk_hits"] == 2
+
+def test_sqlite_entries_expire_after_the_ttl(tmp_path, clock):
+    path = str(tmp_path / "cache.db")
+    ResultCache(max_bytes=100, ttl=60, disk_path=path).set("a", b"body")
+    clock.now += 61
+
+    restarted = ResultCache(max_bytes=100, ttl=60, disk_path=path)
+    assert restarted.get("a") is None
+    assert restarted.stats()["expirations"] == 1
+    # Expired rows are deleted from the disk tier
+    assert sqlite3.connect(path).execute("SELECT COUNT(*) FROM results").fetchone() == (0,)
+
+def test_clear_empties_both_tiers(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ResultCache(max_bytes=100, ttl=None, disk_path=path)
+    cache.set("a", b"body")
+    cache.clear()
+    assert cache.get("a") is None
+    assert ResultCache(max_bytes=100, ttl=None, disk_path=path).get("a") is None
+
+def disk_keys(path):
+    return {row[0] for row in sqlite3.connect(path).execute("SELECT key FROM results")}
+
+def test_sqlite_tier_evicts_least_recently_used_rows_past_its_budget(tmp_path, clock):
+    path = str(tmp_path / "cache.db")
+    cache = ResultCache(max_bytes=10, ttl=None, disk_path=path, disk_max_bytes=30)
+    for key in ("a", "b", "c"):
+        clock.now += 1
+        cache.set(key, key.encode() * 10)
+    clock.now += 1
+    assert cache.get("a") == b"a" * 10  # only c fits in memory, so this reads (and touches) the disk row
+    clock.now += 1
+    cache.set("d", b"d" * 10)
+
+    assert disk_keys(path) == {"a", "c", "d"}
+    stats = cache.stats()
+    assert stats["disk_evictions"] == 1
+    assert stats["disk_bytes"] == 30
+
+def test_sqlite_tier_budget_is_restored_after_a_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ResultCache(max_bytes=100, ttl=None, disk_path=path, disk_max_bytes=30)
+    cache.set("a", b"x" * 10)
+    cache.set("a", b"x" * 20)
+    restarted = ResultCache(max_bytes=100, ttl=None, disk_path=path, disk_max_bytes=30)
+    assert restarted.stats()["disk_bytes"] == 20
+    restarted.set("b", b"y" * 15)
+    assert disk_keys(path) == {"b"}
+    assert restarted.stats()["disk_bytes"] == 15
+
+def test_bodies_larger_than_the_disk_budget_are_not_written(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ResultCache(max_bytes=100, ttl=None, disk_path=path, disk_max_bytes=10)
+    cache.set("big", b"x" * 11)
+    assert disk_keys(path) == set()
+    assert cache.get("big") == b"x" * 11  # still served from memory
+
+def test_cache_files_without_last_use_times_are_rebuilt(tmp_path):
+    path = str(tmp_path / "cache.db")
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE results (key TEXT PRIMARY KEY, expires REAL, body BLOB)")
+    db.execute("INSERT INTO results VALUES ('a', 1e18, x'00')")
+    db.commit()
+    cache = ResultCache(max_bytes=100, ttl=None, disk_path=path)
+    assert cache.get("a") is None
+    cache.set("a", b"body")
+    assert ResultCache(max_bytes=100, ttl=None, disk_path=path).get("a") == b"body"
+
+def test_api_reads_the_sqlite_tier_off_the_event_loop(api, tmp_path, monkeypatch):
+    import threading
+    import main
+    cache = ResultCache(max_bytes=100_000, ttl=None, disk_path=str(tmp_path / "cache.db"))
+    loop_threads = set()
+    disk_threads = []
+    disk_get = cache._disk_get
+
+    def recording_disk_get(*args):
+        disk_threads.append(threading.current_thread())
+        return disk_get(*args)
+
+    async def probe():
+        loop_threads.add(threading.current_thread())
+
+    monkeypatch.setattr(cache, "_disk_get", recording_disk_get)
+    monkeypatch.setattr(main, "result_cache", cache)
+    body = {"numbers": [1, 2, 2]}
+    first = api.post("/analyze/duplicates", json=body).json()
+    assert api.post("/analyze/duplicates", json=body).json() == first
+    api.portal.call(probe)
+    assert disk_threads and not loop_threads & set(disk_threads)
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,83 @@
+"""
+Chunked Analysis Tests - streaming duplicates, top-k and longest run over
+chunks and files agree with the in-memory analyzers, with and without
+spilling partitions to disk
+"""
+import random
+from array import array
+from collections import Counter
+
+import pytest
+
+from conftest import numeric_inputs
+from algorithms.arrays.chunked import ChunkedAnalyzer, iter_file_chunks
+from algorithms.arrays.duplicate_detector import DuplicateDetector
+from algorithms.arrays.sequence_tracker import SequenceTracker
+
+CASES = numeric_inputs(seed=9) + [
+    [random.Random(9).randint(-40, 40) for _ in range(3000)],
+    random.Random(90).sample(range(-5000, 5000), 2500) + [17],  # the duplicate comes last
+]
+
+# Unbounded, spilling right away, and spilling into 2 partitions that re-split
+ANALYZERS = {
+    "memory": dict(),
+    "spill": dict(memory_budget=8),
+    "resplit": dict(memory_budget=3, partitions=2),
+}
+
+@pytest.fixture(params=list(ANALYZERS))
+def analyzer(request, tmp_path):
+    return ChunkedAnalyzer(tmp_dir=str(tmp_path), **ANALYZERS[request.param])
+
+def chunked(nums, size):
+    return [nums[i:i + size] for i in range(0, len(nums), size)]
+
+def brute_top_k(nums, k):
+    """Top k values by (frequency, value), descending"""
+    return [num for num, _ in sorted(Counter(nums).items(), key=lambda item: (item[1], item[0]), reverse=True)[:k]]
+
+@pytest.mark.parametrize("nums", CASES)
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_chunked_analyses_match_in_memory(analyzer, nums, chunk_size):
+    duplicate, _ = analyzer.contains_duplicate(chunked(nums, chunk_size), len(nums))
+    assert duplicate is DuplicateDetector().contains_duplicate(nums)
+
+    for k in (1, 3):
+        top, stats = analyzer.top_k_frequent(chunked(nums, chunk_size), k, len(nums))
+        assert top == brute_top_k(nums, k)
+        assert stats["values_read"] == len(nums) and stats["distinct"] == len(set(nums))
+
+    longest, _ = analyzer.longest_consecutive(chunked(nums, chunk_size))
+    assert longest == SequenceTracker().longest_consecutive(nums)
+
+def test_spills_leave_no_partition_files(tmp_path):
+    nums = random.Random(1).sample(range(100_000), 5000) * 2
+    analyzer = ChunkedAnalyzer(memory_budget=100, partitions=4, tmp_dir=str(tmp_path))
+    top, stats = analyzer.top_k_frequent(chunked(nums, 512), 5, len(nums))
+    assert top == brute_top_k(nums, 5)
+    assert stats["spilled_partitions"] > 4 and stats["partition_levels"] > 1
+    assert analyzer.contains_duplicate(chunked(nums, 512), len(nums))[0] is True
+    assert list(tmp_path.iterdir()) == []
+
+@pytest.mark.parametrize("nums", CASES[-4:])
+def test_files_read_back_every_value(tmp_path, nums):
+    binary_path, text_path = tmp_path / "nums.bin", tmp_path / "nums.txt"
+    with open(binary_path, "wb") as f:
+        array("q", nums).tofile(f)
+    text_path.write_text("\n".join(map(str, nums)) + "\n\n")
+    for path, fmt in ((binary_path, "binary"), (text_path, "text")):
+        assert [num for chunk in iter_file_chunks(str(path), fmt, chunk_size=100) for num in chunk] == nums
+
+def test_file_route_matches_single_route(api, tmp_path):
+    nums = CASES[-2]
+    path = tmp_path / "nums.bin"
+    with open(path, "wb") as f:
+        array("q", nums).tofile(f)
+    for algorithm, fields in (("duplicates", {}), ("frequency", {"k": 3}), ("sequences", {})):
+        with open(path, "rb") as f:
+            response = api.post(f"/analyze/file/{algorithm}", files={"file": f},
+                                data={"chunk_size": "256", **{key: str(value) for key, value in fields.items()}})
+        single = api.post(f"/analyze/{algorithm}", json={"numbers": nums, "options": {"detail": "result"}, **fields})
+        assert response.status_code == 200 and single.status_code == 200, response.text + single.text
+        assert response.json()["result"] == single.json()["result"]
@@ -0,0 +1,182 @@
+"""
+Dataset store - content-addressed ingest, attach reference counting and
+LRU eviction that skips datasets another process holds
+"""
+import multiprocessing
+import os
+from contextlib import contextmanager
+
+import pytest
+
+from services.datasets import (DatasetStore, DatasetRef, DatasetNotFoundError, DatasetStoreFullError,
+                               DATASET_SUFFIX, int64_bytes)
+
+VALUES = 8  # int64 values per test dataset
+
+def dataset(seed: int):
+    return [seed * 100 + i for i in range(VALUES)]
+
+def ingest(store: DatasetStore, seed: int, last_used: float) -> str:
+    """Store a dataset and pin its LRU position (the file's modification time)"""
+    dataset_id = store.ingest(int64_bytes(dataset(seed)))["id"]
+    os.utime(dataset_path(store, dataset_id), (last_used, last_used))
+    return dataset_id
+
+def dataset_path(store: DatasetStore, dataset_id: str) -> str:
+    return os.path.join(store.directory, dataset_id + DATASET_SUFFIX)
+
+def hold(directory: str, dataset_id: str, attached, release, sums) -> None:
+    """Worker process: attach a dataset and read it before and after release"""
+    store = DatasetStore(directory)
+    with store.attach([DatasetRef(dataset_id, VALUES)]) as (numbers,):
+        sums.put(sum(numbers))
+        attached.set()
+        release.wait(30)
+        sums.put(sum(numbers))
+
+@contextmanager
+def held_by_other_process(store: DatasetStore, dataset_id: str):
+    """Hold a dataset in a separate process; yields a queue of the sums it read"""
+    context = multiprocessing.get_context("spawn")
+    attached, release, sums = context.Event(), context.Event(), context.Queue()
+    process = context.Process(target=hold, args=(store.directory, dataset_id, attached, release, sums))
+    process.start()
+    try:
+        assert attached.wait(30), "holder process did not attach"
+        yield sums
+    finally:
+        release.set()
+        process.join(30)
+    assert process.exitcode == 0
+
+@pytest.fixture
+def store(tmp_path):
+    return DatasetStore(str(tmp_path), max_bytes=2 * VALUES * 8)
+
+def test_identical_content_is_stored_once(store):
+    first = store.ingest(int64_bytes(dataset(1)))
+    second = store.ingest(int64_bytes(dataset(1)))
+    assert first["id"] == second["id"]
+    assert first["length"] == VALUES and first["bytes"] == VALUES * 8
+    assert store.stats()["ingested"] == 1 and store.stats()["deduplicated"] == 1
+
+def test_rejects_partial_values_and_oversized_datasets(store):
+    with pytest.raises(ValueError):
+        store.ingest(b"\x00" * 12)
+    with pytest.raises(DatasetStoreFullError):
+        store.ingest(int64_bytes(list(range(3 * VALUES))))
+
+def test_attach_resolves_refs_and_counts_references(store):
+    dataset_id = ingest(store, 1, 100)
+    ref = store.ref(dataset_id)
+    with store.attach([ref, [7, 8]]) as (numbers, inline):
+        assert numbers == dataset(1)
+        assert inline == [7, 8]
+        assert store.info(dataset_id)["references"] == 1
+        with store.attach([ref]) as (again,):
+            assert again == dataset(1)
+            assert store.info(dataset_id)["references"] == 2
+        assert store.info(dataset_id)["references"] == 1
+    assert store.info(dataset_id)["references"] == 0
+    assert store.stats()["mapped"] == 0
+
+def test_attach_of_an_unknown_dataset(store):
+    with pytest.raises(DatasetNotFoundError):
+        with store.attach([DatasetRef("0" * 32, 0)]):
+            pass
+    assert store.stats()["mapped"] == 0
+
+def test_least_recently_used_dataset_is_evicted(store):
+    oldest, newer = ingest(store, 1, 100), ingest(store, 2, 200)
+    ingest(store, 3, 300)
+    with pytest.raises(DatasetNotFoundError):
+        store.info(oldest)
+    assert store.info(newer)["length"] == VALUES
+    assert store.stats()["evictions"] == 1
+
+def test_attach_refreshes_lru_position(store):
+    first, second = ingest(store, 1, 100), ingest(store, 2, 200)
+    with store.attach([store.ref(first)]):
+        pass
+    ingest(store, 3, 300)
+    assert store.info(first)["length"] == VALUES
+    with pytest.raises(DatasetNotFoundError):
+        store.info(second)
+
+def test_dataset_held_by_another_process_is_not_evicted(store):
+    held, unheld = ingest(store, 1, 100), ingest(store, 2, 200)
+    with held_by_other_process(store, held) as sums:
+        assert sums.get(timeout=30) == sum(dataset(1))
+        # Attaching refreshed its position; make it the eviction candidate again
+        os.utime(dataset_path(store, held), (1, 1))
+        ingest(store, 3, 300)
+        assert store.info(held)["length"] == VALUES
+        with pytest.raises(DatasetNotFoundError):
+            store.info(unheld)
+    # Released: the held dataset is evictable again
+    os.utime(dataset_path(store, held), (1, 1))
+    ingest(store, 4, 400)
+    with pytest.raises(DatasetNotFoundError):
+        store.info(held)
+
+def test_store_full_of_held_datasets_rejects_ingest(tmp_path):
+    store = DatasetStore(str(tmp_path), max_bytes=VALUES * 8)
+    held = ingest(store, 1, 100)
+    with held_by_other_process(store, held):
+        with pytest.raises(DatasetStoreFullError):
+            store.ingest(int64_bytes(dataset(2)))
+    assert store.ingest(int64_bytes(dataset(2)))["length"] == VALUES
+
+def test_deleted_dataset_stays_readable_where_attached(store):
+    dataset_id = ingest(store, 1, 100)
+    with held_by_other_process(store, dataset_id) as sums:
+        assert sums.get(timeout=30) == sum(dataset(1))
+        store.delete(dataset_id)
+        with pytest.raises(DatasetNotFoundError):
+            store.ref(dataset_id)
+    assert sums.get(timeout=30) == sum(dataset(1))
+
+def test_results_only_refs_map_to_a_zero_copy_array(store, monkeypatch):
+    from algorithms.arrays import vectorized
+    if vectorized.np is None:
+        pytest.skip("NumPy is not installed")
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 1)
+    dataset_id = ingest(store, 1, 100)
+    with store.attach([store.ref(dataset_id, results_only=True)]) as (numbers,):
+        assert isinstance(numbers, vectorized.np.ndarray)
+        assert not numbers.flags.owndata
+        assert numbers.tolist() == dataset(1)
+
+def analyze(api, algorithm, data, options=None, **fields):
+    """Result of a results-only analysis of inline numbers or a dataset_id"""
+    response = api.post(f"/analyze/{algorithm}", json={**data, **fields, "options": {"detail": "result", **(options or {})}})
+    assert response.status_code == 200, response.text
+    return response.json()["result"]
+
+@pytest.mark.parametrize("algorithm, fields", [
+    ("products", {}),
+    ("products", {"options": {"mode": "mod", "modulus": 2 ** 61 - 1}}),
+    ("pairs", {"target": 2 ** 63, "options": {"mode": "ksum"}, "k": 2}),
+    ("duplicates", {"options": {"engine": "sort"}}),
+    ("duplicates", {"options": {"engine": "bloom"}}),
+    ("frequency", {"k": 2, "options": {"strategy": "approximate"}}),
+])
+def test_results_only_dataset_analyses_match_inline_numbers(api, monkeypatch, algorithm, fields):
+    from algorithms.arrays import vectorized
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 4)
+    values = [2 ** 20] * 5 + [2 ** 62, 2 ** 62, 7]
+    dataset = {"dataset_id": api.post("/datasets", json={"numbers": values}).json()["id"]}
+    expected = analyze(api, algorithm, {"numbers": values}, **fields)
+    # The second request is served from the result cache
+    for _ in range(2):
+        assert analyze(api, algorithm, dataset, **fields) == expected
+
+def test_sort_engine_leaves_the_mapped_dataset_unsorted(api, monkeypatch):
+    from algorithms.arrays import vectorized
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 1)
+    values = [9, 4, 7, 4, 1]
+    dataset_id = api.post("/datasets", json={"numbers": values}).json()["id"]
+    assert analyze(api, "duplicates", {"dataset_id": dataset_id}, options={"engine": "sort"}) is True
+    import main
+    with main.dataset_store.attach([main.dataset_store.ref(dataset_id)]) as (numbers,):
+        assert numbers == values
@@ -0,0 +1,133 @@
+"""
+Dispatcher - backpressure (429) and timeouts (504), on the pool and through the API
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import main
+from services import metrics
+from services.dispatcher import Dispatcher, QueueFullError
+
+@pytest.fixture
+def make_dispatcher():
+    dispatchers = []
+
+    def make(**kwargs) -> Dispatcher:
+        dispatcher = Dispatcher(parallel_workers=1, **kwargs)
+        dispatchers.append(dispatcher)
+        return dispatcher
+
+    yield make
+    for dispatcher in dispatchers:
+        dispatcher.shutdown(wait=True)
+
+@pytest.fixture
+def release():
+    """Event blocking jobs wait on, always set at teardown so pools can shut down"""
+    event = threading.Event()
+    yield event
+    event.set()
+
+def wait_for_idle(dispatcher: Dispatcher, seconds: float = 5.0) -> None:
+    deadline = time.monotonic() + seconds
+    while dispatcher.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert dispatcher.pending == 0
+
+def test_run_returns_job_result(make_dispatcher):
+    dispatcher = make_dispatcher(max_workers=1, max_queue=1)
+    assert asyncio.run(dispatcher.run(sum, [1, 2, 3])) == 6
+    assert dispatcher.pending == 0
+
+def test_queue_full_rejects_until_a_slot_frees(make_dispatcher, release):
+    dispatcher = make_dispatcher(max_workers=1, max_queue=1, timeout=None)
+
+    async def scenario():
+        running = [asyncio.create_task(dispatcher.run(release.wait)) for _ in range(dispatcher.capacity)]
+        await asyncio.sleep(0)
+        assert dispatcher.pending == dispatcher.capacity
+        with pytest.raises(QueueFullError):
+            await dispatcher.run(sum, [])
+        release.set()
+        await asyncio.gather(*running)
+        return await dispatcher.run(sum, [4])
+
+    assert asyncio.run(scenario()) == 4
+    assert dispatcher.pending == 0
+
+def test_timed_out_job_keeps_its_slot_until_it_finishes(make_dispatcher, release):
+    dispatcher = make_dispatcher(max_workers=1, max_queue=0, timeout=0.05)
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await dispatcher.run(release.wait)
+        # The worker is still busy, so the queue stays bounded after the timeout
+        assert dispatcher.pending == 1
+        with pytest.raises(QueueFullError):
+            await dispatcher.run(sum, [])
+
+    asyncio.run(scenario())
+    release.set()
+    wait_for_idle(dispatcher)
+    assert asyncio.run(dispatcher.run(sum, [5])) == 5
+
+def test_dispatch_maps_full_queue_to_429(make_dispatcher, release, monkeypatch):
+    monkeypatch.setattr(main, "dispatcher", make_dispatcher(max_workers=1, max_queue=0, timeout=None))
+
+    async def scenario():
+        running = asyncio.create_task(main.dispatch(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as error:
+            await main.dispatch(sum, [1])
+        release.set()
+        await running
+        return error.value
+
+    assert asyncio.run(scenario()).status_code == 429
+
+def test_dispatch_maps_timeout_to_504(make_dispatcher, release, monkeypatch):
+    monkeypatch.setattr(main, "dispatcher", make_dispatcher(max_workers=1, max_queue=1, timeout=0.05))
+
+    async def scenario():
+        with pytest.raises(HTTPException) as error:
+            await main.dispatch(release.wait)
+        return error.value
+
+    error = asyncio.run(scenario())
+    assert error.status_code == 504
+    assert "0.05s timeout" in error.detail
+
+def test_analyze_route_returns_429_when_queue_is_full(make_dispatcher, release, monkeypatch):
+    dispatcher = make_dispatcher(max_workers=1, max_queue=0, timeout=None)
+    monkeypatch.setattr(main, "dispatcher", dispatcher)
+    with TestClient(main.app) as client:
+        blocker = threading.Thread(target=asyncio.run, args=(dispatcher.run(release.wait),))
+        blocker.start()
+        try:
+            deadline = time.monotonic() + 5
+            while dispatcher.pending < dispatcher.capacity and time.monotonic() < deadline:
+                time.sleep(0.01)
+            response = client.post("/analyze/duplicates", json={"numbers": [1, 2, 3]})
+        finally:
+            release.set()
+            blocker.join()
+        assert response.status_code == 429
+        assert client.post("/analyze/duplicates", json={"numbers": [1, 2, 2]}).json()["result"] is True
+
+def test_analyze_route_returns_504_on_timeout(make_dispatcher, monkeypatch):
+    monkeypatch.setattr(main, "dispatcher", make_dispatcher(max_workers=1, max_queue=1, timeout=0.05))
+    run_instrumented = metrics.run_instrumented
+
+    def slow_job(*args):
+        time.sleep(0.3)
+        return run_instrumented(*args)
+
+    monkeypatch.setattr(metrics, "run_instrumented", slow_job)
+    with TestClient(main.app) as client:
+        response = client.post("/analyze/sequences", json={"numbers": [1, 2, 3]})
+    assert response.status_code == 504
@@ -0,0 +1,90 @@
+"""
+Duplicate Engine Tests - every engine agrees with the hash-set answer on both
+the pure-Python and the vectorized path, including across chunk boundaries
+"""
+import random
+
+import pytest
+
+from conftest import numeric_inputs
+from algorithms.arrays import duplicate_engines, vectorized
+from algorithms.arrays.duplicate_detector import DuplicateDetector
+
+CASES = numeric_inputs(seed=20)
+
+@pytest.fixture(params=[vectorized.DUPLICATE_CHUNK, 7])
+def chunk(request, monkeypatch):
+    """Default chunk size and a tiny one, so duplicates straddle vectorized chunks"""
+    monkeypatch.setattr(vectorized, "DUPLICATE_CHUNK", request.param)
+    return request.param
+
+def has_duplicate(nums):
+    return len(set(nums)) != len(nums)
+
+def fits_bitset(nums):
+    return not nums or max(nums) - min(nums) < duplicate_engines.MAX_BITSET_BITS
+
+@pytest.mark.parametrize("nums", CASES)
+def test_bitset_matches(numeric_engine, chunk, nums):
+    if fits_bitset(nums):
+        assert duplicate_engines.bitset_contains_duplicate(nums) == has_duplicate(nums)
+    else:
+        with pytest.raises(ValueError, match="bitset limit"):
+            duplicate_engines.bitset_contains_duplicate(nums)
+
+@pytest.mark.parametrize("nums", CASES)
+def test_sort_matches(numeric_engine, chunk, nums):
+    assert duplicate_engines.sort_contains_duplicate(nums) == has_duplicate(nums)
+    copy = list(nums)
+    assert duplicate_engines.sort_contains_duplicate(copy, in_place=True) == has_duplicate(nums)
+
+@pytest.mark.parametrize("error_rate", [0.5, 0.01, 1e-6])
+@pytest.mark.parametrize("nums", CASES)
+def test_bloom_is_exact_at_any_error_rate(numeric_engine, chunk, nums, error_rate):
+    assert duplicate_engines.bloom_contains_duplicate(nums, error_rate) == has_duplicate(nums)
+
+@pytest.mark.parametrize("engine", duplicate_engines.DUPLICATE_ENGINES)
+def test_detector_engines_agree_on_large_inputs(numeric_engine, chunk, engine):
+    rng = random.Random(2020)
+    unique = rng.sample(range(-50_000, 50_000), 5_000)
+    late = unique + [unique[-1]]
+    early = [unique[0]] + unique
+    detector = DuplicateDetector()
+    for nums, expected in ((unique, False), (late, True), (early, True)):
+        assert detector.contains_duplicate(list(nums), engine=engine) is expected
+
+def test_sort_in_place_sorts_the_callers_list(numeric_engine):
+    nums = [5, 3, 9, 1]
+    assert duplicate_engines.sort_contains_duplicate(nums, in_place=True) is False
+    if numeric_engine == "python":
+        assert nums == [1, 3, 5, 9]
+    else:
+        assert nums == [5, 3, 9, 1]  # lists are copied into an array first
+
+def test_sort_in_place_sorts_an_int64_array(monkeypatch):
+    if not vectorized.available():
+        pytest.skip("NumPy is not installed")
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 1)
+    arr = vectorized.np.array([4, 2, 8, 2], dtype=vectorized.np.int64)
+    assert duplicate_engines.sort_contains_duplicate(arr, in_place=True) is True
+    assert arr.tolist() == [2, 2, 4, 8]
+
+def test_bitset_rejects_values_outside_the_range(numeric_engine):
+    with pytest.raises(ValueError, match="outside the bitset range"):
+        duplicate_engines.bitset_contains_duplicate([1, 2, 30], low=0, high=10)
+    with pytest.raises(ValueError, match="outside the bitset range"):
+        duplicate_engines.bitset_contains_duplicate([-1, 2], low=0, high=10)
+    with pytest.raises(ValueError, match="must not be below"):
+        duplicate_engines.bitset_contains_duplicate([1], low=5, high=3)
+    assert duplicate_engines.bitset_contains_duplicate([3, 10, 0], low=0, high=10) is False
+
+def test_bloom_rejects_invalid_error_rates():
+    for error_rate in (0, 1, -0.1):
+        with pytest.raises(ValueError, match="error_rate"):
+            duplicate_engines.bloom_parameters(10, error_rate)
+
+def test_engines_fall_back_outside_int64(numeric_engine):
+    nums = [2 ** 70, 5, 2 ** 70]
+    assert duplicate_engines.sort_contains_duplicate(nums) is True
+    assert duplicate_engines.bloom_contains_duplicate(nums) is True
+    assert duplicate_engines.bitset_contains_duplicate([2 ** 70, 2 ** 70 + 3], low=2 ** 70, high=2 ** 70 + 5) is False
@@ -0,0 +1,79 @@
+"""
+Encoder/Decoder Tests - the byte codecs round trip exactly what the string
+codec does, over every buffer type the zero-copy decoder accepts
+"""
+import mmap
+import random
+
+import pytest
+
+from algorithms.strings.encoder_decoder import BINARY_HEADER, EncoderDecoder
+
+ALPHABET = "ab#0123456789 é🙂\n"
+
+def random_lists(seed: int = 11):
+    rng = random.Random(seed)
+    cases = [[], [""], ["", ""], ["#"], ["12#"], ["3#abc"], ["x" * 1000, "y"]]
+    for size in (1, 5, 50, 300):
+        cases.append(["".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 30))) for _ in range(size)])
+    return cases
+
+CASES = random_lists()
+
+def buffers(data: bytes, tmp_path):
+    """data as bytes, bytearray, whole and sliced memoryviews and an mmap"""
+    padded = b"!!" + data + b"!!"
+    yield data
+    yield bytearray(data)
+    yield memoryview(data)
+    yield memoryview(padded)[2:2 + len(data)]
+    if data:
+        path = tmp_path / "encoded"
+        path.write_bytes(data)
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            yield view
+            view.release()
+
+@pytest.mark.parametrize("strs", CASES)
+@pytest.mark.parametrize("codec", ["utf8", "binary"])
+def test_byte_codecs_round_trip_like_the_string_codec(tmp_path, strs, codec):
+    encoder = EncoderDecoder()
+    assert encoder.decode(encoder.encode(strs)) == strs
+    encoded = encoder.encode_bytes(strs, codec)
+    for data in buffers(encoded, tmp_path):
+        assert encoder.decode_bytes(data, codec) == strs
+        assert [bytes(frame) for frame in encoder.iter_decode_bytes(data, codec)] == [s.encode() for s in strs]
+
+@pytest.mark.parametrize("strs", CASES)
+def test_byte_frames_match_a_reference_encoding(strs):
+    encoder = EncoderDecoder()
+    assert encoder.encode_bytes(strs, "utf8") == b"".join(b"%d#%s" % (len(s.encode()), s.encode()) for s in strs)
+    assert encoder.encode_bytes(strs, "binary") == b"".join(BINARY_HEADER.pack(len(s.encode())) + s.encode() for s in strs)
+    if all(s.isascii() for s in strs):
+        assert encoder.encode_bytes(strs, "utf8") == encoder.encode(strs).encode()
+
+@pytest.mark.parametrize("codec", ["string", "utf8", "binary"])
+def test_round_trip_reports_validity(codec):
+    for strs in CASES:
+        result = EncoderDecoder().round_trip(strs, codec)
+        assert result["decoded"] == strs and result["valid"] is True
+
+@pytest.mark.parametrize("data, codec", [
+    (b"5#abc", "utf8"), (b"x#abc", "utf8"), (b"3", "utf8"), (b"#", "utf8"),
+    (b"\x00\x00\x00\x05abc", "binary"), (b"\x00\x00", "binary"),
+])
+def test_malformed_frames_raise(data, codec):
+    with pytest.raises(ValueError):
+        EncoderDecoder().decode_bytes(data, codec)
+
+def test_unknown_byte_codec_is_rejected():
+    with pytest.raises(ValueError):
+        EncoderDecoder().encode_bytes(["a"], "string")
+
+@pytest.mark.parametrize("codec", ["string", "utf8", "binary"])
+def test_encoding_route_matches_round_trip(api, codec):
+    strs = CASES[-2]
+    response = api.post("/analyze/encoding", json={"strings": strs, "options": {"codec": codec, "detail": "result"}})
+    assert response.status_code == 200, response.text
+    assert response.json()["result"] == EncoderDecoder().round_trip(strs, codec)
@@ -0,0 +1,68 @@
+"""
+Top-K Strategy Tests - heap, bucket and nlargest selections and their traces
+agree with sorting the counts, and Space-Saving estimates stay within their
+error bounds
+"""
+import random
+from collections import Counter
+
+import pytest
+
+from conftest import numeric_inputs
+from algorithms.arrays.frequency_insights import FrequencyInsights, TOP_K_STRATEGIES
+
+CASES = numeric_inputs(seed=15)
+
+def brute_top_k(nums, k):
+    """Top k values by (frequency, value), descending"""
+    return [num for num, _ in sorted(Counter(nums).items(), key=lambda item: (item[1], item[0]), reverse=True)[:k]]
+
+def ks_for(nums):
+    return sorted({0, 1, 2, len(set(nums)), len(set(nums)) + 1})
+
+@pytest.mark.parametrize("nums", CASES)
+@pytest.mark.parametrize("strategy", TOP_K_STRATEGIES)
+def test_strategies_match_sorted_counts(numeric_engine, nums, strategy):
+    insights = FrequencyInsights()
+    for k in ks_for(nums):
+        expected = brute_top_k(nums, k)
+        assert insights.top_k_frequent(nums, k, strategy=strategy) == expected
+        assert insights.top_k_frequent(nums, k, Counter(nums), strategy) == expected
+
+@pytest.mark.parametrize("nums", CASES)
+@pytest.mark.parametrize("strategy", TOP_K_STRATEGIES)
+def test_traces_replay_to_the_result(nums, strategy):
+    insights = FrequencyInsights()
+    for k in ks_for(nums):
+        trace = insights.trace(nums, k, strategy=strategy)
+        assert trace.result == brute_top_k(nums, k)
+        assert trace.steps()[-1] == f"Final result: {trace.result}"
+        if strategy == "bucket":
+            assert [value for event in trace.events for value in event["values"]] == trace.result
+        visualization = trace.visualization()
+        assert visualization["top_k_elements"] == trace.result
+        assert visualization["frequency_map"] == dict(Counter(nums))
+
+@pytest.mark.parametrize("capacity", [1, 4, 16, 1000])
+def test_approximate_estimates_bound_the_true_counts(capacity):
+    rng = random.Random(capacity)
+    nums = [int(rng.paretovariate(1.2)) for _ in range(5000)]  # skewed, with a long tail
+    counts = Counter(nums)
+    result = FrequencyInsights().approximate_top_k(nums, 3, capacity)
+    assert result["total"] == len(nums)
+    assert result["max_error"] <= len(nums) // result["capacity"]
+    for entry in result["estimates"]:
+        assert entry["count"] - entry["error"] <= counts[entry["value"]] <= entry["count"]
+    if capacity >= len(counts):
+        assert result["top_k"] == brute_top_k(nums, 3)
+        assert all(entry["error"] == 0 and entry["guaranteed"] for entry in result["estimates"])
+    else:
+        # A value more frequent than total / capacity is always still tracked
+        assert brute_top_k(nums, 1)[0] == result["top_k"][0]
+
+@pytest.mark.parametrize("options", [{}, {"strategy": "bucket"}, {"strategy": "nlargest"}])
+def test_frequency_route_matches_sorted_counts(api, options):
+    nums = CASES[-3]
+    response = api.post("/analyze/frequency", json={"numbers": nums, "k": 4, "options": {**options, "detail": "full"}})
+    assert response.status_code == 200, response.text
+    assert response.json()["result"] == brute_top_k(nums, 4)
@@ -0,0 +1,99 @@
+"""
+Request Metrics Tests - histograms render the same cumulative counts as
+counting the observations directly, job phases add up to the job, and the
+profile option and /metrics report the requests actually made
+"""
+import random
+import re
+import time
+
+import pytest
+
+from services import metrics
+
+def sample_values(seed: int):
+    rng = random.Random(seed)
+    return [rng.choice(metrics.LATENCY_BUCKETS) if rng.random() < 0.2 else rng.uniform(0, 40) for _ in range(500)]
+
+def parse(text):
+    """Prometheus samples as {(name, labels): value}"""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = re.fullmatch(r'(\w+)(?:\{(.*)\})? (\S+)', line)
+        labels = tuple(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match.group(2) or ""))
+        samples[match.group(1), labels] = float(match.group(3))
+    return samples
+
+def test_histogram_buckets_match_counting():
+    registry = metrics.MetricsRegistry()
+    values = sample_values(22)
+    for value in values:
+        registry.observe("latency", value, endpoint="/x")
+    samples = parse(registry.render())
+    for bound in metrics.LATENCY_BUCKETS:
+        le = metrics._format_value(bound)
+        assert samples["latency_bucket", (("endpoint", "/x"), ("le", le))] == sum(v <= bound for v in values)
+    assert samples["latency_bucket", (("endpoint", "/x"), ("le", "+Inf"))] == len(values)
+    assert samples["latency_count", (("endpoint", "/x"),)] == len(values)
+    assert samples["latency_sum", (("endpoint", "/x"),)] == pytest.approx(sum(values))
+
+def test_counters_and_label_escaping():
+    registry = metrics.MetricsRegistry()
+    registry.describe("hits", "Hits")
+    for status in (200, 200, 404):
+        registry.inc("hits", endpoint='/a"b\\c', status=status)
+    text = registry.render()
+    assert "# HELP hits Hits\n# TYPE hits counter" in text
+    assert 'hits{endpoint="/a\\"b\\\\c",status="200"} 2' in text
+    registry.reset()
+    assert registry.render() == "\n"
+
+@pytest.mark.parametrize("n, label", [(None, "none"), (0, "le_10"), (10, "le_10"), (11, "le_100"),
+                                      (10_000_000, "le_10000000"), (10_000_001, "gt_10000000")])
+def test_size_buckets(n, label):
+    assert metrics.size_bucket(n) == label
+
+def test_job_phases_add_up_to_the_job():
+    def job(delay):
+        with metrics.phase("steps"):
+            time.sleep(delay)
+        with metrics.phase("steps"):
+            time.sleep(delay)
+        time.sleep(delay)
+        return "done"
+
+    result, phases, profile = metrics.run_instrumented(job, (0.01,), profile=True)
+    assert result == "done"
+    assert set(phases) == {"steps", "algorithm", "job"}
+    assert phases["steps"] >= 0.02 and phases["algorithm"] >= 0.01
+    assert phases["steps"] + phases["algorithm"] == pytest.approx(phases["job"])
+    assert any("(job)" in entry["function"] for entry in profile)
+    assert metrics.run_instrumented(job, (0,))[2] is None
+
+def test_phases_outside_a_request_are_ignored():
+    with metrics.phase("free"):
+        pass  # no job or request to report to
+
+def test_profile_option_reports_phases_without_changing_the_result(api):
+    body = {"numbers": [3, 1, 3, 2], "k": 1}
+    plain = api.post("/analyze/frequency", json=body).json()
+    profiled = api.post("/analyze/frequency", json={**body, "options": {"profile": True}}).json()
+    profile = profiled.pop("profile")
+    assert profiled == plain
+    assert {"parse", "dispatch", "algorithm"} <= set(profile["phases"])
+    assert profile["cprofile"] and all(entry["calls"] >= 1 for entry in profile["cprofile"])
+    assert api.post("/analyze/frequency", json={**body, "options": {"profile": "yes"}}).status_code == 400
+
+def test_metrics_count_the_requests_made(api):
+    metrics.registry.reset()
+    for nums in ([1, 2, 2], list(range(50)), list(range(50))):
+        assert api.post("/analyze/duplicates", json={"numbers": nums}).status_code == 200
+    assert api.get("/analyze/nothing-here").status_code == 404
+    samples = parse(api.get("/metrics").text)
+    requests = {labels: value for (name, labels), value in samples.items() if name == "smartpack_requests_total"}
+    assert requests[(("endpoint", "/analyze/duplicates"), ("method", "POST"), ("status", "200"))] == 3
+    sizes = {dict(labels)["size"]: value for (name, labels), value in samples.items()
+             if name == "smartpack_request_seconds_count" and dict(labels)["endpoint"] == "/analyze/duplicates"}
+    assert sizes == {"le_10": 1, "le_100": 2}
@@ -0,0 +1,105 @@
+"""
+Pair Search Tests - PairIndex and k_sum agree with single-pass Two Sum and
+brute-force enumeration on both the pure-Python and the vectorized path
+"""
+import itertools
+import random
+
+import pytest
+
+from conftest import numeric_inputs
+from algorithms.arrays import pair_search
+from algorithms.arrays.pair_calculator import PairCalculator
+
+CASES = numeric_inputs(seed=19)
+
+def single_pass_two_sum(nums, target):
+    seen = {}
+    for i, num in enumerate(nums):
+        if target - num in seen:
+            return [seen[target - num], i]
+        seen[num] = i
+    return None
+
+def brute_pairs(nums, target):
+    """Every [j, i] with j < i, ordered by i then j"""
+    return [[j, i] for i in range(len(nums)) for j in range(i) if nums[i] + nums[j] == target]
+
+def targets_for(nums):
+    rng = random.Random(len(nums))
+    targets = {0, 1, -1, 2 ** 62, -2 ** 63}
+    for _ in range(6):
+        if nums:
+            targets.add(rng.choice(nums) + rng.choice(nums))
+    return sorted(targets)
+
+@pytest.mark.parametrize("nums", CASES)
+def test_first_pair_matches_single_pass_two_sum(numeric_engine, nums):
+    index = pair_search.PairIndex(nums)
+    targets = targets_for(nums)
+    expected = [single_pass_two_sum(nums, target) for target in targets]
+    assert [index.first_pair(target) for target in targets] == expected
+    assert index.multi_target(targets) == expected
+    assert PairCalculator().two_sum_many(nums, targets) == expected
+
+@pytest.mark.parametrize("nums", CASES)
+def test_count_and_all_pairs_match_brute_force(numeric_engine, nums):
+    index = pair_search.PairIndex(nums)
+    for target in targets_for(nums):
+        expected = brute_pairs(nums, target)
+        assert index.count_pairs(target) == len(expected)
+        assert index.all_pairs(target) == (expected, False)
+
+def test_all_pairs_truncates_at_the_limit(numeric_engine):
+    nums = [2] * 6 + [1, 3]
+    expected = brute_pairs(nums, 4)
+    assert len(expected) == 16
+    assert pair_search.PairIndex(nums).all_pairs(4, limit=5) == (expected[:5], True)
+    assert pair_search.PairIndex(nums).all_pairs(4, limit=16) == (expected, False)
+    assert PairCalculator().find_pairs(nums, 4, limit=5) == {"pairs": expected[:5], "count": 16, "truncated": True}
+    assert PairCalculator().find_pairs(nums, 4, mode="count") == 16
+
+def brute_k_sum(nums, target, k):
+    return sorted({tuple(sorted(combo)) for combo in itertools.combinations(nums, k) if sum(combo) == target})
+
+@pytest.mark.parametrize("k", [2, 3, 4])
+@pytest.mark.parametrize("nums", [nums for nums in CASES if len(nums) <= 20] + [[0] * 8, [-4, -1, -1, 0, 1, 2, 2, 3]])
+def test_k_sum_matches_brute_force(nums, k):
+    for target in sorted({0, 1, -2, sum(nums[:k])}):
+        expected = [list(combo) for combo in brute_k_sum(nums, target, k)]
+        assert pair_search.k_sum(nums, target, k) == (expected, False), target
+
+def test_k_sum_truncates_in_sorted_order():
+    nums = list(range(-10, 11))
+    expected = [list(combo) for combo in brute_k_sum(nums, 0, 3)]
+    assert pair_search.k_sum(nums, 0, 3, limit=4) == (expected[:4], True)
+    assert pair_search.k_sum(nums, 0, 3, limit=len(expected)) == (expected, False)
+
+def test_k_sum_rejects_k_below_two():
+    with pytest.raises(ValueError, match="at least 2"):
+        pair_search.k_sum([1, 2, 3], 3, 1)
+
+@pytest.mark.parametrize("block", [1, 1024])
+def test_first_pair_scan_blocks_do_not_change_the_pair(numeric_engine, monkeypatch, block):
+    from algorithms.arrays import vectorized
+    monkeypatch.setattr(vectorized, "PAIR_SCAN_BLOCK", block)
+    rng = random.Random(block)
+    nums = [rng.randint(-500, 500) for _ in range(3000)]
+    targets = [rng.randint(-1100, 1100) for _ in range(200)]
+    assert pair_search.PairIndex(nums).multi_target(targets) == [single_pass_two_sum(nums, t) for t in targets]
+
+def test_multi_target_answers_repeated_targets_once(monkeypatch):
+    index = pair_search.PairIndex([3, 4, 5, 3])
+    calls = []
+    first_pair = index.first_pair
+    monkeypatch.setattr(index, "first_pair", lambda target: calls.append(target) or first_pair(target))
+    assert index.multi_target([6, 9, 6, 100, 9]) == [[0, 3], [1, 2], [0, 3], None, [1, 2]]
+    assert calls == [6, 9, 100]
+
+def test_multi_route_caps_the_number_of_targets(api):
+    targets = list(range(pair_search.MAX_TARGETS + 1))
+    response = api.post("/analyze/pairs", json={"numbers": [1, 2], "options": {"mode": "multi", "targets": targets}})
+    assert response.status_code == 400
+    assert str(pair_search.MAX_TARGETS) in response.json()["detail"]
+    ok = api.post("/analyze/pairs", json={"numbers": [1, 2], "options": {"mode": "multi", "targets": targets[:-1]}})
+    assert ok.status_code == 200 and ok.json()["result"][3] == [0, 1]
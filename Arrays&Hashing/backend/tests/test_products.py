@@ -0,0 +1,77 @@
+"""
+Product Mode Tests - exact, modular, log and int64 products, sequential and
+chunk-parallel, agree with multiplying every other element directly
+"""
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import numeric_inputs
+from algorithms import parallel
+from algorithms.arrays import products
+from algorithms.arrays.pair_calculator import PairCalculator
+
+CASES = numeric_inputs(seed=18) + [
+    [3, 0, 4, 5], [0, 2, 0, 7], [-2, -3, 0, 5, -1], [2 ** 31] * 3, [-(2 ** 21)] * 3 + [7],
+    [(-1) ** i * (i % 9 + 1) for i in range(500)],
+]
+MODULI = [1, 2, 97, products.DEFAULT_MODULUS]
+
+def brute_products(nums):
+    return [math.prod(nums[:i] + nums[i + 1:]) for i in range(len(nums))]
+
+@pytest.fixture(params=["sequential", "parallel"])
+def scan(request, monkeypatch):
+    """Scan sequentially, or on a 3-worker pool for arrays of any length"""
+    if request.param == "parallel":
+        executor = ThreadPoolExecutor(3)
+        monkeypatch.setattr(parallel, "_executor", executor)
+        monkeypatch.setattr(parallel, "_workers", 3)
+        monkeypatch.setattr(products, "PARALLEL_THRESHOLD", 1)
+        yield request.param
+        executor.shutdown()
+    else:
+        monkeypatch.setattr(products, "PARALLEL_THRESHOLD", 0)
+        yield request.param
+
+@pytest.mark.parametrize("nums", CASES)
+def test_exact_and_mod_match_direct_products(numeric_engine, scan, nums):
+    expected = brute_products(nums)
+    calculator = PairCalculator()
+    assert calculator.product_except_self(nums) == expected
+    for modulus in MODULI:
+        assert calculator.product_except_self(nums, "mod", modulus) == [value % modulus for value in expected]
+
+@pytest.mark.parametrize("nums", CASES)
+def test_int64_returns_or_raises_like_direct_products(numeric_engine, nums):
+    expected = brute_products(nums)
+    if all(products.INT64_MIN <= value <= products.INT64_MAX for value in expected):
+        assert PairCalculator().product_except_self(nums, "int64") == expected
+    else:
+        with pytest.raises(OverflowError):
+            PairCalculator().product_except_self(nums, "int64")
+
+@pytest.mark.parametrize("nums", CASES)
+def test_log_mode_matches_direct_magnitudes_and_signs(nums):
+    result = PairCalculator().product_except_self(nums, "log")
+    for value, log10_abs, sign in zip(brute_products(nums), result["log10_abs"], result["sign"]):
+        if value == 0:
+            assert (log10_abs, sign) == (None, 0)
+        else:
+            assert log10_abs == pytest.approx(math.log10(abs(value)), abs=1e-9)
+            assert sign == (1 if value > 0 else -1)
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 7, 600])
+def test_parallel_scan_matches_any_chunking(monkeypatch, workers):
+    nums = CASES[-1]
+    with ThreadPoolExecutor(2) as executor:
+        monkeypatch.setattr(parallel, "_executor", executor)
+        assert products.parallel_product_except_self(nums, workers=workers) == brute_products(nums)
+        assert products.parallel_product_except_self(nums, 97, workers) == [value % 97 for value in brute_products(nums)]
+
+def test_invalid_modes_are_rejected():
+    with pytest.raises(ValueError):
+        PairCalculator().product_except_self([1, 2], "float")
+    with pytest.raises(ValueError):
+        products.product_mod([1, 2], 0)
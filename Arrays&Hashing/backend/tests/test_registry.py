@@ -0,0 +1,108 @@
+"""
+Registry Tests - every registered algorithm gets its generated routes and
+answers them like its analyzer called directly, while analyzer modules (and
+NumPy) are only imported once an algorithm is used
+"""
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import main
+from algorithms.registry import AlgorithmPlugin, AlgorithmRegistry, registry
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (algorithm, request body, the same analysis through the analyzer)
+DIRECT = [
+    ("duplicates", {"numbers": [1, 5, 2, 5]}, lambda a: a.contains_duplicate([1, 5, 2, 5])),
+    ("anagrams", {"strings": ["ab", "ba", "c"]}, lambda a: a.group_anagrams(["ab", "ba", "c"])),
+    ("frequency", {"numbers": [4, 4, 1], "k": 1}, lambda a: a.top_k_frequent([4, 4, 1], 1)),
+    ("pairs", {"numbers": [3, 2, 4], "target": 6}, lambda a: a.two_sum([3, 2, 4], 6)),
+    ("products", {"numbers": [1, 2, 3, 4]}, lambda a: a.product_except_self([1, 2, 3, 4])),
+    ("sequences", {"numbers": [9, 1, 3, 2]}, lambda a: a.longest_consecutive([9, 1, 3, 2])),
+    ("encoding", {"strings": ["a#", ""]}, lambda a: a.round_trip(["a#", ""])),
+]
+
+def test_every_plugin_is_covered():
+    assert [name for name, _, _ in DIRECT] == [plugin.name for plugin in registry]
+
+@pytest.mark.parametrize("name, body, direct", DIRECT)
+def test_generated_routes_match_the_analyzer(api, name, body, direct):
+    plugin = registry.get(name)
+    response = api.post(f"/analyze/{name}", json=body)
+    assert response.status_code == 200, response.text
+    assert response.json()["result"] == direct(registry.analyzer(name))
+    assert set(plugin.info) <= set(response.json())  # jobs may name the variant they ran
+    assert registry.is_loaded(name)
+
+    if plugin.tracer is not None:
+        stream = api.post(f"/analyze/{name}/stream", json=body)
+        assert stream.status_code == 200
+        frames = {frame["type"]: frame for frame in map(json.loads, stream.text.splitlines())}
+        assert frames["result"]["result"] == response.json()["result"]
+    if plugin.request == "numeric":
+        batch = api.post("/analyze/batch", json={**body, "algorithms": [name], "options": {"detail": "result"}})
+        assert batch.json()["results"][0]["response"]["result"] == response.json()["result"]
+
+def test_route_table_and_listing(api):
+    paths = {route.path for route in main.app.routes}
+    for plugin in registry:
+        assert f"/analyze/{plugin.name}" in paths
+    listed = api.get("/algorithms").json()
+    assert [entry["name"] for entry in listed] == [plugin.name for plugin in registry]
+    mapping = api.get("/algorithms/mapping").json()["patterns"]
+    assert sorted(name for pattern in mapping for name in pattern["algorithms"]) == sorted(p.name for p in registry)
+    assert api.post("/analyze/unknown", json={"numbers": [1]}).status_code in (404, 405)
+
+def test_analyzers_load_lazily():
+    code = (
+        "import sys, json, main\n"
+        "from algorithms.registry import registry\n"
+        "before = sorted(p.module for p in registry if p.module in sys.modules)\n"
+        "registry.analyzer('duplicates')\n"
+        "after = sorted(p.module for p in registry if p.module in sys.modules)\n"
+        "print(json.dumps([before, after, registry.is_loaded('products')]))\n"
+    )
+    env = dict(os.environ, SMARTPACK_PRELOAD="")
+    output = subprocess.run([sys.executable, "-c", code], cwd=BACKEND, env=env, capture_output=True, text=True, check=True)
+    before, after, products_loaded = json.loads(output.stdout.splitlines()[-1])
+    assert before == []
+    assert after == ["algorithms.arrays.duplicate_detector"]
+    assert products_loaded is False
+
+def test_analyzer_instances_are_shared():
+    instances = []
+    fresh = AlgorithmRegistry()
+    fresh.pattern("P", [])
+    for name in ("pairs", "products"):
+        plugin = registry.get(name)
+        fresh.register(AlgorithmPlugin(name, plugin.analyzer, plugin.request, plugin.info, plugin.summary,
+                                       "P", plugin.job))
+    threads = [threading.Thread(target=lambda name=name: instances.append(fresh.analyzer(name)))
+               for name in ("pairs", "products") * 8]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(instance) for instance in instances}) == 1
+
+def test_invalid_plugins_are_rejected():
+    fresh = AlgorithmRegistry()
+    fresh.pattern("P", [])
+    plugin = lambda **overrides: AlgorithmPlugin(**{
+        "name": "x", "analyzer": "m:C", "request": "numeric", "info": {}, "summary": "", "pattern": "P",
+        "job": "m:run", **overrides})
+    fresh.register(plugin())
+    with pytest.raises(ValueError):
+        fresh.register(plugin())
+    with pytest.raises(ValueError):
+        fresh.register(plugin(name="y", pattern="Unknown"))
+    for overrides in ({"request": "xml"}, {"analyzer": "m"}, {"job": "run"}, {"tracer": ":f"}):
+        with pytest.raises(ValueError):
+            plugin(**overrides)
+    with pytest.raises(ValueError):
+        main.add_analysis_route(plugin(name="z", arguments=["nope"]))
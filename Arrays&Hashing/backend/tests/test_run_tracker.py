@@ -0,0 +1,95 @@
+"""
+Run Tracker - incremental runs under random inserts and deletes agree with
+recomputing them from the multiset, and with SequenceTracker
+"""
+import bisect
+import random
+from collections import Counter
+
+import pytest
+
+from algorithms.arrays import run_tracker
+from algorithms.arrays.run_tracker import RunTracker
+from algorithms.arrays.sequence_tracker import SequenceTracker
+
+@pytest.fixture(params=[run_tracker.START_BLOCK, 2])
+def block(request, monkeypatch):
+    """Default block size and a tiny one, so run starts split across many blocks"""
+    monkeypatch.setattr(run_tracker, "START_BLOCK", request.param)
+    return request.param
+
+def brute_runs(values):
+    runs = []
+    for num in sorted(values):
+        if runs and num == runs[-1][1] + 1:
+            runs[-1][1] = num
+        else:
+            runs.append([num, num])
+    return [tuple(run) for run in runs]
+
+def check(tracker, counts):
+    runs = brute_runs(counts)
+    assert tracker.runs() == runs
+    assert len(tracker) == len(counts)
+    assert tracker.longest_length() == SequenceTracker().longest_consecutive(list(counts))
+    longest = tracker.longest_run()
+    assert (longest is None) == (not runs)
+    if longest:
+        assert longest in runs and longest[1] - longest[0] + 1 == tracker.longest_length()
+    for x in list(counts)[:20] + [min(counts, default=0) - 1, max(counts, default=0) + 1]:
+        containing = [run for run in runs if run[0] <= x <= run[1]]
+        assert tracker.run_containing(x) == (containing[0] if containing else None)
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_updates_match_recomputed_runs(block, seed):
+    rng = random.Random(seed)
+    span = rng.choice([30, 300, 3000])
+    tracker = RunTracker()
+    counts = Counter()
+    for step in range(1500):
+        num = rng.randint(-span, span)
+        if counts and rng.random() < 0.4:
+            num = rng.choice(list(counts))
+            assert tracker.delete(num) == (counts[num] == 1)
+            counts[num] -= 1
+            if not counts[num]:
+                del counts[num]
+        else:
+            assert tracker.insert(num) == (num not in counts)
+            counts[num] += 1
+        if step % 100 == 0:
+            check(tracker, counts)
+    check(tracker, counts)
+
+def test_bulk_updates_report_new_and_removed_values(block):
+    tracker = RunTracker([5, 1, 2, 2, 3, 9])
+    assert tracker.runs() == [(1, 3), (5, 5), (9, 9)]
+    assert tracker.insert_many([4, 4, 10]) == 2
+    assert tracker.runs() == [(1, 5), (9, 10)]
+    assert tracker.delete_many([2, 3, 3, 42]) == 1  # 2 occurs twice, so only 3 is gone
+    assert tracker.runs() == [(1, 2), (4, 5), (9, 10)]
+    with pytest.raises(KeyError):
+        tracker.delete(42)
+
+def test_sorted_starts_floor_matches_bisect(block):
+    rng = random.Random(17)
+    starts = run_tracker._SortedStarts()
+    members = []
+    for _ in range(2000):
+        value = rng.randint(0, 500)
+        position = bisect.bisect_left(members, value)
+        if position < len(members) and members[position] == value:
+            starts.remove(value)
+            members.pop(position)
+        else:
+            starts.add(value)
+            members.insert(position, value)
+        probe = rng.randint(-5, 505)
+        floor = bisect.bisect_right(members, probe)
+        assert starts.floor(probe) == (members[floor - 1] if floor else None)
+    assert list(starts) == members and len(starts) == len(members)
+
+def test_stats_report_complexity():
+    stats = RunTracker([1, 2, 3]).stats()
+    assert stats["complexity"] == run_tracker.COMPLEXITY
+    assert stats["longest_run"] == (1, 3) and stats["runs"] == 1
@@ -0,0 +1,55 @@
+"""
+Serialization Tests - the fast encoders produce the same JSON document as
+pydantic's model_dump_json, for every response the analyzers build
+"""
+import json
+
+import pytest
+
+from services import serialization
+from services.jobs import AnalysisResponse
+from algorithms.arrays import vectorized
+
+ENCODERS = [encoder for encoder in serialization.ENCODERS if encoder != "orjson" or serialization.orjson is not None]
+
+RESPONSES = [
+    ("duplicates", {"numbers": [4, 1, 4, 2, 2]}),
+    ("frequency", {"numbers": [5, 5, 6, -1, 6, 5], "k": 2}),
+    ("sequences", {"numbers": [100, 4, 200, 1, 3, 2]}),
+    ("pairs", {"numbers": [2, 7, 11, 15], "target": 9}),
+    ("products", {"numbers": [2 ** 40, 2 ** 40, 3, -1]}),  # results beyond 64 bits
+    ("anagrams", {"strings": ["eat", "tea", "tan", "ate", "nat", "bat", "ünï", "ïnü"]}),
+    ("encoding", {"strings": ["a#b", "", "🙂"], "options": {"codec": "utf8"}}),
+]
+
+@pytest.fixture(params=ENCODERS)
+def encoder(request, monkeypatch):
+    monkeypatch.setattr(serialization, "ENCODER", request.param)
+    return request.param
+
+def model_json(response: AnalysisResponse):
+    return json.loads(response.model_dump_json())
+
+def test_payloads_match_model_dump_json(encoder):
+    payload = {
+        "counts": {1: 2, -5: 1}, "nested": {2: [1, 2 ** 70], "set": {3}}, "unicode": "é🙂", "float": 0.1, "none": None
+    }
+    response = AnalysisResponse(result=[2 ** 63 - 1, -2 ** 63], algorithm="a", complexity={"time": "O(n)"},
+                                explanation="e", steps=["s"], visualization_data=payload)
+    encoded = serialization.encode_response(response)
+    assert json.loads(encoded) == model_json(response)
+    assert list(json.loads(encoded)) == list(AnalysisResponse.model_fields)
+
+def test_numpy_values_encode_as_lists(encoder):
+    if not vectorized.available():
+        pytest.skip("NumPy is not installed")
+    np = vectorized.np
+    data = {"array": np.arange(4, dtype=np.int64), "scalar": np.int64(7), "matrix": np.eye(2)}
+    assert json.loads(serialization.dumps(data)) == {"array": [0, 1, 2, 3], "scalar": 7, "matrix": [[1.0, 0.0], [0.0, 1.0]]}
+
+@pytest.mark.parametrize("algorithm, body", RESPONSES)
+def test_routes_match_model_dump_json(api, encoder, algorithm, body):
+    options = {**body.get("options", {}), "detail": "full"}
+    response = api.post(f"/analyze/{algorithm}", json={**body, "options": options})
+    assert response.status_code == 200, response.text
+    assert response.json() == model_json(AnalysisResponse(**response.json()))
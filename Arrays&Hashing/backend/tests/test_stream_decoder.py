@@ -0,0 +1,90 @@
+"""
+Incremental decoding - partial frames across chunks and the frame size limit
+"""
+import asyncio
+
+import pytest
+
+from algorithms.strings.encoder_decoder import BINARY_HEADER, EncoderDecoder
+from algorithms.strings.stream_decoder import StreamDecoder, FrameError
+
+STRINGS = ["hello", "", "a#b", "12#", "héllo wörld", "🙂" * 3, "x" * 300]
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+@pytest.mark.parametrize("codec", ["utf8", "binary"])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_frames_split_across_chunks_decode_in_order(codec, chunk_size):
+    data = EncoderDecoder().encode_bytes(STRINGS, codec)
+    decoder = StreamDecoder(codec)
+    assert list(decoder.decode_all(chunked(data, chunk_size))) == STRINGS
+    assert decoder.frames_decoded == len(STRINGS)
+    assert decoder.pending == 0
+
+@pytest.mark.parametrize("codec", ["utf8", "binary"])
+def test_only_the_incomplete_frame_is_buffered(codec):
+    first, second = (EncoderDecoder().encode_bytes([s], codec) for s in ("done", "partial"))
+    decoder = StreamDecoder(codec)
+    assert decoder.feed(first + second[:3]) == ["done"]
+    assert decoder.pending == 3
+    assert decoder.feed(second[3:-1]) == []
+    assert decoder.feed(second[-1:]) == ["partial"]
+    assert decoder.pending == 0
+
+def test_multibyte_character_split_between_chunks():
+    data = EncoderDecoder().encode_bytes(["é🙂"], "utf8")
+    decoder = StreamDecoder("utf8")
+    results = [decoder.feed(data[i:i + 1]) for i in range(len(data))]
+    assert [s for decoded in results for s in decoded] == ["é🙂"]
+
+def test_utf8_frame_over_the_limit_is_rejected_at_its_header():
+    decoder = StreamDecoder("utf8", max_frame_size=10)
+    assert decoder.feed(b"10#0123456789") == ["0123456789"]
+    with pytest.raises(FrameError, match="11 bytes, exceeding max_frame_size=10"):
+        decoder.feed(b"11#")  # rejected before any payload arrives
+
+def test_binary_frame_over_the_limit_is_rejected_at_its_header():
+    decoder = StreamDecoder("binary", max_frame_size=10)
+    with pytest.raises(FrameError, match="exceeding max_frame_size=10"):
+        decoder.feed(BINARY_HEADER.pack(1 << 30))
+
+def test_buffer_stays_within_max_buffer_size():
+    decoder = StreamDecoder("utf8", max_frame_size=100)
+    data = EncoderDecoder().encode_bytes(["y" * 100] * 5, "utf8")
+    for chunk in chunked(data, 13):
+        decoder.feed(chunk)
+        assert decoder.pending <= decoder.max_buffer_size
+
+def test_malformed_length_prefix():
+    with pytest.raises(FrameError, match="Malformed length prefix in frame 0"):
+        StreamDecoder("utf8").feed(b"ab#c")
+    # A prefix longer than any valid length fails without waiting for a delimiter
+    with pytest.raises(FrameError, match="Malformed length prefix"):
+        StreamDecoder("utf8").feed(b"1" * 21)
+
+def test_invalid_utf8_payload():
+    with pytest.raises(FrameError, match="not valid UTF-8"):
+        StreamDecoder("binary").feed(BINARY_HEADER.pack(1) + b"\xff")
+
+@pytest.mark.parametrize("tail", [b"5#ab", b"12"])
+def test_stream_ending_inside_a_frame(tail):
+    decoder = StreamDecoder("utf8")
+    with pytest.raises(FrameError, match="Stream ended inside frame 1"):
+        list(decoder.decode_all([b"1#a", tail]))
+
+def test_unknown_codec():
+    with pytest.raises(ValueError, match="Unknown stream codec"):
+        StreamDecoder("string")
+
+def test_async_decoding():
+    data = EncoderDecoder().encode_bytes(STRINGS, "binary")
+
+    async def chunks():
+        for chunk in chunked(data, 5):
+            yield chunk
+
+    async def decode():
+        return [s async for s in StreamDecoder("binary").adecode_all(chunks())]
+
+    assert asyncio.run(decode()) == STRINGS
@@ -0,0 +1,69 @@
+"""
+Trace Tests - delta-encoded Two Sum and duplicate traces rebuild the same
+state and results as recomputing them from scratch at every step
+"""
+import re
+from collections import Counter
+
+import pytest
+
+from conftest import numeric_inputs
+from algorithms import trace as trace_module
+from algorithms.arrays.duplicate_detector import DuplicateDetector
+from algorithms.arrays.pair_calculator import PairCalculator
+
+CASES = numeric_inputs(seed=4) + [list(range(1000)), [i % 300 for i in range(900)]]
+
+@pytest.fixture(params=[trace_module.MIN_CHECKPOINT_INTERVAL, 1])
+def interval(request, monkeypatch):
+    """Checkpoint at the default spacing and at every step"""
+    monkeypatch.setattr(trace_module, "MIN_CHECKPOINT_INTERVAL", request.param)
+    return request.param
+
+def targets_for(nums):
+    return [0, -1] + ([nums[0] + nums[-1], nums[len(nums) // 2] * 2] if nums else [])
+
+@pytest.mark.parametrize("nums", CASES)
+def test_two_sum_map_restores_at_every_step(interval, nums):
+    calculator = PairCalculator()
+    for target in targets_for(nums):
+        data = calculator.get_visualization_data(nums, target)
+        path, checkpoints = data["search_path"], data["checkpoints"]
+        assert data["solution"] == calculator.two_sum(nums, target)
+        assert len(checkpoints) <= trace_module.MAX_CHECKPOINTS + 1
+        for step in range(len(path)):
+            expected = {nums[j]: j for j in range(step)}
+            assert trace_module.restore_state(path, checkpoints, step, "map_delta", "map_state") == expected
+
+@pytest.mark.parametrize("nums", CASES)
+def test_two_sum_steps_stay_linear(nums):
+    target = -1
+    steps = PairCalculator().get_steps(nums, target)
+    checkpoints = [step for step in steps if step.startswith("Checkpoint")]
+    assert len(checkpoints) <= trace_module.MAX_CHECKPOINTS
+    for line in checkpoints:
+        done = int(re.match(r"Checkpoint after step (\d+)", line).group(1))
+        assert line.endswith(f"current map: {({nums[j]: j for j in range(done)})}")
+    if PairCalculator().two_sum(nums, target) is None:
+        assert steps[-1] == "No solution found"
+
+@pytest.mark.parametrize("nums", CASES)
+def test_duplicate_visualization_matches_recount(nums):
+    detector = DuplicateDetector()
+    data = detector.get_visualization_data(nums)
+    counts = Counter(nums)
+    positions = {value: [i for i, num in enumerate(nums) if num == value] for value in counts if counts[value] > 1}
+    assert data["frequency"] == dict(counts)
+    assert data["positions"] == positions
+    assert data["duplicate_elements"] == list(positions)
+    assert data["has_duplicates"] is detector.contains_duplicate(nums) is (len(counts) < len(nums))
+
+@pytest.mark.parametrize("nums", CASES)
+def test_duplicate_steps_checkpoint_the_set(nums):
+    steps = DuplicateDetector().get_steps(nums)
+    checkpoints = [step for step in steps if step.startswith("Checkpoint")]
+    assert len(checkpoints) <= trace_module.MAX_CHECKPOINTS
+    for line in checkpoints:
+        done = int(re.match(r"Checkpoint after step (\d+)", line).group(1))
+        assert line.endswith(f"current set: {nums[:done]}")  # no duplicate before the scan stops
+    assert steps[-1].endswith("DUPLICATE FOUND!") == (len(set(nums)) < len(nums))
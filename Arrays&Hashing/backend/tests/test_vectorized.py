@@ -0,0 +1,90 @@
+"""
+Vectorized Engine Tests - the NumPy paths return exactly what the pure-Python
+analyzers return (same pair, same top-k order), and fall back cleanly
+"""
+import pytest
+
+from conftest import numeric_inputs
+from algorithms.arrays import vectorized
+from algorithms.arrays.duplicate_detector import DuplicateDetector
+from algorithms.arrays.frequency_insights import FrequencyInsights
+from algorithms.arrays.pair_calculator import PairCalculator
+from algorithms.arrays.sequence_tracker import SequenceTracker
+
+pytestmark = pytest.mark.skipif(not vectorized.available(), reason="NumPy is not installed")
+
+CASES = numeric_inputs(seed=8)
+
+@pytest.fixture
+def pure(monkeypatch):
+    """Keep the analyzers on their pure-Python paths"""
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", float("inf"))
+
+def targets_for(nums):
+    """Sums that hit (first, last, repeated values) and a few that miss"""
+    targets = {0, 1, -1, 2 ** 62 - 1}
+    if nums:
+        targets.update({nums[0] + nums[-1], 2 * nums[0], nums[0] + nums[len(nums) // 2], max(nums) * 2 + 1})
+    return sorted(targets)
+
+@pytest.mark.parametrize("nums", CASES)
+def test_contains_duplicate_matches(pure, nums):
+    assert vectorized.contains_duplicate(nums) == DuplicateDetector().contains_duplicate(nums)
+
+@pytest.mark.parametrize("nums", CASES)
+def test_top_k_frequent_matches_every_strategy(pure, nums):
+    insights = FrequencyInsights()
+    for k in sorted({1, 2, 3, len(set(nums)), len(set(nums)) + 2}):
+        expected = vectorized.top_k_frequent(nums, k)
+        for strategy in ("heap", "bucket", "nlargest"):
+            assert insights.top_k_frequent(nums, k, strategy=strategy) == expected, (k, strategy)
+
+def test_top_k_frequent_breaks_count_ties_by_value(pure):
+    nums = [4, 4, 1, 1, 9, 9, 2, 7, 7, 7]
+    assert vectorized.top_k_frequent(nums, 2) == FrequencyInsights().top_k_frequent(nums, 2) == [7, 9]
+
+@pytest.mark.parametrize("nums", CASES)
+def test_longest_consecutive_matches(pure, nums):
+    assert vectorized.longest_consecutive(nums) == SequenceTracker().longest_consecutive(nums)
+
+@pytest.mark.parametrize("nums", CASES)
+def test_two_sum_returns_the_hash_map_pair(pure, nums):
+    calculator = PairCalculator()
+    for target in targets_for(nums):
+        if abs(target) >= vectorized.SAFE_INT_BOUND:
+            with pytest.raises(vectorized.Unsupported):
+                vectorized.two_sum(nums, target)
+        else:
+            assert vectorized.two_sum(nums, target) == calculator.two_sum(nums, target), target
+
+@pytest.mark.parametrize("nums", [[], [5], [0, 3], [1, 2, 3, 4], [-2, 0, 3, 0], [3, -1, 2, -4, 5, 1], [2] * 40])
+def test_product_except_self_matches(pure, nums):
+    assert vectorized.product_except_self(nums) == PairCalculator().product_except_self(nums)
+
+def test_product_overflow_is_unsupported_and_falls_back(monkeypatch):
+    nums = [2 ** 40, 3, 2 ** 30, -5]
+    with pytest.raises(vectorized.Unsupported):
+        vectorized.product_except_self(nums)
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 1)
+    assert PairCalculator().product_except_self(nums) == [
+        3 * 2 ** 30 * -5, 2 ** 40 * 2 ** 30 * -5, 2 ** 40 * 3 * -5, 2 ** 40 * 3 * 2 ** 30]
+
+def test_values_outside_int64_fall_back(monkeypatch):
+    nums = [2 ** 70, 1, 2 ** 70 + 1, 2, 2 ** 70]
+    with pytest.raises(vectorized.Unsupported):
+        vectorized.to_array(nums)
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 1)
+    assert DuplicateDetector().contains_duplicate(nums) is True
+    assert FrequencyInsights().top_k_frequent(nums, 1) == [2 ** 70]
+    assert SequenceTracker().longest_consecutive(nums) == 2
+    assert PairCalculator().two_sum(nums, 2 ** 70 + 2) == [1, 2]
+
+def test_analyzers_switch_at_the_threshold(monkeypatch):
+    calls = []
+    original = vectorized.contains_duplicate
+    monkeypatch.setattr(vectorized, "contains_duplicate", lambda nums: calls.append(len(nums)) or original(nums))
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 4)
+    detector = DuplicateDetector()
+    assert detector.contains_duplicate([1, 2, 3]) is False
+    assert detector.contains_duplicate([1, 2, 3, 1]) is True
+    assert calls == [4]
@@ -0,0 +1,105 @@
+"""
+Windowed Frequency - window and decay counts agree with recounting the
+events by brute force, on the wall clock and on event time
+"""
+import random
+from collections import Counter
+
+import pytest
+
+from algorithms.arrays import windowed_frequency
+from algorithms.arrays.windowed_frequency import WindowedFrequency
+
+class Clock:
+    def __init__(self, now: float = 10_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+def brute_window(events, now, size=None, seconds=None):
+    """Counts of the events a size and/or seconds window holds at now"""
+    kept = events[-size:] if size else events
+    if seconds is not None:
+        kept = [(t, v) for t, v in kept if t > now - seconds]
+    return Counter(v for _, v in kept)
+
+def brute_decayed(events, now, half_life):
+    counts = Counter()
+    for t, v in events:
+        counts[v] += 2.0 ** (-(now - t) / half_life)
+    return counts
+
+def check_top_k(top_k, counts, k):
+    """top_k holds k entries with the highest counts (ties in any order)"""
+    assert len(top_k) == min(k, len(+counts))
+    ranked = sorted(counts.values(), reverse=True)
+    for (value, count), expected in zip(top_k, ranked):
+        assert count == pytest.approx(counts[value]) and count == pytest.approx(expected)
+
+@pytest.mark.parametrize("size, seconds", [(50, None), (None, 30.0), (40, 20.0)])
+def test_window_counts_match_recounting(size, seconds):
+    rng = random.Random(16)
+    clock = Clock()
+    window = WindowedFrequency(size, seconds, clock=clock)
+    events = []
+    for step in range(600):
+        clock.now += rng.choice([0.0, 0.5, 3.0])
+        value = rng.randint(0, 12)
+        window.append(value)
+        events.append((clock.now, value))
+        if step % 25 == 0:
+            counts = brute_window(events, clock.now, size, seconds)
+            assert {v: window.count(v) for v in range(13) if window.count(v)} == +counts
+            check_top_k(window.top_k(4), counts, 4)
+    clock.now += 15.0  # expiry also happens on queries, without new events
+    check_top_k(window.top_k(13), brute_window(events, clock.now, size, seconds), 13)
+
+def test_decayed_counts_match_recounting(monkeypatch):
+    monkeypatch.setattr(windowed_frequency, "MIN_COMPACT_SIZE", 8)  # compact and prune often
+    rng = random.Random(61)
+    clock = Clock()
+    window = WindowedFrequency(half_life=5.0, clock=clock)
+    events = []
+    for step in range(800):
+        clock.now += rng.choice([0.0, 0.2, 1.0])
+        value = rng.randint(0, 30)
+        window.append(value)
+        events.append((clock.now, value))
+        if step % 40 == 0:
+            counts = brute_decayed(events, clock.now, 5.0)
+            check_top_k(window.top_k(5), counts, 5)
+            assert window.count(value) == pytest.approx(counts[value])
+
+def test_past_timestamps_are_counted_on_event_time():
+    clock = Clock(now=1_000_000.0)
+    window = WindowedFrequency(seconds=60.0, clock=clock)
+    window.extend(["a", "b", "a", "c", "a"], timestamps=[100.0, 120.0, 150.0, 165.0, 170.0])
+    # Held as of the latest timestamp (170), not the wall clock that left them all behind
+    assert window.top_k(2) == [("a", 2), ("b", 1)] or window.top_k(2) == [("a", 2), ("c", 1)]
+    assert window.count("b") == 1
+    assert window.count("a", now=215.0) == 1  # an explicit now expires relative to itself
+    assert window.stats()["event_time"] is True
+
+def test_past_timestamps_decay_from_the_latest_event():
+    window = WindowedFrequency(half_life=10.0, clock=Clock(now=1_000_000.0))
+    window.extend(["a", "a", "b"], timestamps=[0.0, 10.0, 10.0])
+    assert dict(window.top_k(2)) == pytest.approx({"a": 1.5, "b": 1.0})
+    assert window.count("a", now=20.0) == pytest.approx(0.75)
+
+def test_wall_clock_windows_still_expire_without_new_events():
+    clock = Clock()
+    window = WindowedFrequency(seconds=10.0, clock=clock)
+    window.extend(["x", "y"])
+    clock.now += 11.0
+    assert window.top_k(2) == []
+    assert window.stats()["event_time"] is False
+
+def test_window_route_queries_at_now(api):
+    assert api.put("/analyze/frequency/windows/w", json={"seconds": 60}).status_code == 200
+    api.post("/analyze/frequency/windows/w/events",
+             json={"events": [1, 2, 1, 3], "timestamps": [120.0, 130.0, 150.0, 170.0]})
+    assert api.get("/analyze/frequency/windows/w", params={"k": 1}).json()["result"] == [1]
+    late = api.get("/analyze/frequency/windows/w", params={"k": 3, "now": 195.0}).json()
+    assert sorted((c["value"], c["count"]) for c in late["counts"]) == [(1, 1), (3, 1)]
+    api.delete("/analyze/frequency/windows/w")
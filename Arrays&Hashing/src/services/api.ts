@@ -31,6 +31,13 @@ export interface AnalysisResponse {
   visualization_data?: Record<string, any>;
 }
 
+export type StreamFrame =
+  | { type: 'meta'; algorithm: string; complexity: { time: string; space: string }; explanation: string }
+  | { type: 'result'; result: any }
+  | { type: 'step'; index: number; text: string }
+  | { type: 'visualization'; data: Record<string, any> }
+  | { type: 'done'; total_steps: number };
+
 export interface AlgorithmMapping {
   pattern: string;
   features: string[];
@@ -159,6 +166,45 @@ class ApiService {
     });
   }
 
+  // Streaming Analysis - frames arrive as NDJSON so rendering can start on the first step
+  async streamAnalysis(
+    algorithm: string,
+    data: any,
+    onFrame: (frame: StreamFrame) => void
+  ): Promise<void> {
+    const response = await fetch(`${this.baseUrl}/analyze/${algorithm}/stream?format=ndjson`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(data),
+    });
+
+    if (!response.ok || !response.body) {
+      const errorData = await response.json().catch(() => ({}));
+      throw new Error(
+        errorData.detail ||
+        `HTTP ${response.status}: ${response.statusText}`
+      );
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop() ?? '';
+      for (const line of lines) {
+        if (line.trim()) onFrame(JSON.parse(line));
+      }
+    }
+
+    if (buffer.trim()) onFrame(JSON.parse(buffer));
+  }
+
   // Utility Methods
   async getAlgorithmMapping(): Promise<{ patterns: AlgorithmMapping[] }> {
     return this.makeRequest<{ patterns: AlgorithmMapping[] }>('/algorithms/mapping');
@@ -188,7 +234,7 @@ class ApiService {
 export const apiService = new ApiService();
 
 // Export types for external use
-export type { AnalysisResponse, NumericAnalysisRequest, AnagramRequest, AlgorithmMapping };
+export type { AnalysisResponse, NumericAnalysisRequest, AnagramRequest, AlgorithmMapping, StreamFrame };
 
 // Development/Testing utilities
 export const createMockApiService = (baseUrl?: string) => {